@@ -0,0 +1,56 @@
+# benchmarks/bench_bulk_ingestion.py
+# Сравнение последовательной и параллельной (процессы) загрузки папки с Excel-файлами:
+#   python benchmarks/bench_bulk_ingestion.py --files 16 --rows 5000 --workers 4
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from ingestion import discover_files, load_files
+
+
+def make_files(directory, files, rows):
+    rng = np.random.default_rng(42)
+    for i in range(files):
+        pd.DataFrame({
+            'id': np.arange(rows) + i * rows,
+            'age': rng.integers(20, 65, rows),
+            'salary': rng.normal(60000, 15000, rows).round(2),
+            'experience': rng.integers(0, 40, rows),
+            'projects': rng.integers(0, 12, rows),
+            'department': rng.choice(['HR', 'IT', 'Sales', 'Finance', 'Marketing'], rows)
+        }).to_excel(os.path.join(directory, f'part_{i:03d}.xlsx'), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=16)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as directory:
+        make_files(directory, args.files, args.rows)
+        paths = discover_files(directory, ['*.xlsx'])
+
+        timings = {}
+        for name, workers in [('последовательно', 1), (f'{args.workers} процессов', args.workers)]:
+            start_time = time.perf_counter()
+            df, _ = load_files(paths, schema='employees', max_workers=workers, use_cache=False)
+            timings[name] = time.perf_counter() - start_time
+            print(f"{name:>20}: {timings[name]:.2f} с, {len(df)} строк")
+
+        sequential, parallel = timings.values()
+        print(f"{'ускорение':>20}: x{sequential / parallel:.2f}")
+
+
+if __name__ == "__main__":
+    main()
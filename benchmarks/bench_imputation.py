@@ -0,0 +1,55 @@
+# benchmarks/bench_imputation.py
+# Заполнение пропусков: KNN по полным строкам против KNNImputer по всей таблице:
+#   python benchmarks/bench_imputation.py --rows 100000 1000000 --missing 0.05
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sklearn.impute import KNNImputer
+from imputation import impute_missing
+
+
+def make_frame(rows, missing, seed=42):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'age': rng.integers(22, 65, rows).astype('float64'),
+        'experience': rng.integers(0, 40, rows).astype('float64'),
+        'salary': rng.normal(60000, 15000, rows),
+        'projects': rng.integers(0, 20, rows).astype('float64')
+    })
+    return df.mask(rng.random(df.shape) < missing)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--missing', type=float, default=0.05)
+    parser.add_argument('--n-jobs', type=int, default=None)
+    parser.add_argument('--baseline-max-rows', type=int, default=20_000,
+                        help="KNNImputer квадратичен по числу строк, для больших таблиц он пропускается")
+    args = parser.parse_args()
+    logger.remove()
+
+    for rows in args.rows:
+        df = make_frame(rows, args.missing)
+        incomplete = int(df.isnull().any(axis=1).sum())
+
+        start_time = time.perf_counter()
+        result = impute_missing(df.copy(), n_jobs=args.n_jobs)
+        elapsed = time.perf_counter() - start_time
+        print(f"{rows} строк ({incomplete} с пропусками): {elapsed:.2f} с, осталось пропусков: {int(result.isnull().sum().sum())}")
+
+        if rows <= args.baseline_max_rows:
+            start_time = time.perf_counter()
+            KNNImputer(n_neighbors=5).fit_transform(df)
+            print(f"  KNNImputer: {time.perf_counter() - start_time:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/bench_parallel_cleaning.py
+# Очистка широкой таблицы в одном процессе и группами колонок в пуле:
+#   python benchmarks/bench_parallel_cleaning.py --rows 200000 --cols 200 --workers 1 2 4 8
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import APP_SETTINGS
+from data_loader import normalize_data, detect_outliers_iqr, detect_outliers_zscore
+from imputation import impute_missing
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--cols', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    logger.remove()
+
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(rng.normal(size=(args.rows, args.cols)), columns=[f"col{i}" for i in range(args.cols)])
+    df = df.mask(rng.random(df.shape) < 0.05)
+    strategies = {col: 'median' for col in df.columns}
+    APP_SETTINGS['parallel_min_cells'] = 0
+
+    print(f"{args.rows} x {args.cols}, ядер: {os.cpu_count()}")
+    for workers in args.workers:
+        APP_SETTINGS['max_workers'] = workers
+        timings = {}
+        for name, step in [
+            ('fill', lambda frame: impute_missing(frame, strategies)),
+            ('minmax', normalize_data),
+            ('iqr', lambda frame: detect_outliers_iqr(frame, method='exact')),
+            ('zscore', detect_outliers_zscore)
+        ]:
+            start_time = time.perf_counter()
+            step(df.copy())
+            timings[name] = time.perf_counter() - start_time
+        print(f"процессов: {workers}  " + "  ".join(f"{name}: {seconds:.2f} с" for name, seconds in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# benchmarks/bench_quantile_sketch.py
+# Расхождение IQR-выбросов по KLL-скетчам с точным методом:
+#   python benchmarks/bench_quantile_sketch.py --rows 1000000 --chunksize 100000
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from sketches import compare_outlier_methods
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'normal': rng.normal(60000, 15000, args.rows),
+        'lognormal': rng.lognormal(10, 1, args.rows),
+        'integer': rng.integers(0, 40, args.rows).astype('float64'),
+        'heavy_tail': rng.standard_t(2, args.rows)
+    })
+
+    pd.set_option('display.width', 200)
+    for epsilon in [0.05, 0.01, 0.005, 0.001]:
+        start_time = time.perf_counter()
+        comparison = compare_outlier_methods(df, epsilon=epsilon, chunksize=args.chunksize)
+        elapsed = time.perf_counter() - start_time
+        print(f"\nepsilon={epsilon} ({elapsed:.2f} с, включая точный расчет)")
+        print(comparison[['exact_outliers', 'sketch_outliers', 'difference', 'relative_difference']])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# benchmarks/bench_report_writer.py
+# Запись листа "Данные": pandas.to_excel против потоковой записи xlsxwriter:
+#   python benchmarks/bench_report_writer.py --rows 200000 --cols 12
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from report_writer import write_report
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--cols', type=int, default=12)
+    parser.add_argument('--skip-pandas', action='store_true')
+    args = parser.parse_args()
+    logger.remove()
+
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(rng.normal(size=(args.rows, args.cols)), columns=[f"col{i}" for i in range(args.cols)])
+    df['department'] = rng.choice(['IT', 'HR', 'Finance'], args.rows)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if not args.skip_pandas:
+            start_time = time.perf_counter()
+            df.to_excel(os.path.join(directory, 'pandas.xlsx'), sheet_name='Данные', index=False)
+            elapsed = time.perf_counter() - start_time
+            print(f"pandas.to_excel: {elapsed:.1f} с, {args.rows / elapsed:.0f} строк/с")
+
+        stats = write_report(df, path=os.path.join(directory, 'stream.xlsx'))
+        print(f"xlsxwriter constant_memory: {stats['seconds']:.1f} с, {stats['rows_per_sec']:.0f} строк/с")
+
+        stats = write_report(df, path=os.path.join(directory, 'sidecar.xlsx'), sidecar='parquet')
+        print(f"parquet sidecar: {stats['seconds']:.1f} с, {stats['rows_per_sec']:.0f} строк/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_segments.py
+# Метрики по сегментам: отдельный groupby на каждую метрику и агрегат против
+# одного прохода по кодам групп и повторного запуска с кэшем частей:
+#   python benchmarks/bench_segments.py --rows 2000000
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import SEGMENT_CONFIG
+from segments import analyze_segments, add_bands
+
+
+def naive_segments(df, segments, metrics):
+    banded = add_bands(df, SEGMENT_CONFIG['bands'])
+    result = {}
+    for name, columns in segments.items():
+        table = {}
+        for metric in metrics:
+            for stat in ['count', 'mean', 'std', 'min', 'max']:
+                table[f'{metric}_{stat}'] = banded.groupby(columns, observed=True)[metric].agg(stat)
+        result[name] = pd.DataFrame(table)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--partition-rows', type=int, default=SEGMENT_CONFIG['partition_rows'])
+    args = parser.parse_args()
+    logger.remove()
+
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'age': rng.integers(18, 65, args.rows).astype('int32'),
+        'salary': rng.normal(50000, 15000, args.rows).astype('float32'),
+        'experience': rng.integers(0, 40, args.rows).astype('int32'),
+        'projects': rng.poisson(5, args.rows).astype('int32'),
+        'department': pd.Categorical(rng.choice(['IT', 'HR', 'Finance', 'Sales', 'Marketing'], args.rows)),
+        'region': pd.Categorical(rng.choice(['North', 'South', 'East', 'West'], args.rows)),
+        'education': pd.Categorical(rng.choice(['High School', 'Bachelor', 'Master', 'PhD'], args.rows))
+    })
+    segments = SEGMENT_CONFIG['segments']
+    metrics = SEGMENT_CONFIG['metrics']
+
+    start_time = time.perf_counter()
+    naive_segments(df, segments, metrics)
+    print(f"groupby на каждую метрику: {time.perf_counter() - start_time:.2f} с")
+
+    start_time = time.perf_counter()
+    analyze_segments(df, partition_rows=args.partition_rows, use_cache=False)
+    print(f"один проход по кодам групп: {time.perf_counter() - start_time:.2f} с")
+
+    with tempfile.TemporaryDirectory() as directory:
+        analyze_segments(df, partition_rows=args.partition_rows, directory=directory)
+        grown = pd.concat([df, df.iloc[:args.partition_rows // 10]], ignore_index=True)
+        start_time = time.perf_counter()
+        analyze_segments(grown, partition_rows=args.partition_rows, directory=directory)
+        print(f"повторный запуск с кэшем (+{args.partition_rows // 10} строк): {time.perf_counter() - start_time:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
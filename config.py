@@ -8,6 +8,13 @@ PATHS = {
     'models': 'models/'
 }
 
+# Настройки кэша Excel-файлов (Arrow IPC)
+CACHE_CONFIG = {
+    'excel_dir': 'data/cache/excel/',
+    'max_size_mb': 512,
+    'compression': 'lz4'
+}
+
 
 
 # Конфигурация базы данных PostgreSQL
@@ -17,7 +24,12 @@ DB_CONFIG = {
     'port': 5432,
     'user': 'your_username',
     'password': 'your_password',
-    'database': 'your_database'
+    'database': 'your_database',
+    'schema': 'your_schema',
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800
 }
 
 # Конфигурация API
@@ -34,6 +46,15 @@ API_CONFIG = {
     'params': {
         'limit': 10, 
         'offset': 0
+    },
+    'pagination': {
+        'limit_param': 'limit',
+        'offset_param': 'offset',
+        'max_concurrency': 4,
+        'max_pages': 1000,
+        'max_retries': 5,
+        'backoff': 0.5,
+        'timeout': 10
     }
 }
 
@@ -63,5 +84,142 @@ EMAIL_CONFIG = {
 APP_SETTINGS = {
     'debug_mode': True,
     'max_workers': 4,
-    'report_frequency': 'daily'
+    # Параллельная очистка по группам колонок (parallel.py) включается при
+    # max_workers > 1 для таблиц не меньше parallel_min_cells значений
+    'parallel_min_cells': 5_000_000,
+    'report_frequency': 'daily',
+    'input_patterns': ['*.csv', '*.xlsx']
+}
+
+# Настройки валидации: квантили для IQR считаются точно ('exact') или
+# по объединяемым KLL-скетчам ('sketch') с ошибкой ранга quantile_epsilon
+VALIDATION_CONFIG = {
+    'zscore_threshold': 3,
+    'quantile_method': 'exact',
+    'quantile_epsilon': 0.005
+}
+
+# Заполнение пропусков (см. imputation.py): стратегии по умолчанию для
+# числовых и категориальных колонок и переопределения для отдельных колонок
+# ('knn', 'median', 'mean', 'mode' или ('constant', значение))
+IMPUTATION_CONFIG = {
+    'numeric': 'knn',
+    'categorical': 'mode',
+    'columns': {},
+    'n_neighbors': 5,
+    'chunksize': 50_000,
+    # Полные строки, которые CleaningPipeline сохраняет для KNN на новых данных
+    'reference_rows': 100_000
+}
+
+# Кодирование категориальных колонок по числу уникальных значений (см. encoding.py):
+# до dense_max_categories - обычный one-hot, до sparse_max_categories - разреженный
+# one-hot, выше - high_cardinality ('hash' с шириной hash_width или 'codes').
+# В 'columns' стратегию можно задать для отдельной колонки
+ENCODING_CONFIG = {
+    'dense_max_categories': 50,
+    'sparse_max_categories': 1000,
+    'high_cardinality': 'hash',
+    'hash_width': 1024,
+    'columns': {}
+}
+
+# Отпечатки строк для поиска дубликатов между чанками и запусками (см. dedup.py);
+# key_columns=None - сравниваются строки целиком
+DEDUP_CONFIG = {
+    'directory': 'data/output/fingerprints/',
+    'key_columns': None
+}
+
+# Правила качества данных по наборам (см. rules.py). Типы: range (min/max),
+# not_null, unique (колонка или список колонок), allowed (values), regex
+# (pattern) и expression - выражение DataFrame.eval по нескольким колонкам
+RULES = {
+    'employees': [
+        {'type': 'not_null', 'column': 'id'},
+        {'type': 'unique', 'column': 'id'},
+        {'type': 'range', 'column': 'age', 'min': 18, 'max': 75},
+        {'type': 'range', 'column': 'experience', 'min': 0, 'max': 60},
+        {'type': 'range', 'column': 'salary', 'min': 0},
+        {'type': 'range', 'column': 'projects', 'min': 0},
+        {'type': 'allowed', 'column': 'gender', 'values': ['Male', 'Female']},
+        {'type': 'allowed', 'column': 'education', 'values': ['High School', 'Bachelor', 'Master', 'PhD']},
+        {'name': 'experience_vs_age', 'type': 'expression', 'expr': 'experience <= age - 14'}
+    ]
 }
+
+# Гистограммы распределений (см. plots.py): KDE считается по выборке
+# из kde_sample значений в kde_points точках
+VISUALIZATION_CONFIG = {
+    'max_bins': 100,
+    'kde_sample': 10_000,
+    'kde_points': 200
+}
+
+# Итоговый Excel-отчет (см. report_writer.py): данные сверх rows_per_sheet
+# строк переносятся на следующие листы; sidecar ('parquet' или 'csv') пишет
+# данные в сжатый файл рядом с отчетом, а в книге остается ссылка на него
+REPORT_CONFIG = {
+    'path': 'reports/final_report.xlsx',
+    'rows_per_sheet': 1_048_575,
+    'sidecar': None
+}
+
+# Аналитика по сегментам (см. segments.py): сегмент - список колонок-категорий,
+# bands задают интервальные категории из числовых колонок. Агрегаты метрик
+# считаются по частям из partition_rows строк и кэшируются в directory
+SEGMENT_CONFIG = {
+    'metrics': ['age', 'salary', 'experience', 'projects'],
+    'segments': {
+        'department': ['department'],
+        'region': ['region'],
+        'education': ['education'],
+        'tenure_band': ['tenure_band'],
+        'department_tenure': ['department', 'tenure_band']
+    },
+    'bands': {
+        'tenure_band': {
+            'column': 'experience',
+            'bins': [0, 2, 5, 10, 20, float('inf')],
+            'labels': ['0-2', '2-5', '5-10', '10-20', '20+']
+        }
+    },
+    'partition_rows': 500_000,
+    'directory': 'data/output/segments/'
+}
+
+# Схемы данных по источникам (см. schemas.py): компактные типы при загрузке.
+# Типы колонок: numpy-типы (int32, float32, ...), category, datetime;
+# 'auto' ужимает остальные колонки автоматически
+SCHEMAS = {
+    'employees': {
+        'columns': {
+            'id': 'int32',
+            'age': 'int32',
+            'salary': 'float32',
+            'experience': 'int32',
+            'projects': 'int32',
+            'department': 'category',
+            'education': 'category',
+            'gender': 'category'
+        },
+        'auto': True
+    }
+}
+
+# Источники данных, загружаемые параллельно (см. ingestion.py)
+SOURCES = [
+    {
+        'name': 'input_files',
+        'type': 'directory',
+        'path': PATHS['data_input'],
+        'schema': 'employees'
+    },
+    {
+        'name': 'api_users',
+        'type': 'api',
+        'url': API_CONFIG['base_url'] + API_CONFIG['endpoints']['data'],
+        'headers': API_CONFIG['headers'],
+        'params': API_CONFIG['params']
+    }
+]
@@ -11,14 +11,42 @@ class ExcelHandler:
         self.workbook = None
         self.dataframe = None
 
-    def read_excel(self):
+    def iter_rows(self, sheet_name=0, chunksize=10_000):
+        # read_only: строки читаются потоком, полная модель ячеек не строится
+        wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
         try:
-            self.dataframe = pd.read_excel(self.file_path)
+            ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+
+            buffer = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                buffer.append(row)
+                if len(buffer) == chunksize:
+                    yield pd.DataFrame.from_records(buffer, columns=header)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame.from_records(buffer, columns=header)
+        finally:
+            wb.close()
+
+    def read_excel(self, sheet_name=0, chunksize=10_000):
+        try:
+            chunks = list(self.iter_rows(sheet_name, chunksize))
+            self.dataframe = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
             return self.dataframe
         except Exception as e:
             print(f"Ошибка чтения файла: {e}")
             return None
 
+    def read_sheets(self, sheet_names=None, chunksize=10_000):
+        sheet_names = sheet_names or self.get_sheet_names()
+        return {name: self.read_excel(name, chunksize) for name in sheet_names}
+
     def write_excel(self, df, sheet_name='Sheet1'):
         try:
             with pd.ExcelWriter(self.file_path, engine='openpyxl') as writer:
@@ -42,8 +70,10 @@ class ExcelHandler:
 
     def get_sheet_names(self):
         try:
-            self.workbook = openpyxl.load_workbook(self.file_path)
-            return self.workbook.sheetnames
+            wb = openpyxl.load_workbook(self.file_path, read_only=True)
+            sheet_names = wb.sheetnames
+            wb.close()
+            return sheet_names
         except Exception as e:
             print(f"Ошибка получения названий листов: {e}")
             return []
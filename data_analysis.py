@@ -1,10 +1,10 @@
 from loguru import logger
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import os
+from config import PATHS
+from plots import render_histograms
+from report_writer import write_report
 
-def analyze_data(df):
+def analyze_data(df, stats=None):
     try:
         required_columns = ['age', 'salary', 'experience', 'projects']
         missing_columns = [col for col in required_columns if col not in df.columns]
@@ -13,6 +13,10 @@ def analyze_data(df):
             logger.warning(f"Отсутствуют необходимые колонки: {missing_columns}")
             return {}
 
+        # Накопленные статистики (RunningStats) заменяют проход по всей истории
+        if stats is not None:
+            return analysis_from_stats(df, stats)
+
         analysis = {
             'basic_stats': df.describe(),
             'correlations': df.corr(),
@@ -33,27 +37,40 @@ def analyze_data(df):
         logger.error(f"Ошибка при анализе данных: {str(e)}")
         return {}
 
-def visualize_data(df):
-    try
+def analysis_from_stats(df, stats):
+    described = [col for col in stats.columns if not pd.api.types.is_bool_dtype(df[col])]
+    other_columns = [col for col in df.columns if col not in stats.columns]
+
+    missing = stats.missing()
+    if other_columns:
+        missing = pd.concat([missing, df[other_columns].isnull().sum()])
+
+    analysis = {
+        'basic_stats': stats.describe(described),
+        'correlations': stats.corr(),
+        'missing_values': missing.reindex(df.columns)
+    }
+
+    # Медиана берется из скетча квантилей и является приближенной
+    if 'salary' in analysis['basic_stats'].columns:
+        salary = analysis['basic_stats']['salary']
+        analysis['salary_stats'] = {
+            'mean_salary': salary['mean'],
+            'median_salary': salary['50%'],
+            'max_salary': salary['max'],
+            'min_salary': salary['min']
+        }
+
+    return analysis
+
+def visualize_data(df, directory=None, use_cache=True):
+    try:
         if df.empty:
             logger.warning("Данные для визуализации отсутствуют")
             return
 
-        if not os.path.exists('reports/visualizations'):
-            os.makedirs('reports/visualizations')
-
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
-
-        for col in numeric_cols:
-            try:
-                plt.figure(figsize=(10, 6))
-                sns.histplot(df[col], kde=True)
-                plt.title(f'Распределение {col}')
-                plt.savefig(f'reports/visualizations/{col}_distribution.png')
-                plt.close()
-
-            except Exception as e:
-                logger.warning(f"Ошибка при визуализации {col}: {str(e)}")
+        directory = directory or PATHS['reports_visualizations']
+        render_histograms(df, directory, use_cache=use_cache)
 
         return True
 
@@ -61,26 +78,27 @@ def visualize_data(df):
         logger.error(f"Общая ошибка при визуализации: {str(e)}")
         return False
 
-def generate_report(df, analysis_results):
+def generate_report(df, analysis_results, path=None, sidecar=None):
     try:
         if df.empty or not analysis_results:
             logger.warning("Нет данных для генерации отчета")
             return
 
-        if not os.path.exists('reports'):
-            os.makedirs('reports')
+        sheets = {}
+        if 'basic_stats' in analysis_results:
+            sheets['Статистика'] = analysis_results['basic_stats']
 
-        with pd.ExcelWriter('reports/final_report.xlsx') as writer:
-            df.to_excel(writer, sheet_name='Данные', index=False)
+        if 'correlations' in analysis_results:
+            sheets['Корреляции'] = analysis_results['correlations']
 
-            if 'basic_stats' in analysis_results:
-                analysis_results['basic_stats'].to_excel(writer, sheet_name='Статистика')
+        if 'salary_stats' in analysis_results:
+            sheets['Зарплаты'] = pd.DataFrame(analysis_results['salary_stats'], index=[0]).T
 
-            if 'correlations' in analysis_results:
-                analysis_results['correlations'].to_excel(writer, sheet_name='Корреляции')
+        # Метрики по сегментам (segments.analyze_segments) - отдельный лист на сегмент
+        for name, table in analysis_results.get('segments', {}).items():
+            sheets[f'Сегмент {name}'] = table
 
-            if 'salary_stats' in analysis_results:
-                pd.DataFrame(analysis_results['salary_stats'], index=[0]).T.to_excel(writer, sheet_name='Зарплаты')
+        write_report(df, sheets, path=path, sidecar=sidecar)
 
         logger.info("Отчет успешно сгенерирован")
         return True
@@ -3,44 +3,77 @@ import numpy as np
 import sqlalchemy
 import requests
 import os
-from sklearn.impute import KNNImputer
+import threading
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import openpyxl
 from sklearn.preprocessing import MinMaxScaler, StandardScaler, LabelEncoder
 from loguru import logger
-
-def detect_outliers_iqr(df, columns=None):
+from config import DB_CONFIG, API_CONFIG, APP_SETTINGS, VALIDATION_CONFIG, IMPUTATION_CONFIG
+from excel_cache import get_excel_cache
+from schemas import apply_schema, csv_options, log_memory_savings
+from profiling import profile_numeric
+from sketches import KLLSketch, build_sketches, iqr_bounds
+from outliers import OutlierReport
+from imputation import impute_missing, resolve_strategies, knn_impute, fill_value
+from encoding import choose_encodings, encode_features, sparse_columns
+from dedup import Deduplicator
+from parallel import use_parallel, SharedBlock, run_column_groups, float_dtype
+from memory import MemoryTracker
+from rules import RuleSet, validate_rules
+
+def detect_outliers_iqr(df, columns=None, method=None, epsilon=None):
     if columns is None:
-        columns = df.select_dtypes(include=['float64', 'int64']).columns
+        columns = df.select_dtypes(include=[np.number]).columns
+    method = method or VALIDATION_CONFIG['quantile_method']
 
-    outliers = {}
-    for col in columns:
-        q1 = df[col].quantile(0.25)
-        q3 = df[col].quantile(0.75)
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
+    if method != 'sketch' and use_parallel(df, columns):
+        with SharedBlock(df, columns) as block:
+            positions = dict(zip(block.columns, run_column_groups(block, 'iqr')))
+        return OutlierReport(df, 'iqr', positions)
 
-        outliers[col] = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
+    if method == 'sketch':
+        bounds = {col: iqr_bounds(sketch) for col, sketch in build_sketches(df, columns, epsilon).items()}
+    else:
+        profile = profile_numeric(df, columns)
+        bounds = {col: (profile.loc[col, 'iqr_lower'], profile.loc[col, 'iqr_upper']) for col in columns}
 
-    return outliers
+    positions = {}
+    for col in columns:
+        lower_bound, upper_bound = bounds[col]
+        values = df[col].to_numpy(dtype='float64')
+        positions[col] = np.flatnonzero((values < lower_bound) | (values > upper_bound))
+
+    return OutlierReport(df, 'iqr', positions)
 
 def detect_outliers_zscore(df, columns=None, threshold=3):
     if columns is None:
-        columns = df.select_dtypes(include=['float64', 'int64']).columns
+        columns = df.select_dtypes(include=[np.number]).columns
+
+    if use_parallel(df, columns):
+        with SharedBlock(df, columns) as block:
+            results = run_column_groups(block, 'zscore', threshold=threshold)
+        positions = {col: result[0] for col, result in zip(columns, results)}
+        scores = {col: result[1] for col, result in zip(columns, results) if result[1] is not None}
+        return OutlierReport(df, 'zscore', positions, scores)
 
-    outliers = {}
+    profile = profile_numeric(df, columns, threshold)
+
+    positions, scores = {}, {}
     for col in columns:
-        if df[col].std() == 0:
+        std = profile.loc[col, 'std']
+        if std == 0:
             logger.warning(f"Колонка {col} имеет нулевое стандартное отклонение")
-            outliers[col] = pd.DataFrame()
+            positions[col] = np.empty(0, dtype=np.int64)
             continue
 
-        z_scores = (df[col] - df[col].mean()) / df[col].std()
-
-        outliers[col] = df[abs(z_scores) > threshold]
+        z_scores = (df[col].to_numpy(dtype='float64') - profile.loc[col, 'mean']) / std
+        flagged = np.abs(z_scores) > threshold
 
-        outliers[col]['z_score'] = z_scores[abs(z_scores) > threshold]
+        positions[col] = np.flatnonzero(flagged)
+        scores[col] = z_scores[flagged]
 
-    return outliers
+    return OutlierReport(df, 'zscore', positions, scores)
 
 
 
@@ -51,7 +84,7 @@ def validate_data(df):
 
         type_info = {}
         for col in df.columns:
-            if df[col].dtype in ['float64', 'int64']:
+            if pd.api.types.is_numeric_dtype(df[col]):
                 type_info[col] = 'числовой'
             elif df[col].dtype == 'object':
                 type_info[col] = 'строковый'
@@ -73,14 +106,11 @@ def validate_data(df):
                     logger.warning(f"Колонка {col}: {count} пропусков")
 
         logger.info("Начинаем поиск выбросов")
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        profile = profile_numeric(df)
 
-        iqr_outliers = detect_outliers_iqr(df, numeric_cols)
-        zscore_outliers = detect_outliers_zscore(df, numeric_cols)
-
-        for col in numeric_cols:
-            iqr_count = len(iqr_outliers[col])
-            zscore_count = len(zscore_outliers[col])
+        for col in profile.index:
+            iqr_count = int(profile.loc[col, 'iqr_outliers'])
+            zscore_count = int(profile.loc[col, 'zscore_outliers'])
 
             if iqr_count > 0:
                 logger.warning(f"Колонка {col}: {iqr_count} выбросов по IQR")
@@ -94,35 +124,23 @@ def validate_data(df):
         logger.error(f"Ошибка при валидации данных: {str(e)}")
         return None
 
-def handle_missing_values(df):
+def handle_missing_values(df, strategies=None):
     try:
         missing_values = df.isnull().sum()
         logger.info(f"Пропущенные значения:\n{missing_values}")
 
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-
-        if not numeric_cols.empty:
-            df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
-
-        if not categorical_cols.empty:
-            df[categorical_cols] = df[categorical_cols].fillna(df[categorical_cols].mode().iloc[0])
-
-        if not numeric_cols.empty:
-            imputer = KNNImputer(n_neighbors=5)
-            df[numeric_cols] = imputer.fit_transform(df[numeric_cols])
-
-        return df
+        return impute_missing(df, strategies)
     except Exception as e:
         logger.error(f"Ошибка при обработке пропусков: {str(e)}")
         return df
 
-def encode_categorical_features(df):
+def encode_categorical_features(df, encodings=None):
     try:
         categorical_cols = df.select_dtypes(include=['object', 'category']).columns
 
+        # Стратегия выбирается по числу уникальных значений (config.ENCODING_CONFIG)
         if not categorical_cols.empty:
-            df = pd.get_dummies(df, columns=categorical_cols, drop_first=True)
+            df = encode_features(df, choose_encodings(df, categorical_cols, encodings))
 
         return df
     except Exception as e:
@@ -132,11 +150,19 @@ def encode_categorical_features(df):
 # Функция нормализации данных
 def normalize_data(df):
     try:
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
-
-        if not numeric_cols.empty:
+        # Разреженные колонки (one-hot, хеши) уже в [0, 1] и не уплотняются
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.difference(sparse_columns(df), sort=False)
+
+        if use_parallel(df, numeric_cols):
+            with SharedBlock(df, numeric_cols) as block:
+                run_column_groups(block, 'minmax')
+                df = block.write_back(df)
+        elif not numeric_cols.empty:
+            # Вещественные колонки сохраняют свой тип, как и в параллельной ветке
+            dtypes = {col: float_dtype(df[col].dtype, np.float64) for col in numeric_cols}
             scaler = MinMaxScaler()
             df[numeric_cols] = scaler.fit_transform(df[numeric_cols])
+            df = df.astype(dtypes)
 
         return df
     except Exception as e:
@@ -144,7 +170,7 @@ def normalize_data(df):
         return df
 
 
-def clean_data(df):
+def clean_data(df, pipeline=None, low_memory=False):
     try:
         logger.info("Начинаем очистку данных")
 
@@ -152,6 +178,16 @@ def clean_data(df):
             logger.error("Данные пустые, очистка невозможна")
             return df
 
+        if low_memory:
+            df, _ = clean_data_low_memory(df)
+            return df
+
+        # Обученный CleaningPipeline только преобразует данные
+        if pipeline is not None:
+            df = pipeline.transform(df)
+            logger.info("Данные очищены обученным пайплайном")
+            return df
+
         df = handle_missing_values(df)
 
         df = encode_categorical_features(df)
@@ -165,33 +201,188 @@ def clean_data(df):
         return df
 
 
-def create_database_connection():
+def _float32_block(df, columns):
+    block = np.empty((len(df), len(columns)), dtype=np.float32, order='F')
+    for i, col in enumerate(columns):
+        values = df[col].to_numpy()
+        # Nullable-типы pandas отдают object-массив
+        if values.dtype == object:
+            values = df[col].to_numpy(dtype='float32', na_value=np.nan)
+        block[:, i] = values
+    return block
+
+
+def _impute_block(block, columns, strategies):
+    for i, col in enumerate(columns):
+        if strategies[col] == 'knn':
+            continue
+        column = block[:, i]
+        mask = np.isnan(column)
+        if mask.any():
+            # Одна маска на колонку: инвертируется на месте для выборки
+            # наблюдаемых значений и обратно для заполнения пропусков
+            np.logical_not(mask, out=mask)
+            observed = column[mask]
+            np.logical_not(mask, out=mask)
+            # Медиана сортирует уже сделанную копию на месте
+            if strategies[col] == 'median':
+                value = np.median(observed, overwrite_input=True) if len(observed) else np.nan
+            else:
+                value = fill_value(pd.Series(observed, copy=False), strategies[col])
+            # Копия освобождается до следующей колонки, иначе пик удваивается
+            del observed
+            column[mask] = value
+
+    knn = [i for i, col in enumerate(columns) if strategies[col] == 'knn']
+    if not knn:
+        return
+
+    values = block if len(knn) == len(columns) else block[:, knn]
+    # Индекс соседей строится по ограниченной выборке полных строк
+    complete = np.flatnonzero(~np.isnan(values).any(axis=1))
+    reference = None
+    if len(complete) > IMPUTATION_CONFIG['reference_rows']:
+        rng = np.random.default_rng(0)
+        reference = values[np.sort(rng.choice(complete, IMPUTATION_CONFIG['reference_rows'], replace=False))]
+
+    values = knn_impute(values, reference=reference)
+    if len(knn) != len(columns):
+        block[:, knn] = values
+
+
+def _minmax_inplace(column):
+    if np.isnan(column).all():
+        return
+    minimum = np.nanmin(column)
+    value_range = np.nanmax(column) - minimum
+    column -= minimum
+    column /= value_range if value_range != 0 else 1
+
+
+def clean_data_low_memory(df, strategies=None, encodings=None):
+    # Те же шаги, что в clean_data, но числовые колонки собираются в один
+    # float32-блок и обрабатываются на месте; результат оборачивает блок без копии
     try:
-        db_url = DB_CONFIG['url']
-
-        engine = sqlalchemy.create_engine(
-            db_url,
-            connect_args={
-                'client_encoding': 'utf8',
-                'options': '-c search_path=your_schema',
-                'application_name': 'data_loader'
-            }
+        logger.info("Начинаем очистку данных в режиме экономии памяти")
+
+        if df.empty:
+            logger.error("Данные пустые, очистка невозможна")
+            return df, None
+
+        numeric_cols = list(df.select_dtypes(include=[np.number]).columns)
+        categorical_cols = list(df.select_dtypes(include=['object', 'category']).columns)
+        other_cols = [col for col in df.columns if col not in numeric_cols and col not in categorical_cols]
+        strategies = resolve_strategies(df, strategies)
+
+        with pd.option_context('mode.copy_on_write', True), \
+                MemoryTracker(df.memory_usage(deep=True).sum()) as tracker:
+            with tracker.step('float32'):
+                block = _float32_block(df, numeric_cols)
+
+            with tracker.step('impute'):
+                _impute_block(block, numeric_cols, strategies)
+                categorical = pd.DataFrame({
+                    col: df[col].fillna(fill_value(df[col], strategies[col])) for col in categorical_cols
+                }, index=df.index)
+
+            with tracker.step('encode'):
+                encoded = encode_features(categorical, choose_encodings(categorical, categorical_cols, encodings))
+
+            with tracker.step('normalize'):
+                for i in range(block.shape[1]):
+                    _minmax_inplace(block[:, i])
+                codes = encoded.select_dtypes(include=[np.number]).columns.difference(sparse_columns(encoded), sort=False)
+                for col in codes:
+                    column = encoded[col].to_numpy(dtype='float32')
+                    _minmax_inplace(column)
+                    encoded[col] = column
+
+            with tracker.step('assemble'):
+                numeric = pd.DataFrame(block, columns=numeric_cols, index=df.index, copy=False)
+                result = pd.concat([numeric, df[other_cols], encoded], axis=1, copy=False)
+                order = [col for col in df.columns if col not in categorical_cols] + list(encoded.columns)
+                if list(result.columns) != order:
+                    result = result[order]
+
+        logger.info("Данные успешно очищены")
+        return result, tracker.report()
+    except Exception as e:
+        logger.error(f"Ошибка при очистке данных в режиме экономии памяти: {str(e)}")
+        return df, None
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def _engine_options(db_url):
+    url = sqlalchemy.engine.make_url(db_url)
+    options = {}
+
+    # SQLite в памяти использует SingletonThreadPool, параметры пула к нему неприменимы
+    if url.get_backend_name() != 'sqlite' or url.database not in (None, '', ':memory:'):
+        options.update(
+            pool_size=DB_CONFIG['pool_size'],
+            max_overflow=DB_CONFIG['max_overflow'],
+            pool_pre_ping=DB_CONFIG['pool_pre_ping'],
+            pool_recycle=DB_CONFIG['pool_recycle']
         )
-        logger.info("Подключение к БД успешно установлено")
+
+    if url.get_backend_name() == 'postgresql':
+        options['connect_args'] = {
+            'client_encoding': 'utf8',
+            'options': f"-c search_path={DB_CONFIG['schema']}",
+            'application_name': 'data_loader'
+        }
+
+    return options
+
+
+def create_database_connection(db_url=None):
+    try:
+        db_url = db_url or DB_CONFIG['url']
+
+        with _engines_lock:
+            engine = _engines.get(db_url)
+            if engine is None:
+                engine = sqlalchemy.create_engine(db_url, **_engine_options(db_url))
+                _engines[db_url] = engine
+                logger.info("Подключение к БД успешно установлено")
+
         return engine
     except Exception as e:
         logger.error(f"Ошибка подключения к БД: {e}")
         return None
 
 
-def load_sql(query):
+def dispose_engines():
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+def _stream_sql(engine, query, chunksize, params, schema):
+    # Серверный курсор: строки приходят порциями, а не всем результатом сразу
+    with engine.connect().execution_options(stream_results=True, max_row_buffer=chunksize) as connection:
+        for chunk in pd.read_sql(query, connection, params=params, chunksize=chunksize):
+            yield apply_schema(chunk, schema)
+
+
+def load_sql(query, chunksize=None, db_url=None, params=None, schema=None):
     try:
-        engine = create_database_connection()
+        engine = create_database_connection(db_url)
         if engine is None:
             raise Exception("Не удалось создать подключение к БД")
 
+        if chunksize:
+            logger.info(f"SQL-запрос выполняется в потоковом режиме по {chunksize} строк")
+            return _stream_sql(engine, query, chunksize, params, schema)
+
         logger.info("Выполняется SQL-запрос")
-        df = pd.read_sql(query, engine)
+        df = apply_schema(pd.read_sql(query, engine, params=params), schema)
+        if schema is not None:
+            log_memory_savings(df, 'SQL')
         logger.info("Данные успешно загружены из БД")
         return df
     except Exception as e:
@@ -199,20 +390,29 @@ def load_sql(query):
         return None
 
 
-def load_excel(file_path):
+def load_excel(file_path, use_cache=True, schema=None, chunksize=None, sheet_name=0):
     try:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Файл {file_path} не найден")
 
-        dtype = {
-            'id': int,
-            'age': int,
-            'salary': float,
-            'experience': int,
-            'projects': int
-        }
+        if chunksize:
+            logger.info(f"Excel-файл {file_path} открыт в потоковом режиме по {chunksize} строк")
+            return iter_excel_chunks(file_path, sheet_name, chunksize, schema)
+
+        if sheet_name != 0:
+            return load_excel_sheets(file_path, [sheet_name], schema=schema, max_workers=1)[sheet_name]
+
+        df = get_excel_cache().get(file_path) if use_cache else None
+
+        if df is None:
+            df = pd.read_excel(file_path)
+            if use_cache:
+                get_excel_cache().put(file_path, df)
+
+        if schema is not None:
+            df = apply_schema(df, schema)
+            log_memory_savings(df, file_path)
 
-        df = pd.read_excel(file_path)
         return df
 
     except FileNotFoundError as e:
@@ -223,7 +423,85 @@ def load_excel(file_path):
         return None
 
 
-def load_api(url, params=None, headers=None):
+def iter_excel_chunks(file_path, sheet_name=0, chunksize=10_000, schema=None):
+    # read_only режим openpyxl читает лист потоком строк, не строя модель всех ячеек
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Файл {file_path} не найден")
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [f'Unnamed: {i}' if col is None else col for i, col in enumerate(header)]
+
+        buffer = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            buffer.append(row)
+            if len(buffer) == chunksize:
+                yield apply_schema(pd.DataFrame.from_records(buffer, columns=columns), schema)
+                buffer = []
+
+        if buffer:
+            yield apply_schema(pd.DataFrame.from_records(buffer, columns=columns), schema)
+    finally:
+        workbook.close()
+
+
+def _read_sheet(file_path, sheet_name, chunksize, schema):
+    chunks = list(iter_excel_chunks(file_path, sheet_name, chunksize, schema))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+
+def get_sheet_names(file_path):
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def load_excel_sheets(file_path, sheet_names=None, chunksize=10_000, schema=None, max_workers=None):
+    try:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Файл {file_path} не найден")
+
+        sheet_names = sheet_names or get_sheet_names(file_path)
+        max_workers = min(max_workers or APP_SETTINGS['max_workers'], len(sheet_names))
+
+        # Каждый процесс открывает книгу сам и читает свой лист потоком
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                frames = executor.map(
+                    _read_sheet,
+                    [file_path] * len(sheet_names),
+                    sheet_names,
+                    [chunksize] * len(sheet_names),
+                    [schema] * len(sheet_names)
+                )
+                sheets = dict(zip(sheet_names, frames))
+        else:
+            sheets = {name: _read_sheet(file_path, name, chunksize, schema) for name in sheet_names}
+
+        logger.info(f"Из {file_path} загружено листов: {len(sheets)}")
+        return sheets
+
+    except FileNotFoundError as e:
+        logger.error(f"Ошибка при загрузке Excel-файла: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f"Ошибка при загрузке Excel-файла: {str(e)}")
+        return None
+
+
+def load_api(url, params=None, headers=None, schema=None):
     try:
         response = requests.get(
             url,
@@ -234,7 +512,7 @@ def load_api(url, params=None, headers=None):
         response.raise_for_status()
 
         data = response.json()
-        df = pd.json_normalize(data)
+        df = apply_schema(pd.json_normalize(data), schema)
         logger.info("Данные из API успешно загружены")
         return df
 
@@ -242,20 +520,132 @@ def load_api(url, params=None, headers=None):
         logger.error(f"Ошибка при загрузке из API: {str(e)}")
         return None
 
-def load_data(source_type, file_path=None, query=None, url=None):
+
+def _api_session(headers, max_connections):
+    # Одна сессия с пулом keep-alive соединений на все страницы
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def _retry_delay(response, backoff, attempt):
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return backoff * 2 ** attempt
+
+
+async def _fetch_page(session, semaphore, url, params, settings):
+    async with semaphore:
+        for attempt in range(settings['max_retries'] + 1):
+            response = None
+            try:
+                response = await asyncio.to_thread(session.get, url, params=params, timeout=settings['timeout'])
+                if response.status_code != 429 and response.status_code < 500:
+                    response.raise_for_status()
+                    return response.json()
+                error = f"HTTP {response.status_code}"
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = str(e)
+
+            if attempt == settings['max_retries']:
+                raise requests.exceptions.RetryError(f"{url} {params}: {error}")
+
+            delay = _retry_delay(response, settings['backoff'], attempt)
+            logger.warning(f"Повтор запроса к API через {delay:.2f} с ({error})")
+            await asyncio.sleep(delay)
+
+
+def _page_frame(payload, records_key):
+    records = (payload.get(records_key) or []) if records_key else payload
+    if isinstance(records, dict):
+        records = [records]
+    return pd.json_normalize(records), len(records)
+
+
+async def load_api_async(url, params=None, headers=None, records_key=None,
+                         cursor_param=None, cursor_key=None, **pagination):
+    settings = {**API_CONFIG['pagination'], **pagination}
+    params = dict(params or {})
+    frames = []
+
+    session = _api_session(headers, settings['max_concurrency'])
+    semaphore = asyncio.Semaphore(settings['max_concurrency'])
+    try:
+        if cursor_key:
+            # Курсорная пагинация последовательна: следующий курсор приходит в ответе
+            cursor = None
+            for _ in range(settings['max_pages']):
+                page_params = {**params, cursor_param or cursor_key: cursor} if cursor else params
+                payload = await _fetch_page(session, semaphore, url, page_params, settings)
+                frame, count = _page_frame(payload, records_key)
+                if count:
+                    frames.append(frame)
+                cursor = payload.get(cursor_key)
+                if not cursor or not count:
+                    break
+        else:
+            limit_param, offset_param = settings['limit_param'], settings['offset_param']
+            limit = int(params.get(limit_param, API_CONFIG['params']['limit']))
+            offset = int(params.get(offset_param, 0))
+            pages = 0
+
+            while pages < settings['max_pages']:
+                window = min(settings['max_concurrency'], settings['max_pages'] - pages)
+                tasks = [
+                    _fetch_page(session, semaphore, url,
+                                {**params, limit_param: limit, offset_param: offset + i * limit}, settings)
+                    for i in range(window)
+                ]
+                payloads = await asyncio.gather(*tasks)
+                pages += window
+                offset += window * limit
+
+                last_page = False
+                for payload in payloads:
+                    frame, count = _page_frame(payload, records_key)
+                    if count:
+                        frames.append(frame)
+                    if count < limit:
+                        last_page = True
+                        break
+                if last_page:
+                    break
+    finally:
+        session.close()
+
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def load_api_paginated(url, params=None, headers=None, schema=None, **kwargs):
+    try:
+        df = asyncio.run(load_api_async(url, params=params, headers=headers, **kwargs))
+        df = apply_schema(df, schema)
+        logger.info(f"Данные из API успешно загружены постранично: {len(df)} строк")
+        return df
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Ошибка при загрузке из API: {str(e)}")
+        return None
+
+def load_data(source_type, file_path=None, query=None, url=None, chunksize=None, schema=None):
     try:
         if source_type == 'csv':
-            return pd.read_csv(file_path, encoding='utf-8')
+            return load_csv(file_path, chunksize=chunksize, schema=schema)
         elif source_type == 'excel':
-            return load_excel(file_path)
+            return load_excel(file_path, schema=schema, chunksize=chunksize)
         elif source_type == 'sql':
             if query is None:
                 raise ValueError("Для SQL необходим SQL-запрос")
-            return load_sql(query)
+            return load_sql(query, chunksize=chunksize, schema=schema)
         elif source_type == 'api':
             if url is None:
                 raise ValueError("Для API необходим URL")
-            return load_api(url)
+            return load_api(url, schema=schema)
         else:
             logger.error("Неподдерживаемый тип источника данных")
             return None
@@ -263,20 +653,342 @@ def load_data(source_type, file_path=None, query=None, url=None):
         logger.error(f"Ошибка при загрузке данных: {str(e)}")
         return None
 
-def load_csv(file_path):
+def load_csv(file_path, chunksize=None, schema=None):
     try:
-        df = pd.read_csv(file_path, encoding='utf-8')
+        header = pd.read_csv(file_path, encoding='utf-8', nrows=0).columns if schema is not None else None
+        options = csv_options(schema, header)
+
+        if chunksize:
+            reader = pd.read_csv(file_path, encoding='utf-8', chunksize=chunksize, **options)
+            logger.info(f"CSV файл {file_path} открыт в потоковом режиме по {chunksize} строк")
+            if schema is not None:
+                return (apply_schema(chunk, schema) for chunk in reader)
+            return reader
+
+        df = apply_schema(pd.read_csv(file_path, encoding='utf-8', **options), schema)
+        if schema is not None:
+            log_memory_savings(df, file_path)
         logger.info(f"CSV файл {file_path} успешно загружен")
         return df
     except Exception as e:
         logger.error(f"Ошибка при загрузке CSV файла: {str(e)}")
         return None
 
+# Потоковая обработка CSV: валидация и очистка по чанкам с глобально
+# корректной статистикой
+
+def _chunk_source(source, chunksize):
+    if callable(source):
+        return source
+
+    def make_chunks():
+        reader = load_csv(source, chunksize=chunksize)
+        if reader is None:
+            raise ValueError(f"Не удалось открыть CSV файл {source}")
+        return reader
+
+    return make_chunks
+
+
+def _merge_moments(moments, values):
+    # Объединение (count, mean, M2) по формуле Чана
+    n_b = len(values)
+    if n_b == 0:
+        return moments
+
+    n_a, mean_a, m2_a = moments
+    mean_b = values.mean()
+    m2_b = ((values - mean_b) ** 2).sum()
+
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return n, mean_a + delta * n_b / n, m2_a + m2_b + delta ** 2 * n_a * n_b / n
+
+
+def _streaming_quantiles(iter_frames, stats, quantiles, bins=4096, max_values=1_000_000):
+    # Точные квантили (как Series.quantile) без загрузки колонки целиком:
+    # интервал с нужной порядковой статистикой сужается гистограммами,
+    # затем его значения собираются и сортируются
+    targets = {}
+    for col, (count, col_min, col_max) in stats.items():
+        if count == 0:
+            continue
+        for q in quantiles:
+            pos = (count - 1) * q
+            for rank in {int(np.floor(pos)), int(np.ceil(pos))}:
+                targets[(col, rank)] = {
+                    'lo': col_min, 'hi': col_max, 'closed': True,
+                    'below': 0, 'count': count, 'stuck': False, 'value': None
+                }
+
+    while True:
+        to_split, to_collect = [], []
+        for key, t in targets.items():
+            if t['value'] is not None:
+                continue
+            if t['lo'] == t['hi'] or (not t['closed'] and np.nextafter(t['lo'], np.inf) >= t['hi']):
+                t['value'] = t['lo']
+            elif t['count'] <= max_values or t['stuck']:
+                to_collect.append(key)
+            else:
+                to_split.append(key)
+
+        if not to_split and not to_collect:
+            break
+
+        edges = {key: np.linspace(targets[key]['lo'], targets[key]['hi'], bins + 1) for key in to_split}
+        hists = {key: np.zeros(bins, dtype=np.int64) for key in to_split}
+        collected = {key: [] for key in to_collect}
+        columns = {col for col, _ in to_split + to_collect}
+
+        for frame in iter_frames():
+            values_by_col = {col: frame[col].dropna().to_numpy(dtype='float64') for col in columns}
+            for key in to_split + to_collect:
+                t = targets[key]
+                values = values_by_col[key[0]]
+                upper = values <= t['hi'] if t['closed'] else values < t['hi']
+                values = values[(values >= t['lo']) & upper]
+
+                if key in hists:
+                    idx = np.searchsorted(edges[key], values, side='right') - 1
+                    hists[key] += np.bincount(idx.clip(0, bins - 1), minlength=bins)
+                else:
+                    collected[key].append(values)
+
+        for key in to_collect:
+            t = targets[key]
+            values = np.sort(np.concatenate(collected[key]))
+            t['value'] = values[key[1] - t['below']]
+
+        for key in to_split:
+            t = targets[key]
+            cumulative = np.cumsum(hists[key])
+            j = int(np.searchsorted(cumulative, key[1] - t['below'], side='right'))
+            interval = (edges[key][j], edges[key][j + 1], t['closed'] and j == bins - 1)
+
+            t['stuck'] = interval == (t['lo'], t['hi'], t['closed'])
+            t['below'] += int(cumulative[j - 1]) if j > 0 else 0
+            t['lo'], t['hi'], t['closed'] = interval
+            t['count'] = int(hists[key][j])
+
+    result = {}
+    for col, (count, _, _) in stats.items():
+        result[col] = {}
+        for q in quantiles:
+            if count == 0:
+                result[col][q] = np.nan
+                continue
+            pos = (count - 1) * q
+            lower = targets[(col, int(np.floor(pos)))]['value']
+            upper = targets[(col, int(np.ceil(pos)))]['value']
+            result[col][q] = lower + (upper - lower) * (pos - np.floor(pos))
+
+    return result
+
+
+def _iter_kept(make_chunks, keep_masks, columns):
+    for chunk, packed in zip(make_chunks(), keep_masks):
+        keep = np.unpackbits(packed, count=len(chunk)).astype(bool)
+        yield chunk.loc[keep, columns]
+
+
+def validate_data_chunked(source, chunksize=100_000, threshold=3, max_values=1_000_000,
+                          quantile_method=None, epsilon=None, deduplicator=None, rules=None):
+    try:
+        logger.info("Начинаем потоковую валидацию данных")
+        make_chunks = _chunk_source(source, chunksize)
+        quantile_method = quantile_method or VALIDATION_CONFIG['quantile_method']
+
+        # Переданный Deduplicator помнит строки прошлых запусков
+        deduplicator = deduplicator or Deduplicator()
+        keep_masks = []
+        rows, duplicates = 0, 0
+        missing, numeric_cols = None, None
+        moments, extremes = {}, {}
+
+        ruleset = None
+        for chunk in make_chunks():
+            if numeric_cols is None:
+                numeric_cols = list(chunk.select_dtypes(include=[np.number]).columns)
+                missing = pd.Series(0, index=chunk.columns)
+                if rules is not None:
+                    ruleset = RuleSet(rules, chunk.columns)
+                moments = {col: (0, 0.0, 0.0) for col in numeric_cols}
+                extremes = {col: (np.inf, -np.inf) for col in numeric_cols}
+                sketches = {col: KLLSketch(epsilon) for col in numeric_cols}
+
+            rows += len(chunk)
+            missing = missing.add(chunk.isnull().sum(), fill_value=0)
+            if ruleset is not None:
+                ruleset.update(chunk)
+
+            duplicated = deduplicator.mark(chunk)
+            duplicates += int(duplicated.sum())
+            keep_masks.append(np.packbits(~duplicated))
+
+            kept = chunk.loc[~duplicated, numeric_cols]
+            for col in numeric_cols:
+                values = kept[col].dropna().to_numpy(dtype='float64')
+                if len(values) == 0:
+                    continue
+                moments[col] = _merge_moments(moments[col], values)
+                extremes[col] = (min(extremes[col][0], values.min()), max(extremes[col][1], values.max()))
+                if quantile_method == 'sketch':
+                    sketches[col].update(values)
+
+        if numeric_cols is None:
+            logger.warning("CSV файл не содержит данных")
+            return None
+
+        # Скетчи готовы после первого прохода; точный метод сужает интервалы дополнительными проходами
+        if quantile_method == 'sketch':
+            bounds = {col: iqr_bounds(sketches[col]) for col in numeric_cols}
+        else:
+            stats = {col: (moments[col][0], *extremes[col]) for col in numeric_cols}
+            quartiles = _streaming_quantiles(
+                lambda: _iter_kept(make_chunks, keep_masks, numeric_cols),
+                stats, [0.25, 0.75], max_values=max_values
+            )
+
+            bounds = {}
+            for col in numeric_cols:
+                iqr = quartiles[col][0.75] - quartiles[col][0.25]
+                bounds[col] = (quartiles[col][0.25] - 1.5 * iqr, quartiles[col][0.75] + 1.5 * iqr)
+
+        iqr_outliers = {col: 0 for col in numeric_cols}
+        zscore_outliers = {col: 0 for col in numeric_cols}
+        for kept in _iter_kept(make_chunks, keep_masks, numeric_cols):
+            for col in numeric_cols:
+                values = kept[col]
+                lower_bound, upper_bound = bounds[col]
+                iqr_outliers[col] += int(((values < lower_bound) | (values > upper_bound)).sum())
+
+                count, mean, m2 = moments[col]
+                std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+                if std > 0:
+                    zscore_outliers[col] += int((abs((values - mean) / std) > threshold).sum())
+
+        report = {
+            'rows': rows,
+            'missing_values': int(missing.sum()),
+            'missing_by_column': {col: int(count) for col, count in missing.items() if count > 0},
+            'duplicates': duplicates,
+            'outliers': sum(iqr_outliers.values()),
+            'iqr_outliers': iqr_outliers,
+            'zscore_outliers': zscore_outliers,
+            'iqr_bounds': bounds
+        }
+
+        if duplicates > 0:
+            logger.warning(f"Обнаружено {duplicates} дубликатов")
+        if report['missing_values'] > 0:
+            logger.warning(f"Обнаружены пропуски: {report['missing_by_column']}")
+        for col in numeric_cols:
+            if iqr_outliers[col] > 0:
+                logger.warning(f"Колонка {col}: {iqr_outliers[col]} выбросов по IQR")
+            if zscore_outliers[col] > 0:
+                logger.warning(f"Колонка {col}: {zscore_outliers[col]} выбросов по Z-score")
+        if ruleset is not None:
+            report['rules'] = ruleset.report()
+            report['rules'].log()
+
+        logger.info(f"Потоковая валидация завершена: {rows} строк")
+        return report
+
+    except Exception as e:
+        logger.error(f"Ошибка при потоковой валидации данных: {str(e)}")
+        return None
+
+
+def _most_frequent(counts):
+    # при равенстве частот берется наименьшее значение, как в DataFrame.mode()
+    if counts.empty:
+        return np.nan
+    return min(counts[counts == counts.max()].index)
+
+
+def _clean_chunks(make_chunks, numeric_cols, categorical_cols, medians, modes, encodings, categories, minimums, ranges):
+    scale_cols = list(minimums.index)
+    for chunk in make_chunks():
+        if numeric_cols:
+            chunk[numeric_cols] = chunk[numeric_cols].fillna(medians)
+
+        # Те же стратегии кодирования, что и в clean_data: плотный one-hot
+        # только для колонок с небольшим числом значений
+        if categorical_cols:
+            chunk[categorical_cols] = chunk[categorical_cols].fillna(modes)
+            chunk = encode_features(chunk, encodings, categories)
+
+        if scale_cols:
+            chunk[scale_cols] = (chunk[scale_cols].astype('float64') - minimums) / ranges
+
+        yield chunk
+
+
+def clean_data_chunked(source, chunksize=100_000, max_values=1_000_000):
+    try:
+        logger.info("Начинаем потоковую очистку данных")
+        make_chunks = _chunk_source(source, chunksize)
+
+        numeric_cols, categorical_cols = None, None
+        moments, extremes, counts = {}, {}, {}
+
+        for chunk in make_chunks():
+            if numeric_cols is None:
+                numeric_cols = list(chunk.select_dtypes(include=[np.number]).columns)
+                categorical_cols = list(chunk.select_dtypes(include=['object', 'category']).columns)
+                moments = {col: (0, 0.0, 0.0) for col in numeric_cols}
+                extremes = {col: (np.inf, -np.inf) for col in numeric_cols}
+                counts = {col: pd.Series(dtype='int64') for col in categorical_cols}
+
+            for col in numeric_cols:
+                values = chunk[col].dropna().to_numpy(dtype='float64')
+                if len(values) == 0:
+                    continue
+                moments[col] = _merge_moments(moments[col], values)
+                extremes[col] = (min(extremes[col][0], values.min()), max(extremes[col][1], values.max()))
+
+            for col in categorical_cols:
+                counts[col] = counts[col].add(chunk[col].value_counts(), fill_value=0)
+
+        if numeric_cols is None:
+            logger.error("Данные пустые, очистка невозможна")
+            return None
+
+        stats = {col: (moments[col][0], *extremes[col]) for col in numeric_cols}
+        quantiles = _streaming_quantiles(
+            lambda: (chunk[numeric_cols] for chunk in make_chunks()),
+            stats, [0.5], max_values=max_values
+        )
+
+        medians = pd.Series({col: quantiles[col][0.5] for col in numeric_cols}, dtype='float64')
+        minimums = pd.Series({col: extremes[col][0] for col in numeric_cols}, dtype='float64')
+        ranges = pd.Series({col: extremes[col][1] - extremes[col][0] for col in numeric_cols}, dtype='float64')
+        ranges[ranges == 0] = 1.0
+
+        modes = pd.Series({col: _most_frequent(counts[col]) for col in categorical_cols}, dtype='object')
+        categories = {col: sorted(counts[col].index) for col in categorical_cols}
+        encodings = choose_encodings(None, categorical_cols, cardinalities={col: len(counts[col]) for col in categorical_cols})
+
+        # Коды категорий нормализуются вместе с числовыми колонками, как в normalize_data
+        for col, encoding in encodings.items():
+            if encoding == 'codes':
+                minimums[col] = 0.0
+                ranges[col] = max(len(categories[col]) - 1, 1)
+
+        logger.info("Параметры очистки рассчитаны по всему файлу")
+        return _clean_chunks(make_chunks, numeric_cols, categorical_cols, medians, modes, encodings, categories, minimums, ranges)
+
+    except Exception as e:
+        logger.error(f"Ошибка при потоковой очистке данных: {str(e)}")
+        return None
+
+
 import numpy as np
 from loguru import logger
 
 
-def validate_data(df):
+def validate_data(df, deduplicator=None, rules=None):
     try:
         report = {
             'missing_values': df.isnull().sum().sum(),
@@ -289,24 +1001,30 @@ def validate_data(df):
             df = df.drop_duplicates()
             report['duplicates'] = df.duplicated().sum()
 
+        # Строки, уже встречавшиеся в прошлых партиях и запусках
+        if deduplicator is not None:
+            seen_before = deduplicator.mark(df)
+            report['seen_before'] = int(seen_before.sum())
+            if report['seen_before'] > 0:
+                logger.warning(f"Обнаружено {report['seen_before']} ранее загруженных строк")
+                df = df[~seen_before]
+
         if report['missing_values'] > 0:
             logger.warning("Обнаружены пропуски!")
 
         for col in df.columns:
             if df[col].dtype == 'object':
                 logger.info(f"Колонка {col} содержит строковые данные")
-            elif df[col].dtype in ['int64', 'float64']:
+            elif pd.api.types.is_numeric_dtype(df[col]):
                 logger.info(f"Колонка {col} содержит числовые данные")
 
-        for col in df.select_dtypes(include=[np.number]).columns:
-            q1 = df[col].quantile(0.25)
-            q3 = df[col].quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
+        profile = profile_numeric(df)
+        report['outliers'] = int(profile['iqr_outliers'].sum())
+        report['profile'] = profile
 
-            outliers_count = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-            report['outliers'] += outliers_count
+        # Правила качества (config.RULES): сводка по правилам вместо построчных логов
+        if rules is not None:
+            report['rules'] = validate_rules(df, rules)
 
         return df, report
 
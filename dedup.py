@@ -0,0 +1,99 @@
+# dedup.py
+import os
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import DEDUP_CONFIG
+
+
+def row_fingerprints(df, key_columns=None):
+    if key_columns:
+        df = df[list(key_columns)]
+
+    # int64 и float64 хэшируются по-разному, а тип колонки зависит от пропусков
+    # и схемы, поэтому числа приводятся к float64
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if not numeric_cols.empty:
+        df = df.astype({col: 'float64' for col in numeric_cols})
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+class FingerprintSet:
+    # Отсортированный массив uint64: 8 байт на уникальную строку, поиск
+    # через searchsorted, на диске - обычный .npy
+    def __init__(self, path=None):
+        self.path = path
+        self.hashes = np.empty(0, dtype=np.uint64)
+        if path and os.path.exists(path):
+            self.hashes = np.load(path)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def contains(self, hashes):
+        if len(self.hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.searchsorted(self.hashes, hashes).clip(0, len(self.hashes) - 1)
+        return self.hashes[pos] == hashes
+
+    def mark_duplicates(self, hashes):
+        duplicated = pd.Series(hashes).duplicated().to_numpy()
+        duplicated |= self.contains(hashes)
+
+        new = np.sort(hashes[~duplicated])
+        if len(new) > 0:
+            # Слияние двух отсортированных массивов, stable-сортировка это учитывает
+            self.hashes = np.sort(np.concatenate([self.hashes, new]), kind='stable')
+        return duplicated
+
+    def discard(self, hashes):
+        if len(self.hashes) > 0 and len(hashes) > 0:
+            self.hashes = self.hashes[~np.isin(self.hashes, hashes)]
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp.npy'
+        np.save(tmp_path, self.hashes)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+
+class Deduplicator:
+    # Отпечатки строк (или только ключевых колонок) между чанками и запусками;
+    # без name набор живет только в памяти
+    def __init__(self, name=None, key_columns=None, directory=None):
+        self.key_columns = key_columns or DEDUP_CONFIG['key_columns']
+        path = None
+        if name:
+            path = os.path.join(directory or DEDUP_CONFIG['directory'], f"{name}.npy")
+        self.seen = FingerprintSet(path)
+
+    def __len__(self):
+        return len(self.seen)
+
+    def mark(self, df):
+        return self.seen.mark_duplicates(row_fingerprints(df, self.key_columns))
+
+    def discard(self, df):
+        # Строки, удаленные из накопленного набора, снова считаются новыми
+        self.seen.discard(row_fingerprints(df, self.key_columns))
+
+    def filter(self, df):
+        duplicated = self.mark(df)
+        if duplicated.any():
+            logger.info(f"Отброшено {int(duplicated.sum())} ранее встречавшихся строк")
+        return df[~duplicated]
+
+    def filter_chunks(self, chunks):
+        for chunk in chunks:
+            yield self.filter(chunk)
+
+    def save(self):
+        if self.seen.path:
+            self.seen.save()
+            logger.info(f"Сохранено {len(self.seen)} отпечатков строк в {self.seen.path}")
+
+    def reset(self):
+        self.seen.clear()
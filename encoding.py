@@ -0,0 +1,84 @@
+# encoding.py
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction import FeatureHasher
+from loguru import logger
+from config import ENCODING_CONFIG
+
+ENCODINGS = ('onehot', 'sparse', 'hash', 'codes')
+
+
+def sparse_columns(df):
+    return [col for col in df.columns if isinstance(df[col].dtype, pd.SparseDtype)]
+
+
+def encoding_for(cardinality):
+    if cardinality <= ENCODING_CONFIG['dense_max_categories']:
+        return 'onehot'
+    if cardinality <= ENCODING_CONFIG['sparse_max_categories']:
+        return 'sparse'
+    return ENCODING_CONFIG['high_cardinality']
+
+
+def choose_encoding(series):
+    return encoding_for(series.nunique(dropna=True))
+
+
+def choose_encodings(df, columns, overrides=None, cardinalities=None):
+    # cardinalities - число значений, уже посчитанное по всем данным
+    # (потоковая очистка); иначе оно берется из df
+    overrides = {**ENCODING_CONFIG['columns'], **(overrides or {})}
+    encodings = {}
+    for col in columns:
+        if col in overrides:
+            encodings[col] = overrides[col]
+        elif cardinalities is not None:
+            encodings[col] = encoding_for(cardinalities[col])
+        else:
+            encodings[col] = choose_encoding(df[col])
+        if encodings[col] not in ENCODINGS:
+            raise ValueError(f"Неизвестная стратегия кодирования для {col}: {encodings[col]}")
+
+    high = {col: encoding for col, encoding in encodings.items() if encoding != 'onehot'}
+    if high:
+        logger.info(f"Кодирование колонок с большим числом значений: {high}")
+    return encodings
+
+
+def hash_column(series, width=None):
+    # Хеширование не хранит словарь значений: ширина и имена колонок
+    # фиксированы, новые значения попадают в те же колонки
+    width = width or ENCODING_CONFIG['hash_width']
+    hasher = FeatureHasher(n_features=width, input_type='string', alternate_sign=False, dtype=np.float32)
+    values = series.astype('object').where(series.notna(), None)
+    matrix = hasher.transform([[str(value)] if value is not None else [] for value in values])
+
+    columns = [f"{series.name}_hash_{i}" for i in range(width)]
+    return pd.DataFrame.sparse.from_spmatrix(matrix, index=series.index, columns=columns)
+
+
+def encode_features(df, encodings, categories=None):
+    # categories - значения, запомненные при обучении (CleaningPipeline);
+    # без них категории берутся из самих данных
+    if categories:
+        for col, encoding in encodings.items():
+            if encoding != 'hash':
+                df[col] = pd.Categorical(df[col], categories=categories[col])
+
+    dense = [col for col, encoding in encodings.items() if encoding == 'onehot']
+    sparse = [col for col, encoding in encodings.items() if encoding == 'sparse']
+
+    for col, encoding in encodings.items():
+        if encoding == 'codes':
+            df[col] = pd.Categorical(df[col]).codes.astype('int32')
+
+    hashed = [hash_column(df[col]) for col, encoding in encodings.items() if encoding == 'hash']
+    if hashed:
+        df = pd.concat([df.drop(columns=[col for col, e in encodings.items() if e == 'hash'])] + hashed, axis=1)
+
+    if dense:
+        df = pd.get_dummies(df, columns=dense, drop_first=True)
+    if sparse:
+        df = pd.get_dummies(df, columns=sparse, drop_first=True, sparse=True, dtype=np.float32)
+
+    return df
@@ -0,0 +1,212 @@
+# excel_cache.py
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+import pandas as pd
+from loguru import logger
+from config import CACHE_CONFIG
+
+
+INDEX_FILE = 'index.json'
+LOCK_FILE = 'index.lock'
+# Блокировка старше этого срока осталась от упавшего процесса
+LOCK_TIMEOUT = 30
+
+
+def file_digest(file_path, block_size=1 << 20):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExcelCache:
+    def __init__(self, cache_dir=None, max_size_mb=None, compression=None):
+        self.cache_dir = cache_dir or CACHE_CONFIG['excel_dir']
+        self.max_bytes = int((max_size_mb or CACHE_CONFIG['max_size_mb']) * 1024 * 1024)
+        self.compression = compression or CACHE_CONFIG['compression']
+        self.index_path = os.path.join(self.cache_dir, INDEX_FILE)
+        self.lock_path = os.path.join(self.cache_dir, LOCK_FILE)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index = self._read_index()
+        # Записи, измененные этим процессом (None - удаленные): при записи
+        # индекса они накладываются на актуальную версию с диска
+        self._changed = {}
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Индекс кэша поврежден, кэш будет пересоздан: {str(e)}")
+            return {}
+
+    @contextmanager
+    def _lock(self):
+        # Индекс общий для процессов загрузки (ingestion.load_files), поэтому
+        # чтение, слияние и запись индекса идут под файловой блокировкой
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > LOCK_TIMEOUT:
+                        os.remove(self.lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Не удалось заблокировать индекс кэша {self.index_path}")
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            os.remove(self.lock_path)
+
+    def _write_index(self, evict=False):
+        with self._lock():
+            index = self._read_index()
+            for key, entry in self._changed.items():
+                if entry is None:
+                    index.pop(key, None)
+                else:
+                    index[key] = entry
+            self.index = index
+            if evict:
+                self._evict()
+            self._changed = {}
+
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def _key(file_path, sheet_name):
+        return f"{os.path.abspath(file_path)}::{sheet_name}"
+
+    def _remove_entry(self, key):
+        entry = self.index.pop(key, None)
+        self._changed[key] = None
+        if entry is None:
+            return
+        cached_file = os.path.join(self.cache_dir, entry['file'])
+        if os.path.exists(cached_file):
+            os.remove(cached_file)
+
+    def get(self, file_path, sheet_name=0):
+        key = self._key(file_path, sheet_name)
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+
+        stat = os.stat(file_path)
+        if stat.st_size != entry['size']:
+            self._remove_entry(key)
+            self._write_index()
+            return None
+
+        # mtime изменился (например, файл скопирован заново) — сверяем содержимое
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            if file_digest(file_path) != entry['digest']:
+                self._remove_entry(key)
+                self._write_index()
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self._changed[key] = entry
+
+        cached_file = os.path.join(self.cache_dir, entry['file'])
+        if not os.path.exists(cached_file):
+            self._remove_entry(key)
+            self._write_index()
+            return None
+
+        try:
+            df = pd.read_feather(cached_file)
+        except Exception as e:
+            logger.warning(f"Поврежденная запись кэша для {file_path}: {str(e)}")
+            self._remove_entry(key)
+            self._write_index()
+            return None
+
+        entry['last_access'] = time.time()
+        self._changed[key] = entry
+        self._write_index()
+        logger.info(f"Excel-файл {file_path} загружен из кэша")
+        return df
+
+    def put(self, file_path, df, sheet_name=0):
+        key = self._key(file_path, sheet_name)
+        stat = os.stat(file_path)
+        digest = file_digest(file_path)
+        cached_name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest() + '.arrow'
+        cached_file = os.path.join(self.cache_dir, cached_name)
+        tmp_path = cached_file + '.tmp'
+
+        try:
+            df.to_feather(tmp_path, compression=self.compression)
+            os.replace(tmp_path, cached_file)
+        except Exception as e:
+            logger.warning(f"Не удалось закэшировать {file_path}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        self.index[key] = {
+            'file': cached_name,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'digest': digest,
+            'bytes': os.path.getsize(cached_file),
+            'last_access': time.time()
+        }
+        self._changed[key] = self.index[key]
+        self._write_index(evict=True)
+        return True
+
+    def _evict(self):
+        total = sum(entry['bytes'] for entry in self.index.values())
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            total -= entry['bytes']
+            self._remove_entry(key)
+            logger.info(f"Из кэша удален {key}")
+
+    def invalidate(self, file_path=None):
+        if file_path is None:
+            keys = list(self.index)
+        else:
+            prefix = os.path.abspath(file_path) + '::'
+            keys = [key for key in self.index if key.startswith(prefix)]
+
+        for key in keys:
+            self._remove_entry(key)
+        self._write_index()
+        logger.info(f"Кэш очищен: {len(keys)} записей")
+        return len(keys)
+
+    def size(self):
+        return sum(entry['bytes'] for entry in self.index.values())
+
+
+_default_cache = None
+
+
+def get_excel_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ExcelCache()
+    return _default_cache
+
+
+def invalidate_excel_cache(file_path=None):
+    return get_excel_cache().invalidate(file_path)
@@ -0,0 +1,83 @@
+# figure_cache.py
+import hashlib
+import json
+import os
+import time
+import numpy as np
+from loguru import logger
+
+
+MANIFEST_FILE = 'manifest.json'
+# Меняется вместе с оформлением графиков, чтобы старые картинки перерисовались
+RENDER_VERSION = 1
+
+
+def histogram_fingerprint(data, params):
+    # Отпечаток того, что рисуется (plots.histogram_data): границы бинов,
+    # счетчики и кривая KDE. Перестановка строк и изменения внутри бинов
+    # картинку не меняют; кривая округляется до долей пикселя, чтобы порядок
+    # суммирования не менял отпечаток
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps({'version': RENDER_VERSION, **params}, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(np.asarray(data['counts'], dtype=np.int64).tobytes())
+    digest.update(np.asarray(data['edges'], dtype=np.float64).tobytes())
+    if data['density'] is not None:
+        scale = max(int(data['counts'].max()), 1)
+        digest.update(np.round(data['density'] / scale, 6).tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    # Манифест сгенерированных картинок: файл -> отпечаток данных и параметров
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE)
+        os.makedirs(directory, exist_ok=True)
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Манифест графиков поврежден, графики будут перерисованы: {str(e)}")
+            return {}
+
+    def save(self):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_fresh(self, file_name, fingerprint):
+        entry = self.manifest.get(file_name)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            return False
+        if not os.path.exists(os.path.join(self.directory, file_name)):
+            return False
+        entry['last_used'] = time.time()
+        return True
+
+    def record(self, file_name, column, fingerprint):
+        now = time.time()
+        self.manifest[file_name] = {
+            'column': column,
+            'fingerprint': fingerprint,
+            'bytes': os.path.getsize(os.path.join(self.directory, file_name)),
+            'rendered_at': now,
+            'last_used': now
+        }
+
+    def evict(self, keep):
+        # Картинки колонок, которых больше нет в данных, удаляются вместе с записью
+        stale = [file_name for file_name in self.manifest if file_name not in keep]
+        for file_name in stale:
+            del self.manifest[file_name]
+            path = os.path.join(self.directory, file_name)
+            if os.path.exists(path):
+                os.remove(path)
+        if stale:
+            logger.info(f"Удалено устаревших графиков: {len(stale)}")
+        return stale
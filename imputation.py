@@ -0,0 +1,121 @@
+# imputation.py
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+from loguru import logger
+from config import IMPUTATION_CONFIG, APP_SETTINGS
+from parallel import use_parallel, SharedBlock, run_column_groups
+
+
+def resolve_strategies(df, strategies=None):
+    overrides = {**IMPUTATION_CONFIG['columns'], **(strategies or {})}
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+
+    resolved = {}
+    for col in df.columns:
+        if col in overrides:
+            resolved[col] = overrides[col]
+        elif col in numeric_cols:
+            resolved[col] = IMPUTATION_CONFIG['numeric']
+        elif col in categorical_cols:
+            resolved[col] = IMPUTATION_CONFIG['categorical']
+    return resolved
+
+
+def fill_value(series, strategy):
+    if isinstance(strategy, tuple) and strategy[0] == 'constant':
+        return strategy[1]
+    if strategy == 'median':
+        return series.median()
+    if strategy == 'mean':
+        return series.mean()
+    if strategy == 'mode':
+        mode = series.mode()
+        return mode.iloc[0] if not mode.empty else np.nan
+    raise ValueError(f"Неизвестная стратегия заполнения пропусков: {strategy}")
+
+
+def knn_impute(X, n_neighbors=None, chunksize=None, n_jobs=None, reference=None, fallback=None):
+    n_neighbors = n_neighbors or IMPUTATION_CONFIG['n_neighbors']
+    chunksize = chunksize or IMPUTATION_CONFIG['chunksize']
+    n_jobs = n_jobs or APP_SETTINGS['max_workers']
+
+    missing = np.isnan(X)
+    incomplete_mask = missing.any(axis=1)
+    if not incomplete_mask.any():
+        return X
+
+    # Соседи ищутся среди полных строк самой таблицы или среди сохраненных
+    # при обучении (reference), медиана - запасное значение
+    incomplete = np.flatnonzero(incomplete_mask)
+    complete = X[~incomplete_mask] if reference is None else reference
+    if fallback is None:
+        with np.errstate(all='ignore'):
+            fallback = np.nanmedian(X, axis=0)
+
+    if len(complete) == 0:
+        logger.warning("Нет строк без пропусков, пропуски заполняются медианой")
+        X[missing] = np.take(fallback, np.nonzero(missing)[1])
+        return X
+
+    n_neighbors = min(n_neighbors, len(complete))
+
+    # Строки группируются по набору пропущенных колонок: для каждой группы
+    # дерево строится по наблюдаемым колонкам полных строк
+    patterns, inverse = np.unique(missing[incomplete], axis=0, return_inverse=True)
+    for i, pattern in enumerate(patterns):
+        rows = incomplete[inverse.ravel() == i]
+        observed = ~pattern
+
+        if not observed.any():
+            X[np.ix_(rows, pattern)] = fallback[pattern]
+            continue
+
+        index = NearestNeighbors(n_neighbors=n_neighbors, n_jobs=n_jobs).fit(complete[:, observed])
+        donors = complete[:, pattern]
+
+        for start in range(0, len(rows), chunksize):
+            batch = rows[start:start + chunksize]
+            _, neighbours = index.kneighbors(X[np.ix_(batch, observed)])
+            X[np.ix_(batch, pattern)] = donors[neighbours].mean(axis=1)
+
+    logger.info(f"KNN-заполнение: {len(incomplete)} строк с пропусками, групп пропусков: {len(patterns)}")
+    return X
+
+
+def impute_missing(df, strategies=None, n_neighbors=None, chunksize=None, n_jobs=None):
+    strategies = resolve_strategies(df, strategies)
+    missing_cols = [col for col in strategies if df[col].isnull().any()]
+    if not missing_cols:
+        return df
+
+    knn_cols = [col for col, strategy in strategies.items() if strategy == 'knn']
+    knn_missing = any(col in knn_cols for col in missing_cols)
+
+    # Простые стратегии для числовых колонок независимы: на широких таблицах
+    # они считаются группами колонок в пуле процессов
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    parallel_cols = [col for col in missing_cols if strategies[col] != 'knn' and col in numeric_cols]
+    if use_parallel(df, parallel_cols, n_jobs):
+        with SharedBlock(df, parallel_cols) as block:
+            run_column_groups(block, 'fill', n_jobs, {'strategies': [strategies[col] for col in parallel_cols]})
+            df = block.write_back(df)
+    else:
+        parallel_cols = []
+
+    fills = {}
+    for col in missing_cols:
+        if strategies[col] != 'knn' and col not in parallel_cols:
+            fills[col] = fill_value(df[col], strategies[col])
+
+    if knn_missing:
+        X = df[knn_cols].to_numpy(dtype='float64', copy=True)
+        X = knn_impute(X, n_neighbors, chunksize, n_jobs)
+        for i, col in enumerate(knn_cols):
+            if df[col].isnull().any():
+                df[col] = X[:, i]
+
+    if fills:
+        df = df.fillna(fills)
+
+    return df
@@ -0,0 +1,199 @@
+# incremental.py
+import json
+import os
+import pandas as pd
+from loguru import logger
+from config import PATHS, SOURCES, API_CONFIG
+from data_loader import load_sql, load_api_paginated
+from ingestion import ingest_sources, load_source, load_files, discover_files, align_frames
+from snapshots import save_snapshot, load_snapshot
+
+
+SOURCE_COLUMN = '_source'
+WATERMARKS_FILE = 'watermarks.json'
+
+
+class WatermarkStore:
+    def __init__(self, directory=None):
+        self.path = os.path.join(directory or PATHS['data_output'], WATERMARKS_FILE)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, watermarks):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(watermarks, f, ensure_ascii=False, indent=2)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def _json_value(value):
+    if isinstance(value, pd.Timestamp):
+        return str(value)
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _file_stats(paths):
+    stats = {}
+    for path in paths:
+        stat = os.stat(path)
+        stats[path] = [stat.st_size, stat.st_mtime_ns]
+    return stats
+
+
+def _fetch_files(source, paths, watermark):
+    # Перечитываются только новые и измененные файлы; строки удаленных и
+    # измененных файлов заменяются целиком
+    previous = watermark or {}
+    current = _file_stats(paths)
+    changed = [path for path in paths if previous.get(path) != current[path]]
+    removed = [path for path in previous if path not in current]
+
+    df, report = load_files(changed, schema=source.get('schema'), source_column=SOURCE_COLUMN)
+
+    # Файл с ошибкой сохраняет старую отметку, чтобы повторить попытку в следующий раз
+    for entry in report:
+        if entry['status'] == 'error':
+            current.pop(entry['source'])
+            if entry['source'] in previous:
+                current[entry['source']] = previous[entry['source']]
+
+    replaced = [path for path in changed if current.get(path) != previous.get(path)]
+    logger.info(f"Источник {source['name']}: изменено файлов {len(changed)}, удалено {len(removed)}")
+    return df, current, replaced + removed
+
+
+def fetch_increment(source, watermark=None):
+    source_type = source['type']
+
+    if source_type == 'directory':
+        return _fetch_files(source, discover_files(source['path'], source.get('patterns')), watermark)
+
+    if source_type in ('excel', 'csv'):
+        paths = [source['path']] if os.path.exists(source['path']) else []
+        return _fetch_files(source, paths, watermark)
+
+    if source_type == 'sql' and source.get('watermark_column'):
+        column = source['watermark_column']
+        if watermark is None:
+            df = load_sql(source['query'], db_url=source.get('db_url'), params=source.get('params'),
+                          schema=source.get('schema'))
+        else:
+            query = f"SELECT * FROM ({source['query']}) AS src WHERE {column} > :watermark"
+            params = {**(source.get('params') or {}), 'watermark': watermark}
+            df = load_sql(query, db_url=source.get('db_url'), params=params, schema=source.get('schema'))
+
+        if df is None:
+            return None, watermark, []
+        if not df.empty:
+            watermark = _json_value(df[column].max())
+        df[SOURCE_COLUMN] = source['name']
+        return df, watermark, []
+
+    if source_type == 'api' and source.get('paginate'):
+        offset_param = API_CONFIG['pagination']['offset_param']
+        params = dict(source.get('params') or {})
+        offset = watermark if watermark is not None else int(params.get(offset_param, 0))
+        df = load_api_paginated(source['url'], params={**params, offset_param: offset},
+                                headers=source.get('headers'), schema=source.get('schema'))
+        if df is None:
+            return None, watermark, []
+        df[SOURCE_COLUMN] = source['name']
+        return df, offset + len(df), []
+
+    # Источник без отметки перечитывается полностью и заменяет свои прежние строки
+    df = load_source(source)
+    if df is None:
+        return None, watermark, []
+    df[SOURCE_COLUMN] = source['name']
+    return df, None, [source['name']]
+
+
+def _kept_rows(base, increment, replaced, sources):
+    keep = ~base[SOURCE_COLUMN].isin(replaced)
+
+    # Повторно пришедшие строки источников с ключом заменяют прежние версии
+    if not increment.empty:
+        for source in sources:
+            key = source.get('key')
+            if not key or key not in increment.columns:
+                continue
+            new_keys = increment.loc[increment[SOURCE_COLUMN] == source['name'], key]
+            keep &= ~((base[SOURCE_COLUMN] == source['name']) & base[key].isin(new_keys))
+    return keep
+
+
+def drop_seen_rows(base, increment, replaced, sources, deduplicator):
+    # Отпечатки строк, которые слияние заменит (измененные файлы, источники
+    # без отметки, строки с тем же ключом), снимаются: их новые версии не дубли
+    if base is None or base.empty:
+        deduplicator.reset()
+    else:
+        columns = [col for col in increment.columns if col != SOURCE_COLUMN]
+        removed = base[~_kept_rows(base, increment, replaced, sources)]
+        if not removed.empty and set(columns) <= set(removed.columns):
+            deduplicator.discard(removed[columns])
+
+    if increment.empty:
+        return increment
+    seen = deduplicator.mark(increment.drop(columns=[SOURCE_COLUMN]))
+    if seen.any():
+        logger.info(f"Отброшено {int(seen.sum())} ранее загруженных строк")
+    return increment[~seen].reset_index(drop=True)
+
+
+def merge_increment(base, increment, replaced, sources):
+    if base is None or base.empty:
+        return increment.reset_index(drop=True)
+
+    base = base[_kept_rows(base, increment, replaced, sources)].copy()
+    if increment.empty:
+        return base.reset_index(drop=True)
+
+    return pd.concat(align_frames([base, increment]), ignore_index=True)
+
+
+def ingest_incremental(sources=None, full_refresh=False, snapshot='ingested', directory=None, deduplicator=None):
+    sources = SOURCES if sources is None else sources
+    store = WatermarkStore(directory)
+    watermarks = {} if full_refresh else store.load()
+    updates = {}
+
+    def loader(source):
+        df, watermark, replaced = fetch_increment(source, watermarks.get(source['name']))
+        updates[source['name']] = (watermark, replaced)
+        return df
+
+    if full_refresh:
+        logger.info("Полная перезагрузка всех источников")
+
+    increment, report = ingest_sources(sources, loader=loader)
+
+    base = None
+    if not full_refresh and os.path.exists(os.path.join(directory or PATHS['data_output'], f'{snapshot}.arrow')):
+        base = load_snapshot(snapshot, directory=directory)
+
+    replaced = [value for entry in report if entry['status'] == 'ok'
+                for value in updates[entry['source']][1]]
+    # Строки, уже загруженные раньше (dedup.Deduplicator), в набор не попадают
+    if deduplicator is not None:
+        increment = drop_seen_rows(base, increment, replaced, sources, deduplicator)
+    merged = merge_increment(base, increment, replaced, sources)
+
+    if save_snapshot(merged, snapshot, directory=directory) is None:
+        logger.error("Снимок не сохранен, отметки источников не обновляются")
+        return merged, increment, report
+
+    if deduplicator is not None:
+        deduplicator.save()
+
+    for entry in report:
+        if entry['status'] == 'ok':
+            watermarks[entry['source']] = updates[entry['source']][0]
+    store.save(watermarks)
+
+    logger.info(f"Инкрементальная загрузка: новых строк {len(increment)}, всего {len(merged)}")
+    return merged, increment, report
@@ -0,0 +1,186 @@
+# ingestion.py
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import pandas as pd
+from loguru import logger
+from config import APP_SETTINGS, PATHS, SOURCES
+from data_loader import load_excel, load_csv, load_sql, load_api, load_api_paginated
+
+
+def load_source(source):
+    source_type = source['type']
+
+    schema = source.get('schema')
+
+    if source_type == 'directory':
+        df, _ = load_files(discover_files(source['path'], source.get('patterns')), schema=schema)
+        return df
+    elif source_type == 'excel':
+        return load_excel(source['path'], schema=schema)
+    elif source_type == 'csv':
+        return load_csv(source['path'], schema=schema)
+    elif source_type == 'sql':
+        return load_sql(source['query'], db_url=source.get('db_url'), params=source.get('params'), schema=schema)
+    elif source_type == 'api' and source.get('paginate'):
+        return load_api_paginated(source['url'], params=source.get('params'),
+                                  headers=source.get('headers'), schema=schema)
+    elif source_type == 'api':
+        return load_api(source['url'], params=source.get('params'), headers=source.get('headers'), schema=schema)
+    else:
+        raise ValueError(f"Неподдерживаемый тип источника данных: {source_type}")
+
+
+def _run_source(source, loader):
+    start_time = time.perf_counter()
+    try:
+        df = loader(source)
+        error = None if df is not None else "загрузчик не вернул данных"
+    except Exception as e:
+        df, error = None, str(e)
+
+    return df, {
+        'source': source['name'],
+        'type': source['type'],
+        'rows': 0 if df is None else len(df),
+        'seconds': round(time.perf_counter() - start_time, 3),
+        'status': 'ok' if error is None else 'error',
+        'error': error
+    }
+
+
+def ingest_sources(sources=None, max_workers=None, loader=None):
+    sources = SOURCES if sources is None else sources
+    max_workers = max_workers or APP_SETTINGS['max_workers']
+    loader = loader or load_source
+
+    frames = {}
+    report = [None] * len(sources)
+
+    if sources:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+            futures = {executor.submit(_run_source, source, loader): i for i, source in enumerate(sources)}
+
+            for future in as_completed(futures):
+                i = futures[future]
+                df, entry = future.result()
+                report[i] = entry
+
+                if entry['status'] == 'ok':
+                    logger.info(f"Источник {entry['source']}: {entry['rows']} строк за {entry['seconds']} с")
+                    if not df.empty:
+                        frames[i] = df
+                else:
+                    logger.error(f"Источник {entry['source']} не загружен: {entry['error']}")
+
+    # Одна конкатенация в порядке источников, независимо от порядка завершения
+    if frames:
+        df = pd.concat([frames[i] for i in sorted(frames)], ignore_index=True)
+    else:
+        df = pd.DataFrame()
+
+    failed = sum(entry['status'] == 'error' for entry in report)
+    logger.info(f"Загрузка завершена: {len(df)} строк, источников с ошибками: {failed} из {len(sources)}")
+    return df, report
+
+
+def discover_files(directory=None, patterns=None):
+    directory = directory or PATHS['data_input']
+    patterns = patterns or APP_SETTINGS['input_patterns']
+
+    paths = set()
+    for pattern in patterns:
+        paths.update(glob.glob(os.path.join(directory, pattern)))
+
+    return sorted(paths)
+
+
+def load_file(path, schema=None, use_cache=True):
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.csv':
+        return load_csv(path, schema=schema)
+    elif extension in ('.xlsx', '.xlsm'):
+        return load_excel(path, use_cache=use_cache, schema=schema)
+    else:
+        raise ValueError(f"Неподдерживаемый формат файла: {path}")
+
+
+def _run_file(path, schema, use_cache, source_column):
+    start_time = time.perf_counter()
+    try:
+        df = load_file(path, schema, use_cache)
+        error = None if df is not None else "загрузчик не вернул данных"
+        if df is not None and source_column:
+            df[source_column] = pd.Categorical([path] * len(df))
+    except Exception as e:
+        df, error = None, str(e)
+
+    return df, {
+        'source': path,
+        'type': 'file',
+        'rows': 0 if df is None else len(df),
+        'seconds': round(time.perf_counter() - start_time, 3),
+        'status': 'ok' if error is None else 'error',
+        'error': error
+    }
+
+
+def align_frames(frames):
+    # Общий набор колонок и общие категории, чтобы одна конкатенация
+    # не превращала category в object
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+
+    categories = {}
+    for col in columns:
+        dtypes = [frame[col].dtype for frame in frames if col in frame.columns]
+        if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            values = (value for frame in frames if col in frame.columns for value in frame[col].cat.categories)
+            categories[col] = list(dict.fromkeys(values))
+
+    aligned = []
+    for frame in frames:
+        if list(frame.columns) != columns:
+            frame = frame.reindex(columns=columns)
+        for col, col_categories in categories.items():
+            if isinstance(frame[col].dtype, pd.CategoricalDtype):
+                frame[col] = frame[col].cat.set_categories(col_categories)
+            else:
+                frame[col] = pd.Categorical(frame[col], categories=col_categories)
+        aligned.append(frame)
+
+    return aligned
+
+
+def load_files(paths, schema=None, max_workers=None, use_cache=True, source_column=None):
+    max_workers = max_workers or APP_SETTINGS['max_workers']
+    frames = {}
+    report = [None] * len(paths)
+
+    # Разбор Excel упирается в CPU и GIL, поэтому файлы читаются в процессах
+    if max_workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            futures = {executor.submit(_run_file, path, schema, use_cache, source_column): i for i, path in enumerate(paths)}
+            results = ((futures[future], future.result()) for future in as_completed(futures))
+            for i, (df, entry) in results:
+                report[i] = entry
+                if df is not None and not df.empty:
+                    frames[i] = df
+    else:
+        for i, path in enumerate(paths):
+            df, report[i] = _run_file(path, schema, use_cache, source_column)
+            if df is not None and not df.empty:
+                frames[i] = df
+
+    for entry in report:
+        if entry['status'] == 'error':
+            logger.error(f"Файл {entry['source']} не загружен: {entry['error']}")
+
+    if frames:
+        df = pd.concat(align_frames([frames[i] for i in sorted(frames)]), ignore_index=True)
+    else:
+        df = pd.DataFrame()
+
+    logger.info(f"Загружено {len(frames)} из {len(paths)} файлов, {len(df)} строк")
+    return df, report
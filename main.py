@@ -1,22 +1,25 @@
 import os
 import sys
+import argparse
 import pandas as pd
 import numpy as np
 from loguru import logger
 import schedule
 import time
-from config import DB_CONFIG, PATHS, API_CONFIG
+from config import PATHS
 from ml_models import train_regression_model, save_model
 
 try:
     from data_loader import (
-        load_excel,
-        load_sql,
-        load_api,
-        load_csv,
         validate_data,
         clean_data
     )
+    from incremental import ingest_incremental, SOURCE_COLUMN
+    from snapshots import save_snapshot, load_snapshot, read_manifest
+    from pipeline import CleaningPipeline
+    from dedup import Deduplicator
+    from running_stats import update_running_stats
+    from segments import analyze_segments
     from data_analysis import (
         analyze_data,
         visualize_data,
@@ -43,37 +46,77 @@ def create_directories():
             logger.info(f"Создана папка {directory}")
 
 
-def main():
+def load_cleaned(rows):
+    # Сохраненный очищенный набор годится, только если новые строки дописаны
+    # в конец, а прежние не менялись: тогда в нем ровно rows строк
+    try:
+        if read_manifest('cleaned')['rows'] != rows:
+            logger.info("Очищенный набор не соответствует данным, очистка по всему набору")
+            return None
+        return load_snapshot('cleaned')
+    except FileNotFoundError:
+        return None
+
+
+def main(full_refresh=False):
     try:
         create_directories()
 
-        df = pd.DataFrame()
-
-        # Загрузка из Excel
-        excel_path = os.path.join(PATHS['data_input'], 'sample_data.xlsx')
-        if os.path.exists(excel_path):
-            logger.info("Начинаем загрузку из Excel")
-            excel_df = load_excel(excel_path)
-            if excel_df is not None:
-                df = pd.concat([df, excel_df], ignore_index=True)
-
-        # Загрузка из API
-        logger.info("Начинаем загрузку из API")
-        api_df = load_api(
-            API_CONFIG['base_url'] + API_CONFIG['endpoints']['data'],
-            headers=API_CONFIG['headers'],
-            params=API_CONFIG['params']
-        )
-        if api_df is not None:
-            df = pd.concat([df, api_df], ignore_index=True)
+        # Загрузка из всех источников (config.SOURCES) параллельно: только новые
+        # и измененные строки, которые объединяются с накопленным набором.
+        # Отпечатки строк хранятся между запусками, и ранее загруженные строки
+        # отбрасываются до слияния
+        deduplicator = Deduplicator('ingested')
+        if full_refresh:
+            deduplicator.reset()
+        df, new_rows, _ = ingest_incremental(full_refresh=full_refresh, deduplicator=deduplicator)
 
         if df.empty:
             logger.error("Данные не были загружены ни из одного источника")
             return
 
         # Обработка данных
-        validate_data(df)
-        df = clean_data(df)
+        new_rows = new_rows.drop(columns=[SOURCE_COLUMN], errors='ignore')
+        if not new_rows.empty:
+            validate_data(new_rows, rules='employees')
+        df = df.drop(columns=[SOURCE_COLUMN], errors='ignore')
+
+        # Пайплайн очистки обучается один раз и хранится рядом с моделью,
+        # чтобы каждый запуск давал одинаковые колонки и масштаб
+        pipeline_path = os.path.join(PATHS['models'], 'cleaning_pipeline.joblib')
+        refitted = full_refresh or not os.path.exists(pipeline_path)
+        cleaned = None
+        if not refitted:
+            pipeline = CleaningPipeline.load(pipeline_path)
+            cleaned = load_cleaned(len(df) - len(new_rows))
+
+        if cleaned is not None and new_rows.empty:
+            logger.info("Новых строк нет, обучение, анализ и отчеты не обновляются")
+            return
+
+        # Сегменты (отдел, регион, стаж) считаются по исходным значениям, до
+        # масштабирования и кодирования категорий
+        segment_results = analyze_segments(df)
+
+        # Новые строки только преобразуются и дописываются к сохраненному
+        # очищенному набору; после замены строк или переобучения пайплайна
+        # набор очищается целиком
+        if cleaned is not None:
+            new_rows = pipeline.transform(new_rows)
+            df = pd.concat([cleaned, new_rows], ignore_index=True)
+        elif not refitted:
+            df = clean_data(df, pipeline)
+        else:
+            pipeline = CleaningPipeline()
+            df = pipeline.fit_transform(df)
+            pipeline.save(pipeline_path)
+
+        # Статистики для анализа дополняются только новыми строками
+        running_stats = update_running_stats(df, new_rows, rebuild=cleaned is None)
+
+        # Снимок очищенных данных для следующего запуска и для обучения,
+        # анализа и отчетов в других процессах
+        save_snapshot(df, 'cleaned')
 
         analysis_results = {}
 
@@ -96,7 +139,9 @@ def main():
                 analysis_results['model_metrics'] = metrics_dict
 
         try:
-            analysis_results = analyze_data(df)
+            analysis_results = analyze_data(df, running_stats)
+            if segment_results:
+                analysis_results['segments'] = segment_results
 
             if not analysis_results:
                 logger.warning("Результаты анализа отсутствуют")
@@ -142,10 +187,18 @@ def job():
         )
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='перезагрузить все источники целиком, игнорируя сохраненные отметки, и переобучить пайплайн очистки'
+    )
+    args = parser.parse_args()
+
     try:
         schedule.every().day.at("08:00").do(job)
 
-        main()
+        main(full_refresh=args.full_refresh)
 
         while True:
             schedule.run_pending()
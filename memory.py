@@ -0,0 +1,67 @@
+# memory.py
+import sys
+import tracemalloc
+from contextlib import contextmanager
+import pandas as pd
+from loguru import logger
+
+try:
+    import resource
+except ImportError:
+    # На Windows модуля resource нет, пиковый RSS не сообщается
+    resource = None
+
+MB = 1024 * 1024
+
+
+def peak_rss():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux возвращает килобайты, macOS - байты
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+class MemoryTracker:
+    # Память по шагам через tracemalloc (NumPy и pandas сообщают ему о своих
+    # буферах): allocated - сколько осталось занято после шага, peak - максимум
+    # сверх входных данных, peak_ratio - (вход + peak) / вход
+    def __init__(self, input_bytes):
+        self.input_bytes = max(int(input_bytes), 1)
+        self.steps = []
+        self._started = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *args):
+        if self._started:
+            tracemalloc.stop()
+
+    @contextmanager
+    def step(self, name):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        yield
+        current, peak = tracemalloc.get_traced_memory()
+
+        record = {
+            'step': name,
+            'allocated': current - before,
+            'peak': peak - self._baseline,
+            'peak_ratio': (self.input_bytes + peak - self._baseline) / self.input_bytes,
+            'rss_peak': peak_rss()
+        }
+        self.steps.append(record)
+        logger.info(
+            f"Шаг {name}: выделено {record['allocated'] / MB:.1f} МБ, "
+            f"пик {record['peak'] / MB:.1f} МБ ({record['peak_ratio']:.2f} от входа)"
+            + (f", пиковый RSS {record['rss_peak'] / MB:.1f} МБ" if record['rss_peak'] else "")
+        )
+
+    def report(self):
+        return pd.DataFrame(self.steps, columns=['step', 'allocated', 'peak', 'peak_ratio', 'rss_peak'])
@@ -8,6 +8,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import Pipeline
 from sklearn.compose import ColumnTransformer
 from loguru import logger
+from encoding import sparse_columns
 
 
 def train_regression_model(df, target_column):
@@ -19,25 +20,33 @@ def train_regression_model(df, target_column):
         if len(features) == 0:
             raise ValueError("Нет признаков для обучения модели")
 
-        non_numeric_features = df.select_dtypes(exclude=['float64', 'int64']).columns
+        # bool-колонки (плотный one-hot из encode_features) - тоже признаки
+        non_numeric_features = df.select_dtypes(exclude=[np.number, 'bool']).columns
         if not non_numeric_features.empty:
             raise ValueError(f"Нечисловые признаки: {list(non_numeric_features)}")
 
         X = df.drop(columns=[target_column])
         y = df[target_column]
 
+        bool_features = X.select_dtypes(include=['bool']).columns
+        if not bool_features.empty:
+            X = X.astype({col: 'float32' for col in bool_features})
+
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42
         )
 
-        numeric_features = X.select_dtypes(include=['float64', 'int64']).columns
+        # Разреженные признаки масштабируются без центрирования, чтобы
+        # матрица оставалась разреженной до самой регрессии
+        sparse_features = sparse_columns(X)
+        numeric_features = X.select_dtypes(include=[np.number]).columns.difference(sparse_features, sort=False)
         numeric_transformer = StandardScaler()
 
-        preprocessor = ColumnTransformer(
-            transformers=[
-                ('num', numeric_transformer, numeric_features)
-            ]
-        )
+        transformers = [('num', numeric_transformer, numeric_features)]
+        if sparse_features:
+            transformers.append(('sparse', StandardScaler(with_mean=False), sparse_features))
+
+        preprocessor = ColumnTransformer(transformers=transformers)
 
         model = Pipeline(steps=[
             ('preprocessor', preprocessor),
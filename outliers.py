@@ -0,0 +1,66 @@
+# outliers.py
+import numpy as np
+import pandas as pd
+
+
+class OutlierReport:
+    # Выбросы хранятся как позиции строк по колонкам; сами строки собираются
+    # из исходного DataFrame только по запросу
+
+    def __init__(self, df, method, positions, scores=None):
+        self._df = df
+        self.method = method
+        self.positions = positions
+        self.scores = scores or {}
+
+    def __getitem__(self, col):
+        return self.rows(col)
+
+    def __contains__(self, col):
+        return col in self.positions
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def keys(self):
+        return self.positions.keys()
+
+    def count(self, col):
+        return len(self.positions[col])
+
+    def counts(self):
+        return pd.Series({col: len(pos) for col, pos in self.positions.items()}, dtype='int64')
+
+    def mask(self, col):
+        mask = np.zeros(len(self._df), dtype=bool)
+        mask[self.positions[col]] = True
+        return mask
+
+    def any_mask(self):
+        mask = np.zeros(len(self._df), dtype=bool)
+        for pos in self.positions.values():
+            mask[pos] = True
+        return mask
+
+    def rows(self, col):
+        rows = self._df.iloc[self.positions[col]]
+        if col in self.scores:
+            rows = rows.assign(z_score=self.scores[col])
+        return rows
+
+    def flagged_rows(self):
+        return self._df.iloc[np.flatnonzero(self.any_mask())]
+
+
+def combine_reports(*reports):
+    # Строки, отмеченные любым из методов
+    df = reports[0]._df
+    columns = list(dict.fromkeys(col for report in reports for col in report.positions))
+    positions = {
+        col: np.unique(np.concatenate([report.positions[col] for report in reports if col in report.positions]))
+        for col in columns
+    }
+    return OutlierReport(df, 'any', positions)
@@ -0,0 +1,160 @@
+# parallel.py
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from loguru import logger
+from config import APP_SETTINGS
+
+
+def use_parallel(df, columns, max_workers=None):
+    # Пул процессов окупается только на широких и длинных таблицах
+    max_workers = max_workers or APP_SETTINGS['max_workers']
+    return max_workers > 1 and len(columns) > 1 and len(df) * len(columns) >= APP_SETTINGS['parallel_min_cells']
+
+
+def float_dtype(dtype, default):
+    return dtype if isinstance(dtype, np.dtype) and dtype.kind == 'f' else default
+
+
+class SharedBlock:
+    # Числовые колонки в разделяемой памяти в порядке Fortran: каждая группа
+    # колонок - непрерывный участок буфера, процессы читают и пишут его без pickle
+    def __init__(self, df, columns):
+        self.columns = list(columns)
+        self.dtypes = [df[col].dtype for col in self.columns]
+        self.shape = (len(df), len(self.columns))
+        self.shm = shared_memory.SharedMemory(create=True, size=max(8 * self.shape[0] * self.shape[1], 1))
+        self.array = np.ndarray(self.shape, dtype=np.float64, buffer=self.shm.buf, order='F')
+        for i, col in enumerate(self.columns):
+            self.array[:, i] = df[col].to_numpy(dtype='float64')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write_back(self, df):
+        # Вещественные колонки возвращаются в исходном типе (float32 остается
+        # float32); целые после масштабирования или заполнения - float64
+        for i, (col, dtype) in enumerate(zip(self.columns, self.dtypes)):
+            df[col] = self.array[:, i].astype(float_dtype(dtype, np.float64))
+        return df
+
+    def close(self):
+        del self.array
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _fill(block, strategies):
+    values = []
+    for i, strategy in enumerate(strategies):
+        column = block[:, i]
+        missing = np.isnan(column)
+        if isinstance(strategy, tuple):
+            value = strategy[1]
+        elif missing.all():
+            value = np.nan
+        elif strategy == 'median':
+            value = np.median(column[~missing])
+        elif strategy == 'mode':
+            # Как Series.mode: самое частое значение, при равенстве - меньшее
+            unique, counts = np.unique(column[~missing], return_counts=True)
+            value = unique[counts.argmax()]
+        else:
+            value = column[~missing].mean()
+        column[missing] = value
+        values.append(value)
+    return values
+
+
+def _minmax(block):
+    # Как MinMaxScaler: пропуски не учитываются и остаются пропусками
+    result = []
+    for i in range(block.shape[1]):
+        column = block[:, i]
+        observed = column[~np.isnan(column)]
+        minimum = observed.min() if len(observed) else 0.0
+        value_range = observed.max() - minimum if len(observed) else 0.0
+        value_range = value_range if value_range != 0 else 1.0
+        column -= minimum
+        column /= value_range
+        result.append((minimum, value_range))
+    return result
+
+
+def _iqr_positions(block):
+    result = []
+    for i in range(block.shape[1]):
+        column = block[:, i]
+        observed = column[~np.isnan(column)]
+        if len(observed) == 0:
+            result.append(np.empty(0, dtype=np.int64))
+            continue
+        q1, q3 = np.quantile(observed, [0.25, 0.75])
+        iqr = q3 - q1
+        result.append(np.flatnonzero((column < q1 - 1.5 * iqr) | (column > q3 + 1.5 * iqr)))
+    return result
+
+
+def _zscore_positions(block, threshold):
+    result = []
+    for i in range(block.shape[1]):
+        column = block[:, i]
+        observed = column[~np.isnan(column)]
+        if len(observed) < 2:
+            result.append((np.empty(0, dtype=np.int64), np.empty(0)))
+            continue
+        std = observed.std(ddof=1)
+        # Как в последовательной версии: у колонки без разброса z-оценок нет
+        if std == 0:
+            result.append((np.empty(0, dtype=np.int64), None))
+            continue
+        z_scores = (column - observed.mean()) / std
+        flagged = np.abs(z_scores) > threshold
+        result.append((np.flatnonzero(flagged), z_scores[flagged]))
+    return result
+
+
+OPERATIONS = {
+    'fill': _fill,
+    'minmax': _minmax,
+    'iqr': _iqr_positions,
+    'zscore': _zscore_positions
+}
+
+
+def _run_group(name, shape, start, stop, operation, params):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order='F')
+        result = OPERATIONS[operation](block[:, start:stop], **params)
+        del block
+        return result
+    finally:
+        shm.close()
+
+
+def run_column_groups(block, operation, max_workers=None, column_params=None, **params):
+    # Колонки делятся на непрерывные группы по числу процессов; результаты
+    # возвращаются списком в порядке колонок
+    max_workers = min(max_workers or APP_SETTINGS['max_workers'], block.shape[1])
+    bounds = np.linspace(0, block.shape[1], max_workers + 1).astype(int)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            group_params = dict(params)
+            for key, values in (column_params or {}).items():
+                group_params[key] = values[start:stop]
+            futures.append(executor.submit(
+                _run_group, block.shm.name, block.shape, int(start), int(stop), operation, group_params
+            ))
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+    logger.info(f"Операция {operation}: {block.shape[1]} колонок обработано в {max_workers} процессах")
+    return results
@@ -0,0 +1,120 @@
+# pipeline.py
+import joblib
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import IMPUTATION_CONFIG
+from imputation import resolve_strategies, fill_value, knn_impute
+from encoding import choose_encodings, encode_features, sparse_columns
+
+
+class CleaningPipeline:
+    # Заполнение пропусков, one-hot кодирование и MinMax-нормализация,
+    # обученные один раз: новые партии только преобразуются и получают
+    # те же колонки в том же порядке
+    def __init__(self, strategies=None, encodings=None, n_neighbors=None, reference_rows=None, seed=0):
+        self.strategies = strategies
+        self.encodings = encodings
+        self.n_neighbors = n_neighbors or IMPUTATION_CONFIG['n_neighbors']
+        self.reference_rows = reference_rows or IMPUTATION_CONFIG['reference_rows']
+        self.seed = seed
+        self.fitted = False
+
+    def fit(self, df):
+        self._fit(df)
+        return self
+
+    def fit_transform(self, df):
+        return self._scale(self._fit(df))
+
+    def transform(self, df):
+        if not self.fitted:
+            raise ValueError("CleaningPipeline не обучен, вызовите fit")
+
+        unknown = df.columns.difference(self.input_columns_)
+        if not unknown.empty:
+            logger.warning(f"Колонки, неизвестные при обучении, отброшены: {list(unknown)}")
+
+        df = df.reindex(columns=self.input_columns_)
+        return self._scale(self._encode(self._impute(df)))
+
+    def save(self, path):
+        joblib.dump(self, path)
+        logger.info(f"Пайплайн очистки сохранен в {path}")
+
+    @staticmethod
+    def load(path):
+        pipeline = joblib.load(path)
+        logger.info(f"Пайплайн очистки загружен из {path}")
+        return pipeline
+
+    def _fit(self, df):
+        strategies = resolve_strategies(df, self.strategies)
+        self.input_columns_ = list(df.columns)
+        self.numeric_cols_ = list(df.select_dtypes(include=[np.number]).columns)
+        self.categorical_cols_ = list(df.select_dtypes(include=['object', 'category']).columns)
+        self.knn_cols_ = [col for col in self.numeric_cols_ if strategies.get(col) == 'knn']
+        self.fills_ = {
+            col: fill_value(df[col], strategy)
+            for col, strategy in strategies.items() if strategy != 'knn'
+        }
+
+        reference = df[self.knn_cols_].dropna().to_numpy(dtype='float64')
+        if len(reference) > self.reference_rows:
+            rng = np.random.default_rng(self.seed)
+            reference = reference[np.sort(rng.choice(len(reference), self.reference_rows, replace=False))]
+        self.reference_ = reference
+        self.medians_ = df[self.knn_cols_].median().to_numpy(dtype='float64')
+
+        self.encodings_ = choose_encodings(df, self.categorical_cols_, self.encodings)
+        self.categories_ = {
+            col: pd.Categorical(df[col]).categories
+            for col, encoding in self.encodings_.items() if encoding != 'hash'
+        }
+        self.fitted = True
+
+        encoded = self._encode(self._impute(df.copy()))
+        self.columns_ = list(encoded.columns)
+        self.scale_cols_ = list(
+            encoded.select_dtypes(include=[np.number]).columns.difference(sparse_columns(encoded), sort=False)
+        )
+
+        numeric = encoded[self.scale_cols_].to_numpy(dtype='float64')
+        self.min_ = np.nanmin(numeric, axis=0) if len(numeric) else np.zeros(len(self.scale_cols_))
+        ranges = (np.nanmax(numeric, axis=0) if len(numeric) else self.min_) - self.min_
+        self.range_ = np.where(ranges == 0, 1.0, ranges)
+
+        logger.info(f"Пайплайн очистки обучен: {len(df)} строк, {len(self.columns_)} колонок на выходе")
+        return encoded
+
+    def _impute(self, df):
+        if self.knn_cols_:
+            X = df[self.knn_cols_].to_numpy(dtype='float64', copy=True)
+            if np.isnan(X).any():
+                X = knn_impute(
+                    X, self.n_neighbors,
+                    reference=self.reference_ if len(self.reference_) else None,
+                    fallback=self.medians_
+                )
+                df[self.knn_cols_] = X
+
+        fills = {col: value for col, value in self.fills_.items() if df[col].isnull().any()}
+        if fills:
+            df = df.fillna(fills)
+        return df
+
+    def _encode(self, df):
+        if not self.categorical_cols_:
+            return df
+
+        df = encode_features(df, self.encodings_, self.categories_)
+
+        if hasattr(self, 'columns_'):
+            df = df.reindex(columns=self.columns_, fill_value=False)
+        return df
+
+    def _scale(self, df):
+        if self.scale_cols_:
+            numeric = df[self.scale_cols_].to_numpy(dtype='float64')
+            df[self.scale_cols_] = (numeric - self.min_) / self.range_
+        return df
@@ -0,0 +1,133 @@
+# plots.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import APP_SETTINGS, VISUALIZATION_CONFIG
+from figure_cache import FigureCache, histogram_fingerprint
+
+
+def is_dummy(series):
+    # One-hot колонки (bool, разреженные или только 0/1) не рисуются
+    if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.SparseDtype):
+        return True
+    values = series.dropna().unique()
+    return len(values) <= 2 and set(values) <= {0, 1}
+
+
+def plot_columns(df):
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    return [col for col in numeric_cols if not is_dummy(df[col])]
+
+
+def _kde(sample, grid):
+    # Гауссово ядро с шириной по правилу Скотта, как в seaborn/scipy
+    std = sample.std(ddof=1)
+    bandwidth = std * len(sample) ** (-1 / 5)
+    if not bandwidth > 0:
+        return None
+    z = (grid[:, None] - sample[None, :]) / bandwidth
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (len(sample) * bandwidth * np.sqrt(2 * np.pi))
+
+
+def histogram_data(values, seed=0):
+    values = np.asarray(values, dtype='float64')
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return None
+
+    edges = np.histogram_bin_edges(values, bins='auto')
+    if len(edges) - 1 > VISUALIZATION_CONFIG['max_bins']:
+        edges = np.histogram_bin_edges(values, bins=VISUALIZATION_CONFIG['max_bins'])
+    counts, edges = np.histogram(values, bins=edges)
+
+    # KDE по выборке: на больших колонках форма кривой та же, а считать
+    # ядро по всем строкам незачем
+    sample = values
+    if len(values) > VISUALIZATION_CONFIG['kde_sample']:
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(values, VISUALIZATION_CONFIG['kde_sample'], replace=False)
+
+    grid = np.linspace(edges[0], edges[-1], VISUALIZATION_CONFIG['kde_points'])
+    density = _kde(sample, grid) if len(sample) > 1 else None
+    # Кривая в масштабе счетчиков, как histplot(kde=True)
+    if density is not None:
+        density = density * len(values) * (edges[1] - edges[0])
+
+    return {'counts': counts, 'edges': edges, 'grid': grid, 'density': density}
+
+
+def render_histogram(col, data, path):
+    # Объектный API без pyplot: фигура рисуется Agg-канвасом и не попадает
+    # в глобальное состояние, поэтому безопасна в дочерних процессах
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.stairs(data['counts'], data['edges'], fill=True, alpha=0.5, edgecolor='white')
+    if data['density'] is not None:
+        ax.plot(data['grid'], data['density'])
+    ax.set_title(f'Распределение {col}')
+    ax.set_xlabel(col)
+    ax.set_ylabel('Count')
+    fig.savefig(path)
+    return path
+
+
+def render_histograms(df, directory, max_workers=None, use_cache=True):
+    max_workers = max_workers or APP_SETTINGS['max_workers']
+    cache = FigureCache(directory) if use_cache else None
+    os.makedirs(directory, exist_ok=True)
+
+    columns = plot_columns(df)
+    skipped = len(df.select_dtypes(include=[np.number]).columns) - len(columns)
+    if skipped:
+        logger.info(f"Пропущено {skipped} dummy-колонок")
+
+    # Бины и KDE считаются здесь, в процессы уходят только массивы длиной в сотни точек;
+    # графики с теми же бинами, счетчиками и параметрами берутся из кэша
+    jobs, paths, fingerprints = [], [], {}
+    for col in columns:
+        file_name = f'{col}_distribution.png'
+        path = os.path.join(directory, file_name)
+        data = histogram_data(df[col].to_numpy(dtype='float64', na_value=np.nan))
+        if data is None:
+            logger.warning(f"Колонка {col} не содержит значений для визуализации")
+            continue
+
+        if cache is not None:
+            fingerprints[file_name] = histogram_fingerprint(data, {'column': col, **VISUALIZATION_CONFIG})
+            if cache.is_fresh(file_name, fingerprints[file_name]):
+                paths.append(path)
+                continue
+        jobs.append((col, data, path))
+
+    rendered = []
+    if max_workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = {executor.submit(render_histogram, *job): job[0] for job in jobs}
+            for future, col in futures.items():
+                try:
+                    rendered.append((col, future.result()))
+                except Exception as e:
+                    logger.warning(f"Ошибка при визуализации {col}: {str(e)}")
+    else:
+        for job in jobs:
+            try:
+                rendered.append((job[0], render_histogram(*job)))
+            except Exception as e:
+                logger.warning(f"Ошибка при визуализации {job[0]}: {str(e)}")
+
+    if cache is not None:
+        for col, path in rendered:
+            file_name = os.path.basename(path)
+            cache.record(file_name, col, fingerprints[file_name])
+        cache.evict(keep=fingerprints)
+        cache.save()
+
+    paths.extend(path for _, path in rendered)
+    logger.info(f"Построено {len(rendered)} графиков распределений, из кэша {len(paths) - len(rendered)}")
+    return paths
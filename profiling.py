@@ -0,0 +1,80 @@
+# profiling.py
+import numpy as np
+import pandas as pd
+
+
+PROFILE_FIELDS = [
+    'count', 'nulls', 'min', 'max', 'mean', 'std', 'q1', 'q3',
+    'iqr_lower', 'iqr_upper', 'iqr_outliers', 'zscore_outliers'
+]
+
+
+def profile_numeric(df, columns=None, threshold=3):
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns
+    columns = list(columns)
+
+    profile = pd.DataFrame(np.nan, index=pd.Index(columns, dtype='object'), columns=PROFILE_FIELDS)
+    if not columns:
+        return profile
+
+    # Один непрерывный блок, строка которого — колонка данных; копия, так как сортируется на месте
+    block = np.array(df[columns].to_numpy(dtype='float64').T, order='C', copy=True)
+    n_cols, n_rows = block.shape
+    rows = np.arange(n_cols)
+
+    # В пустом наборе индексировать отсортированный блок нечем
+    if n_rows == 0:
+        profile[['count', 'nulls', 'iqr_outliers', 'zscore_outliers']] = 0
+        return profile
+
+    nulls = np.isnan(block).sum(axis=1)
+    counts = n_rows - nulls
+    filled = counts > 0
+    safe_counts = np.maximum(counts, 1)
+
+    means = np.nansum(block, axis=1) / safe_counts
+    deviations = block - means[:, None]
+    m2 = np.nansum(deviations ** 2, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stds = np.where(counts > 1, np.sqrt(m2 / (counts - 1)), np.nan)
+        zscore_outliers = (np.abs(deviations / stds[:, None]) > threshold).sum(axis=1)
+    zscore_outliers[~(stds > 0)] = 0
+    del deviations
+
+    # После сортировки NaN оказываются в конце строки: минимум, максимум и
+    # квартили берутся по индексам, выбросы по IQR — бинарным поиском
+    block.sort(axis=1)
+    last = np.maximum(counts - 1, 0)
+
+    quartiles = []
+    for q in (0.25, 0.75):
+        pos = last * q
+        lower_pos = np.floor(pos).astype(np.int64)
+        upper_pos = np.ceil(pos).astype(np.int64)
+        lower, upper = block[rows, lower_pos], block[rows, upper_pos]
+        quartiles.append(lower + (upper - lower) * (pos - lower_pos))
+    q1, q3 = quartiles
+    iqr_lower = q1 - 1.5 * (q3 - q1)
+    iqr_upper = q3 + 1.5 * (q3 - q1)
+
+    iqr_outliers = np.zeros(n_cols, dtype=np.int64)
+    for i in np.flatnonzero(filled):
+        values = block[i, :counts[i]]
+        below = np.searchsorted(values, iqr_lower[i], side='left')
+        above = counts[i] - np.searchsorted(values, iqr_upper[i], side='right')
+        iqr_outliers[i] = below + above
+
+    profile['count'] = counts
+    profile['nulls'] = nulls
+    profile['min'] = np.where(filled, block[:, 0], np.nan)
+    profile['max'] = np.where(filled, block[rows, last], np.nan)
+    profile['mean'] = np.where(filled, means, np.nan)
+    profile['std'] = stds
+    profile['q1'] = np.where(filled, q1, np.nan)
+    profile['q3'] = np.where(filled, q3, np.nan)
+    profile['iqr_lower'] = np.where(filled, iqr_lower, np.nan)
+    profile['iqr_upper'] = np.where(filled, iqr_upper, np.nan)
+    profile['iqr_outliers'] = iqr_outliers
+    profile['zscore_outliers'] = zscore_outliers
+    return profile
@@ -0,0 +1,102 @@
+# report_writer.py
+import os
+import time
+import xlsxwriter
+from loguru import logger
+from config import REPORT_CONFIG
+from encoding import sparse_columns
+
+EXCEL_MAX_ROWS = 1_048_576
+SHEET_NAME_LENGTH = 31
+CHUNK_ROWS = 10_000
+
+
+def _cell_rows(chunk):
+    # NaN/NaT -> пустая ячейка, numpy-скаляры -> обычные значения Python
+    return chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+
+
+def write_frame(worksheet, df, header_format=None, index=False, max_rows=None):
+    # Строки пишутся строго по порядку: в режиме constant_memory xlsxwriter
+    # сбрасывает строку на диск, как только начата следующая
+    if index:
+        header = [name or '' for name in df.index.names] + [str(col) for col in df.columns]
+        df = df.reset_index(allow_duplicates=True)
+    else:
+        header = [str(col) for col in df.columns]
+
+    worksheet.write_row(0, 0, header, header_format)
+    row_num = 1
+    for start in range(0, len(df), CHUNK_ROWS):
+        for values in _cell_rows(df.iloc[start:start + CHUNK_ROWS]):
+            worksheet.write_row(row_num, 0, values)
+            row_num += 1
+    return row_num - 1
+
+
+def data_sheet_names(name, rows, rows_per_sheet):
+    count = max(1, -(-rows // rows_per_sheet))
+    return [name] + [f"{name}_{i}"[:SHEET_NAME_LENGTH] for i in range(2, count + 1)]
+
+
+def write_sidecar(df, path, fmt):
+    # Разреженные колонки в колоночные форматы пишутся плотными
+    df = df.astype({col: df[col].dtype.subtype for col in sparse_columns(df)})
+    if fmt == 'parquet':
+        df.to_parquet(path, compression='zstd', index=False)
+    elif fmt == 'csv':
+        df.to_csv(path, index=False, compression='gzip')
+    else:
+        raise ValueError(f"Неизвестный формат файла данных: {fmt}")
+    return path
+
+
+def write_report(df, sheets=None, path=None, data_sheet='Данные', sidecar=None, rows_per_sheet=None):
+    path = path or REPORT_CONFIG['path']
+    sidecar = sidecar if sidecar is not None else REPORT_CONFIG['sidecar']
+    rows_per_sheet = min(rows_per_sheet or REPORT_CONFIG['rows_per_sheet'], EXCEL_MAX_ROWS - 1)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    stats = {'rows': len(df), 'sheets': [], 'sidecar': None}
+    start_time = time.perf_counter()
+
+    workbook = xlsxwriter.Workbook(path, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+    })
+    try:
+        header_format = workbook.add_format({'bold': True, 'border': 1})
+
+        if sidecar:
+            # Сырые данные - рядом в сжатом файле, в книге только ссылка на него
+            extension = {'parquet': '.parquet', 'csv': '.csv.gz'}.get(sidecar, '')
+            sidecar_path = os.path.splitext(path)[0] + '_data' + extension
+            write_sidecar(df, sidecar_path, sidecar)
+            stats['sidecar'] = sidecar_path
+
+            worksheet = workbook.add_worksheet(data_sheet)
+            worksheet.write_url(
+                0, 0, f"external:{os.path.basename(sidecar_path)}",
+                string=f"{len(df)} строк в файле {os.path.basename(sidecar_path)}"
+            )
+            stats['sheets'].append(data_sheet)
+        else:
+            names = data_sheet_names(data_sheet, len(df), rows_per_sheet)
+            for i, name in enumerate(names):
+                worksheet = workbook.add_worksheet(name)
+                write_frame(worksheet, df.iloc[i * rows_per_sheet:(i + 1) * rows_per_sheet], header_format)
+                stats['sheets'].append(name)
+            if len(names) > 1:
+                logger.info(f"Данные разбиты на {len(names)} листа по {rows_per_sheet} строк")
+
+        for name, frame in (sheets or {}).items():
+            worksheet = workbook.add_worksheet(name[:SHEET_NAME_LENGTH])
+            write_frame(worksheet, frame, header_format, index=True)
+            stats['sheets'].append(name)
+    finally:
+        workbook.close()
+
+    stats['seconds'] = time.perf_counter() - start_time
+    stats['rows_per_sec'] = len(df) / stats['seconds'] if stats['seconds'] > 0 else float('inf')
+    logger.info(f"Отчет записан в {path}: {len(df)} строк, {stats['rows_per_sec']:.0f} строк/с")
+    return stats
@@ -0,0 +1,185 @@
+# rules.py
+import ast
+import re
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import RULES
+from dedup import FingerprintSet, row_fingerprints
+
+RULE_TYPES = ('range', 'not_null', 'unique', 'allowed', 'regex', 'expression')
+
+
+def get_rules(rules):
+    # Правила задаются списком или именем набора из config.RULES
+    if isinstance(rules, str):
+        if rules not in RULES:
+            raise KeyError(f"Набор правил {rules} не найден")
+        return RULES[rules]
+    return rules
+
+
+def _expression_names(expr):
+    # Колонки выражения DataFrame.eval: имена из разбора выражения, кроме
+    # вызываемых функций и локальных переменных (@name); `имя` - как есть
+    quoted = re.findall(r"`([^`]+)`", expr)
+    source = re.sub(r"@\w+", "0", re.sub(r"`[^`]+`", "0", expr))
+    tree = ast.parse(source, mode='eval')
+    functions = {
+        node.func.id for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+    names = [node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id not in functions]
+    return list(dict.fromkeys(quoted + names))
+
+
+def _expression_columns(expr, columns):
+    names = set(_expression_names(expr))
+    return [col for col in columns if col in names]
+
+
+def _rule_columns(rule):
+    if rule['type'] == 'expression':
+        return _expression_names(rule['expr'])
+    return [rule['column']] if isinstance(rule['column'], str) else list(rule['column'])
+
+
+def _rule_name(rule):
+    if 'name' in rule:
+        return rule['name']
+    if rule['type'] == 'expression':
+        return rule['expr']
+    columns = rule['column'] if isinstance(rule['column'], str) else '+'.join(rule['column'])
+    return f"{columns}:{rule['type']}"
+
+
+class RuleSet:
+    # Правила компилируются один раз: однотипные проверки (диапазоны, пропуски)
+    # считаются одной векторной операцией над блоком колонок, результат чанка -
+    # булева матрица строк x правил (True - нарушение)
+    def __init__(self, rules, columns=None):
+        rules = get_rules(rules)
+        for rule in rules:
+            if rule['type'] not in RULE_TYPES:
+                raise ValueError(f"Неизвестный тип правила: {rule['type']}")
+
+        # Если колонки данных известны, правила по отсутствующим колонкам пропускаются
+        if columns is not None:
+            skipped = [
+                _rule_name(rule) for rule in rules
+                if not set(_rule_columns(rule)) <= set(columns)
+            ]
+            if skipped:
+                logger.warning(f"Правила по отсутствующим колонкам пропущены: {skipped}")
+            rules = [rule for rule in rules if _rule_name(rule) not in skipped]
+
+        self.rules = list(rules)
+        self.names = [_rule_name(rule) for rule in self.rules]
+        self._range = [i for i, rule in enumerate(self.rules) if rule['type'] == 'range']
+        self._not_null = [i for i, rule in enumerate(self.rules) if rule['type'] == 'not_null']
+        self._range_bounds = (
+            np.array([self.rules[i].get('min', -np.inf) for i in self._range], dtype='float64'),
+            np.array([self.rules[i].get('max', np.inf) for i in self._range], dtype='float64')
+        )
+        self._patterns = {
+            i: re.compile(rule['pattern']) for i, rule in enumerate(self.rules) if rule['type'] == 'regex'
+        }
+        self.reset()
+
+    def reset(self):
+        self.rows = 0
+        self.counts = np.zeros(len(self.rules), dtype=np.int64)
+        self.positions = []
+        self.matrices = []
+        self._seen = {i: FingerprintSet() for i, rule in enumerate(self.rules) if rule['type'] == 'unique'}
+
+    def evaluate(self, chunk):
+        matrix = np.zeros((len(chunk), len(self.rules)), dtype=bool)
+
+        if self._range:
+            columns = [self.rules[i]['column'] for i in self._range]
+            values = chunk[columns].to_numpy(dtype='float64')
+            lower, upper = self._range_bounds
+            matrix[:, self._range] = (values < lower) | (values > upper)
+
+        if self._not_null:
+            columns = [self.rules[i]['column'] for i in self._not_null]
+            matrix[:, self._not_null] = chunk[columns].isna().to_numpy()
+
+        for i, rule in enumerate(self.rules):
+            if rule['type'] == 'allowed':
+                values = chunk[rule['column']]
+                matrix[:, i] = (values.notna() & ~values.isin(rule['values'])).to_numpy()
+            elif rule['type'] == 'regex':
+                values = chunk[rule['column']]
+                matched = values.astype('string').str.fullmatch(self._patterns[i]).fillna(True)
+                matrix[:, i] = (values.notna() & ~matched).to_numpy(dtype=bool)
+            elif rule['type'] == 'unique':
+                columns = _rule_columns(rule)
+                present = chunk[columns].notna().all(axis=1).to_numpy()
+                duplicated = np.zeros(len(chunk), dtype=bool)
+                duplicated[present] = self._seen[i].mark_duplicates(row_fingerprints(chunk.loc[present, columns]))
+                matrix[:, i] = duplicated
+            elif rule['type'] == 'expression':
+                columns = _expression_columns(rule['expr'], chunk.columns)
+                result = chunk.eval(rule['expr'])
+                # Строки с пропуском в участвующих колонках не проверяются
+                matrix[:, i] = (~result.astype(bool) & chunk[columns].notna().all(axis=1)).to_numpy()
+
+        return matrix
+
+    def update(self, chunk):
+        matrix = self.evaluate(chunk)
+        violated = np.flatnonzero(matrix.any(axis=1))
+
+        self.counts += matrix.sum(axis=0)
+        self.positions.append(violated + self.rows)
+        self.matrices.append(matrix[violated])
+        self.rows += len(chunk)
+        return matrix
+
+    def report(self):
+        return RuleReport(self)
+
+    def check(self, data):
+        # DataFrame целиком или итератор чанков
+        self.reset()
+        for chunk in ([data] if isinstance(data, pd.DataFrame) else data):
+            self.update(chunk)
+        return self.report()
+
+
+class RuleReport:
+    # Компактный результат: сводка по правилам и матрица нарушений только
+    # для строк, нарушивших хотя бы одно правило (индекс - позиция строки)
+    def __init__(self, ruleset):
+        self.rows = ruleset.rows
+        positions = np.concatenate(ruleset.positions) if ruleset.positions else np.empty(0, dtype=np.int64)
+        matrix = np.vstack(ruleset.matrices) if ruleset.matrices else np.empty((0, len(ruleset.rules)), dtype=bool)
+
+        self.violations = pd.DataFrame(matrix, index=pd.Index(positions, name='row'), columns=ruleset.names)
+        self.summary = pd.DataFrame({
+            'type': [rule['type'] for rule in ruleset.rules],
+            'violations': ruleset.counts,
+            'rate': ruleset.counts / max(self.rows, 1)
+        }, index=pd.Index(ruleset.names, name='rule'))
+
+    @property
+    def failed(self):
+        return self.summary[self.summary['violations'] > 0]
+
+    def log(self):
+        if self.failed.empty:
+            logger.info(f"Все правила качества данных выполнены ({self.rows} строк)")
+            return
+        logger.warning(
+            f"Нарушены правила качества данных ({len(self.violations)} из {self.rows} строк):\n"
+            f"{self.failed.to_string()}"
+        )
+
+
+def validate_rules(data, rules):
+    columns = data.columns if isinstance(data, pd.DataFrame) else None
+    report = RuleSet(rules, columns).check(data)
+    report.log()
+    return report
@@ -0,0 +1,212 @@
+# running_stats.py
+import os
+import joblib
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import PATHS
+from sketches import KLLSketch
+from encoding import sparse_columns
+
+STATS_FILE = 'running_stats.joblib'
+
+
+def _merge_pairwise(a, b):
+    # Формулы Чана для матриц по парам колонок: mean[i, j] и m2[i, j] - среднее
+    # и сумма квадратов отклонений колонки i по строкам, где заполнены i и j
+    n = a['n'] + b['n']
+    safe_n = np.where(n > 0, n, 1)
+    weight = a['n'] * b['n'] / safe_n
+    delta = b['mean'] - a['mean']
+    return {
+        'n': n,
+        'mean': (a['n'] * a['mean'] + b['n'] * b['mean']) / safe_n,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * weight,
+        'c': a['c'] + b['c'] + delta * delta.T * weight
+    }
+
+
+def _merge_moments(a, b):
+    # Формула Чана для моментов по отдельным колонкам
+    n = a['n'] + b['n']
+    safe_n = np.where(n > 0, n, 1)
+    delta = b['mean'] - a['mean']
+    return {
+        'n': n,
+        'mean': (a['n'] * a['mean'] + b['n'] * b['mean']) / safe_n,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * a['n'] * b['n'] / safe_n
+    }
+
+
+def _batch_pairwise(values):
+    observed = ~np.isnan(values)
+    mask = observed.astype('float64')
+    filled = np.where(observed, values, 0.0)
+
+    # Сдвиг на средние партии уменьшает потерю точности в суммах квадратов
+    counts = mask.sum(axis=0)
+    shift = filled.sum(axis=0) / np.where(counts > 0, counts, 1)
+    centered = np.where(observed, filled - shift, 0.0)
+
+    n = mask.T @ mask
+    sums = centered.T @ mask
+    mean = sums / np.where(n > 0, n, 1)
+    return {
+        'n': n,
+        'mean': mean + shift[:, None],
+        'm2': (centered ** 2).T @ mask - mean * sums,
+        'c': centered.T @ centered - mean * sums.T
+    }
+
+
+class RunningStats:
+    # Объединяемые достаточные статистики по колонкам: число строк и пропусков,
+    # min/max, моменты (число значений, среднее, M2) и KLL-скетчи для квартилей.
+    # Для плотных колонок дополнительно хранятся матрицы средних, M2 и
+    # ко-моментов по парам колонок (попарная корреляция, как DataFrame.corr);
+    # разреженные колонки (one-hot, хеши) в матрицы k x k не входят
+    def __init__(self, columns, epsilon=None, sparse=None):
+        self.columns = list(columns)
+        self.sparse = [col for col in self.columns if col in set(sparse or [])]
+        self.dense = [col for col in self.columns if col not in self.sparse]
+        k, d = len(self.columns), len(self.dense)
+        self.epsilon = epsilon
+        self.rows = 0
+        self.nulls = np.zeros(k, dtype=np.int64)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        self.moments = {name: np.zeros(k) for name in ('n', 'mean', 'm2')}
+        self.pairwise = {name: np.zeros((d, d)) for name in ('n', 'mean', 'm2', 'c')}
+        self.sketches = [KLLSketch(epsilon, seed=i) for i in range(k)]
+
+    @classmethod
+    def from_frame(cls, df, columns=None, chunksize=100_000, epsilon=None):
+        stats = cls(columns if columns is not None else stat_columns(df), epsilon, sparse=sparse_columns(df))
+        for start in range(0, len(df), chunksize):
+            stats.update(df.iloc[start:start + chunksize])
+        return stats
+
+    def update(self, df):
+        if len(df) == 0:
+            return self
+        dense = df.reindex(columns=self.dense).to_numpy(dtype='float64', na_value=np.nan)
+        self.pairwise = _merge_pairwise(self.pairwise, _batch_pairwise(dense))
+
+        # Разреженные колонки уплотняются по одной
+        positions = {col: i for i, col in enumerate(self.dense)}
+        sparse = df.reindex(columns=self.sparse)
+        batch = {name: np.zeros(len(self.columns)) for name in ('n', 'mean', 'm2')}
+        for i, col in enumerate(self.columns):
+            if col in positions:
+                values = dense[:, positions[col]]
+            else:
+                values = sparse[col].to_numpy(dtype='float64', na_value=np.nan)
+            observed = values[~np.isnan(values)]
+            mean = observed.mean() if len(observed) else 0.0
+            batch['n'][i], batch['mean'][i] = len(observed), mean
+            batch['m2'][i] = ((observed - mean) ** 2).sum()
+
+            self.nulls[i] += len(values) - len(observed)
+            self.min[i] = np.fmin(self.min[i], np.fmin.reduce(values))
+            self.max[i] = np.fmax(self.max[i], np.fmax.reduce(values))
+            self.sketches[i].update(values)
+
+        self.rows += len(df)
+        self.moments = _merge_moments(self.moments, batch)
+        return self
+
+    def merge(self, other):
+        if other.columns != self.columns or other.sparse != self.sparse:
+            raise ValueError("Объединять можно только статистики по одинаковым колонкам")
+
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self.moments = _merge_moments(self.moments, other.moments)
+        self.pairwise = _merge_pairwise(self.pairwise, other.pairwise)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        return self
+
+    def count(self):
+        return pd.Series(self.moments['n'].astype('int64'), index=self.columns)
+
+    def mean(self):
+        return pd.Series(np.where(self.moments['n'] > 0, self.moments['mean'], np.nan), index=self.columns)
+
+    def std(self):
+        n = self.moments['n']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = np.where(n > 1, self.moments['m2'] / (n - 1), np.nan)
+        return pd.Series(np.sqrt(np.clip(variance, 0, None)), index=self.columns)
+
+    def missing(self):
+        return pd.Series(self.nulls, index=self.columns)
+
+    def quantiles(self, qs):
+        return pd.DataFrame(
+            {col: sketch.quantiles(qs) for col, sketch in zip(self.columns, self.sketches)},
+            index=qs
+        )
+
+    def describe(self, columns=None):
+        # Как DataFrame.describe(); квартили приближенные (KLL-скетчи)
+        columns = columns if columns is not None else self.columns
+        quartiles = self.quantiles([0.25, 0.5, 0.75])
+        described = pd.DataFrame({
+            'count': self.count().astype('float64'),
+            'mean': self.mean(),
+            'std': self.std(),
+            'min': pd.Series(np.where(self.count() > 0, self.min, np.nan), index=self.columns),
+            '25%': quartiles.loc[0.25],
+            '50%': quartiles.loc[0.5],
+            '75%': quartiles.loc[0.75],
+            'max': pd.Series(np.where(self.count() > 0, self.max, np.nan), index=self.columns)
+        }).T
+        return described[columns]
+
+    def corr(self):
+        m2 = self.pairwise['m2']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.pairwise['c'] / np.sqrt(m2 * m2.T)
+        corr = np.where(self.pairwise['n'] > 1, np.clip(corr, -1, 1), np.nan)
+        return pd.DataFrame(corr, index=self.dense, columns=self.dense)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        joblib.dump(self, tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path):
+        return joblib.load(path)
+
+
+def stat_columns(df):
+    # Числовые и bool-колонки, как у DataFrame.corr()
+    return [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_bool_dtype(df[col])]
+
+
+def update_running_stats(df, increment, path=None, rebuild=False):
+    # Накопленные статистики дополняются только новыми строками; если строки
+    # заменялись (число строк не сходится) или состав колонок изменился,
+    # статистики пересчитываются по всему набору
+    path = path or os.path.join(PATHS['data_output'], STATS_FILE)
+    stats = None
+    if not rebuild and os.path.exists(path):
+        stats = RunningStats.load(path)
+        if (stats.columns != stat_columns(df) or getattr(stats, 'sparse', None) != sparse_columns(df[stats.columns])
+                or stats.rows + len(increment) != len(df)):
+            logger.info("Накопленные статистики не соответствуют данным, пересчет по всему набору")
+            stats = None
+
+    if stats is None:
+        stats = RunningStats.from_frame(df)
+    else:
+        stats.update(increment)
+        logger.info(f"Статистики обновлены по {len(increment)} новым строкам")
+
+    stats.save(path)
+    return stats
@@ -0,0 +1,136 @@
+# schemas.py
+import sys
+import numpy as np
+import pandas as pd
+from loguru import logger
+from config import SCHEMAS
+
+
+CATEGORY_RATIO = 0.5
+
+
+def register_schema(name, schema):
+    SCHEMAS[name] = schema
+
+
+def get_schema(schema):
+    if schema is None or isinstance(schema, dict):
+        return schema
+    if schema not in SCHEMAS:
+        raise KeyError(f"Схема {schema} не зарегистрирована")
+    return SCHEMAS[schema]
+
+
+def csv_options(schema, header=None):
+    # Типы, которые парсер CSV создает сразу, без промежуточных int64/object колонок.
+    # Целые приводятся после чтения: колонка с пропусками не влезет в int32.
+    # Даты разбираются парсером только для колонок из заголовка файла (header),
+    # иначе read_csv падает на отсутствующей колонке
+    schema = get_schema(schema)
+    if schema is None:
+        return {}
+
+    options = {}
+    dtype = {
+        col: col_type for col, col_type in schema['columns'].items()
+        if col_type == 'category' or (col_type != 'datetime' and np.dtype(col_type).kind == 'f')
+    }
+    if dtype:
+        options['dtype'] = dtype
+    parse_dates = [
+        col for col, col_type in schema['columns'].items()
+        if col_type == 'datetime' and (header is None or col in header)
+    ]
+    if parse_dates:
+        options['parse_dates'] = parse_dates
+    return options
+
+
+def _convert(series, col_type):
+    if col_type == 'datetime':
+        return pd.to_datetime(series, errors='coerce')
+    if col_type == 'category':
+        return series.astype('category')
+
+    dtype = np.dtype(col_type)
+    if dtype.kind in 'iu' and series.isnull().any():
+        logger.warning(f"Колонка {series.name} содержит пропуски, вместо {col_type} используется float32")
+        return pd.to_numeric(series, errors='coerce').astype('float32')
+    if dtype.kind in 'iuf':
+        return pd.to_numeric(series, errors='coerce').astype(dtype)
+    return series.astype(dtype)
+
+
+def _auto_convert(series):
+    if pd.api.types.is_integer_dtype(series) and series.dtype.itemsize > 4:
+        info = np.iinfo(np.int32)
+        if series.empty or (series.min() >= info.min and series.max() <= info.max):
+            return series.astype('int32')
+    elif pd.api.types.is_float_dtype(series) and series.dtype.itemsize > 4:
+        return series.astype('float32')
+    elif series.dtype == 'object' and len(series) > 0:
+        if series.nunique(dropna=True) <= CATEGORY_RATIO * len(series):
+            return series.astype('category')
+    return series
+
+
+def _type_matches(series, col_type):
+    if col_type == 'datetime':
+        return pd.api.types.is_datetime64_any_dtype(series)
+    if col_type == 'category':
+        return isinstance(series.dtype, pd.CategoricalDtype)
+    return series.dtype == np.dtype(col_type)
+
+
+def apply_schema(df, schema):
+    schema = get_schema(schema)
+    if schema is None or df is None:
+        return df
+
+    # Колонки заменяются в неглубокой копии: исходная таблица вызывающего
+    # не меняется, а данные неизмененных колонок не копируются
+    df = df.copy(deep=False)
+    columns = schema['columns']
+    for col in df.columns:
+        if col in columns:
+            if _type_matches(df[col], columns[col]):
+                continue
+            df[col] = _convert(df[col], columns[col])
+        elif schema.get('auto'):
+            df[col] = _auto_convert(df[col])
+
+    return df
+
+
+def default_memory_usage(df):
+    # Оценка памяти при типах по умолчанию (int64/float64/object)
+    total = 0
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            if categories.dtype == 'object':
+                counts = series.value_counts(sort=False, dropna=False)
+                sizes = {value: sys.getsizeof(value) for value in counts.index}
+                total += 8 * len(series) + sum(sizes[value] * count for value, count in counts.items())
+            else:
+                total += 8 * len(series)
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            total += 8 * len(series)
+        else:
+            total += series.memory_usage(deep=True, index=False)
+    return total
+
+
+def log_memory_savings(df, source):
+    if df is None or df.empty:
+        return 0
+
+    actual = df.memory_usage(deep=True, index=False).sum()
+    default = default_memory_usage(df)
+    saved = default - actual
+    logger.info(
+        f"Источник {source}: {actual / 1024:.1f} КБ вместо {default / 1024:.1f} КБ "
+        f"по умолчанию (экономия {saved / max(default, 1):.0%})"
+    )
+    return saved
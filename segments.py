@@ -0,0 +1,211 @@
+# segments.py
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+import joblib
+from loguru import logger
+from config import SEGMENT_CONFIG
+
+
+# Меняется вместе с форматом частичных агрегатов, чтобы старый кэш не читался
+AGGREGATES_VERSION = 1
+STATS = ['count', 'mean', 'm2', 'min', 'max']
+
+
+def add_bands(df, bands):
+    # Интервальные сегменты (например, стаж) - категории [левая граница, правая)
+    columns = {}
+    for name, band in bands.items():
+        if band['column'] in df.columns:
+            columns[name] = pd.cut(df[band['column']], bins=band['bins'], labels=band.get('labels'), right=False)
+    return df.assign(**columns) if columns else df
+
+
+def group_codes(df, columns):
+    # Коды категорий всех колонок сегмента сводятся в один int64-код группы;
+    # строки с пропуском в любой из колонок в сегмент не попадают
+    codes = np.zeros(len(df), dtype=np.int64)
+    valid = np.ones(len(df), dtype=bool)
+    levels = []
+    for col in columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            column_codes, categories = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            column_codes, categories = pd.factorize(series)
+        valid &= column_codes >= 0
+        codes = codes * max(len(categories), 1) + column_codes
+        levels.append((series.dtype, categories))
+    return codes, valid, levels
+
+
+def decode_groups(group_codes_, columns, levels):
+    arrays = []
+    remainder = np.asarray(group_codes_, dtype=np.int64)
+    for dtype, categories in reversed(levels):
+        size = max(len(categories), 1)
+        positions = remainder % size
+        remainder = remainder // size
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Порядок категорий (интервалы стажа) сохраняется и в отчете
+            arrays.append(pd.Categorical.from_codes(positions, dtype=dtype))
+        else:
+            arrays.append(categories.take(positions))
+    arrays.reverse()
+    if len(arrays) == 1:
+        return pd.Index(arrays[0], name=columns[0])
+    return pd.MultiIndex.from_arrays(arrays, names=columns)
+
+
+def partition_aggregates(df, segments, metrics):
+    # Все метрики и все агрегаты сегмента - за один проход groupby по кодам групп
+    values = df[metrics].astype('float64')
+    result = {}
+    for name, columns in segments.items():
+        codes, valid, levels = group_codes(df, columns)
+        grouped = values[valid].groupby(codes[valid], sort=False)
+        aggregated = grouped.agg(['count', 'mean', 'var', 'min', 'max'])
+        index = decode_groups(aggregated.index, columns, levels)
+
+        part = {'rows': pd.Series(grouped.size().to_numpy(), index=index)}
+        for stat in ['count', 'mean', 'min', 'max']:
+            part[stat] = aggregated.xs(stat, axis=1, level=1).set_axis(index)
+        # Сумма квадратов отклонений складывается между частями (формула Чана)
+        part['m2'] = (aggregated.xs('var', axis=1, level=1) * (part['count'].to_numpy() - 1)).fillna(0).set_axis(index)
+        result[name] = part
+    return result
+
+
+def merge_aggregates(parts):
+    levels = list(range(parts[0]['rows'].index.nlevels))
+    stacked = {stat: pd.concat([part[stat] for part in parts]) for stat in ['rows'] + STATS}
+
+    def by_group(frame):
+        return frame.groupby(level=levels, sort=True, observed=True)
+
+    count = by_group(stacked['count']).sum()
+    mean = by_group(stacked['count'] * stacked['mean'].fillna(0)).sum() / count.where(count > 0)
+    group_mean = mean.fillna(0).reindex(stacked['mean'].index).to_numpy()
+    spread = stacked['count'] * (stacked['mean'].fillna(0) - group_mean) ** 2
+
+    return {
+        'rows': by_group(stacked['rows']).sum(),
+        'count': count,
+        'mean': mean,
+        'm2': by_group(stacked['m2']).sum() + by_group(spread).sum(),
+        'min': by_group(stacked['min']).min(),
+        'max': by_group(stacked['max']).max()
+    }
+
+
+def segment_table(aggregates):
+    # Плоские колонки для листа отчета: rows, salary_count, salary_mean, ...
+    count = aggregates['count']
+    std = np.sqrt(aggregates['m2'] / (count - 1).where(count > 1))
+    table = pd.DataFrame({'rows': aggregates['rows']})
+    for metric in count.columns:
+        table[f'{metric}_count'] = count[metric]
+        table[f'{metric}_mean'] = aggregates['mean'][metric]
+        table[f'{metric}_std'] = std[metric]
+        table[f'{metric}_min'] = aggregates['min'][metric]
+        table[f'{metric}_max'] = aggregates['max'][metric]
+    return table
+
+
+def partition_key(df, params):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps({'version': AGGREGATES_VERSION, **params}, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class SegmentCache:
+    # Частичные агрегаты по частям входных данных: файл <ключ>.joblib, где
+    # ключ - отпечаток содержимого части и настроек сегментов
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.joblib')
+
+    def get(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            return joblib.load(path)
+        except Exception as e:
+            logger.warning(f"Кэш сегментов поврежден, часть будет пересчитана: {str(e)}")
+            return None
+
+    def put(self, key, aggregates):
+        tmp_path = self._path(key) + '.tmp'
+        joblib.dump(aggregates, tmp_path)
+        os.replace(tmp_path, self._path(key))
+
+    def evict(self, keep):
+        stale = [name for name in os.listdir(self.directory)
+                 if name.endswith('.joblib') and name[:-len('.joblib')] not in keep]
+        for name in stale:
+            os.remove(os.path.join(self.directory, name))
+        if stale:
+            logger.info(f"Удалено устаревших частей кэша сегментов: {len(stale)}")
+        return stale
+
+
+def analyze_segments(df, segments=None, metrics=None, bands=None, partition_rows=None, directory=None, use_cache=True):
+    try:
+        segments = segments if segments is not None else SEGMENT_CONFIG['segments']
+        metrics = metrics if metrics is not None else SEGMENT_CONFIG['metrics']
+        bands = bands if bands is not None else SEGMENT_CONFIG['bands']
+        partition_rows = partition_rows or SEGMENT_CONFIG['partition_rows']
+
+        available = set(df.columns) | {name for name, band in bands.items() if band['column'] in df.columns}
+        skipped = [name for name, columns in segments.items() if not set(columns) <= available]
+        if skipped:
+            logger.info(f"Сегменты без колонок в данных пропущены: {skipped}")
+        segments = {name: columns for name, columns in segments.items() if name not in skipped}
+        metrics = [col for col in metrics if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+
+        if df.empty or not segments or not metrics:
+            logger.warning("Нет данных или сегментов для аналитики по сегментам")
+            return {}
+
+        used_bands = {name: band for name, band in bands.items()
+                      if any(name in columns for columns in segments.values())}
+        used_columns = list(dict.fromkeys(
+            [col for columns in segments.values() for col in columns if col not in used_bands]
+            + [band['column'] for band in used_bands.values()] + metrics
+        ))
+        params = {'segments': segments, 'metrics': metrics, 'bands': used_bands}
+
+        cache = SegmentCache(directory or SEGMENT_CONFIG['directory']) if use_cache else None
+        keys, parts, hits = [], [], 0
+        for start in range(0, len(df), partition_rows):
+            partition = df.iloc[start:start + partition_rows][used_columns]
+            aggregates = None
+            if cache is not None:
+                key = partition_key(partition, params)
+                keys.append(key)
+                aggregates = cache.get(key)
+            if aggregates is None:
+                aggregates = partition_aggregates(add_bands(partition, used_bands), segments, metrics)
+                if cache is not None:
+                    cache.put(key, aggregates)
+            else:
+                hits += 1
+            parts.append(aggregates)
+
+        if cache is not None:
+            cache.evict(set(keys))
+
+        result = {name: segment_table(merge_aggregates([part[name] for part in parts])) for name in segments}
+        logger.info(f"Аналитика по сегментам: {len(result)} сегментов, частей {len(parts)}, из кэша {hits}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Ошибка при аналитике по сегментам: {str(e)}")
+        return {}
@@ -0,0 +1,148 @@
+# sketches.py
+import numpy as np
+import pandas as pd
+from config import VALIDATION_CONFIG
+from profiling import profile_numeric
+
+
+class KLLSketch:
+    # KLL-скетч квантилей: ошибка ранга ~epsilon * n, память O(1 / epsilon),
+    # скетчи по чанкам или процессам объединяются через merge()
+
+    def __init__(self, epsilon=None, seed=None):
+        self.epsilon = epsilon or VALIDATION_CONFIG['quantile_epsilon']
+        self.k = max(8, int(np.ceil(3.0 / self.epsilon)))
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            # Половина отсортированных пар (случайно четные или нечетные)
+            # поднимается на уровень выше с удвоенным весом
+            items = np.sort(self.levels[level])
+            odd = len(items) % 2
+            offset = self._rng.integers(2)
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[odd + offset::2]])
+            self.levels[level] = items[:odd]
+            level = 0
+
+    def update(self, values):
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError("Объединять можно только скетчи с одинаковой точностью")
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        qs = np.atleast_1d(np.asarray(qs, dtype='float64'))
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items_), 2 ** level) for level, items_ in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+
+        # Ранг считается так же, как у Series.quantile: (n - 1) * q
+        ranks = (self.count - 1) * qs
+        result = items[np.searchsorted(cumulative, ranks, side='right').clip(0, len(items) - 1)]
+        result[qs <= 0] = self.min
+        result[qs >= 1] = self.max
+        return result
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+
+def build_sketches(df, columns=None, epsilon=None, seed=None):
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns
+    return {col: KLLSketch(epsilon, seed).update(df[col].to_numpy(dtype='float64')) for col in columns}
+
+
+def merge_sketches(parts):
+    merged = {}
+    for sketches in parts:
+        for col, sketch in sketches.items():
+            if col in merged:
+                merged[col].merge(sketch)
+            else:
+                merged[col] = sketch
+    return merged
+
+
+def iqr_bounds(sketch):
+    q1, q3 = sketch.quantiles([0.25, 0.75])
+    return q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+
+
+def compare_outlier_methods(df, columns=None, epsilon=None, chunksize=None, seed=0):
+    # Расхождение IQR-выбросов по скетчам (собранным по чанкам и объединенным)
+    # с точным методом
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns
+    columns = list(columns)
+    chunksize = chunksize or max(1, len(df))
+
+    parts = [
+        build_sketches(df.iloc[start:start + chunksize], columns, epsilon, seed + i)
+        for i, start in enumerate(range(0, len(df), chunksize))
+    ]
+    sketches = merge_sketches(parts)
+    profile = profile_numeric(df, columns)
+
+    rows = []
+    for col in columns:
+        values = df[col]
+        lower, upper = iqr_bounds(sketches[col])
+        approx_count = int(((values < lower) | (values > upper)).sum())
+        exact_count = int(profile.loc[col, 'iqr_outliers'])
+        rows.append({
+            'column': col,
+            'exact_lower': profile.loc[col, 'iqr_lower'],
+            'sketch_lower': lower,
+            'exact_upper': profile.loc[col, 'iqr_upper'],
+            'sketch_upper': upper,
+            'exact_outliers': exact_count,
+            'sketch_outliers': approx_count,
+            'difference': approx_count - exact_count,
+            'relative_difference': abs(approx_count - exact_count) / max(len(values), 1)
+        })
+
+    return pd.DataFrame(rows).set_index('column')
@@ -0,0 +1,91 @@
+# snapshots.py
+import json
+import os
+import time
+import pandas as pd
+import pyarrow as pa
+from loguru import logger
+from config import PATHS
+from encoding import sparse_columns
+
+
+def _snapshot_paths(name, directory):
+    directory = directory or PATHS['data_output']
+    return os.path.join(directory, f'{name}.arrow'), os.path.join(directory, f'{name}.manifest.json')
+
+
+def save_snapshot(df, name='cleaned', directory=None):
+    try:
+        data_path, manifest_path = _snapshot_paths(name, directory)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+        df = df.rename(columns=str)
+        # Arrow не хранит разреженные колонки: они пишутся плотными, а их тип
+        # запоминается в манифесте и восстанавливается при загрузке
+        sparse = {col: [str(df[col].dtype.subtype), float(df[col].dtype.fill_value)] for col in sparse_columns(df)}
+        df = df.astype({col: df[col].dtype.subtype for col in sparse})
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        # Без сжатия: только так файл можно отобразить в память без копирования
+        tmp_path = data_path + '.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, data_path)
+
+        manifest = {
+            'name': name,
+            'file': os.path.basename(data_path),
+            'format': 'arrow-ipc',
+            'rows': table.num_rows,
+            'columns': {field.name: str(field.type) for field in table.schema},
+            'sparse': sparse,
+            'bytes': os.path.getsize(data_path),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+        logger.info(f"Снимок {name} сохранен: {manifest['rows']} строк, {manifest['bytes'] / 1024:.1f} КБ")
+        return manifest
+
+    except Exception as e:
+        logger.error(f"Ошибка при сохранении снимка {name}: {str(e)}")
+        return None
+
+
+def read_manifest(name='cleaned', directory=None):
+    _, manifest_path = _snapshot_paths(name, directory)
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def open_snapshot(name='cleaned', columns=None, directory=None):
+    data_path, _ = _snapshot_paths(name, directory)
+    if not os.path.exists(data_path):
+        raise FileNotFoundError(f"Снимок {data_path} не найден")
+
+    # Буферы таблицы ссылаются на отображенный файл, данные не читаются целиком
+    source = pa.memory_map(data_path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def load_snapshot(name='cleaned', columns=None, directory=None):
+    try:
+        table = open_snapshot(name, columns, directory)
+        df = table.to_pandas(split_blocks=True)
+        sparse = read_manifest(name, directory).get('sparse', {})
+        df = df.astype({col: pd.SparseDtype(subtype, fill_value)
+                        for col, (subtype, fill_value) in sparse.items() if col in df.columns})
+        logger.info(f"Снимок {name} загружен: {len(df)} строк, {len(df.columns)} колонок")
+        return df
+    except FileNotFoundError as e:
+        logger.error(f"Ошибка при загрузке снимка: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f"Ошибка при загрузке снимка: {str(e)}")
+        return None
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+import excel_cache
+from config import CACHE_CONFIG
+
+
+@pytest.fixture(autouse=True)
+def excel_cache_dir(tmp_path, monkeypatch):
+    # Кэш Excel-файлов в тестах пишется во временный каталог, а не в data/cache/
+    monkeypatch.setitem(CACHE_CONFIG, 'excel_dir', str(tmp_path / 'excel_cache'))
+    monkeypatch.setattr(excel_cache, '_default_cache', None)
+
+
+@pytest.fixture
+def make_employees():
+    # Синтетический набор сотрудников для тестов на больших данных;
+    # missing - доля пропусков в числовых колонках, department и region
+    def make(rows=1000, seed=0, missing=0.0):
+        rng = np.random.default_rng(seed)
+        df = pd.DataFrame({
+            'age': rng.integers(20, 60, rows).astype('float64'),
+            'salary': rng.normal(50000, 10000, rows),
+            'experience': rng.integers(0, 40, rows).astype('float64'),
+            'projects': rng.poisson(5, rows).astype('float64'),
+            'department': rng.choice(['IT', 'HR', 'Ops'], rows),
+            'region': rng.choice(['North', 'South'], rows),
+            'city': rng.integers(0, 200, rows).astype(str),
+            'comment': [f"text {i}" for i in range(rows)],
+            'remote': rng.random(rows) < 0.3
+        })
+        if missing:
+            columns = ['age', 'salary', 'experience', 'projects', 'department', 'region']
+            df[columns] = df[columns].mask(rng.random((rows, len(columns))) < missing)
+        return df
+    return make
@@ -0,0 +1,95 @@
+# tests/test_api_loader.py
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import pytest
+from data_loader import load_api_paginated
+
+RECORDS = [{'id': i, 'user': {'name': f'user{i}'}} for i in range(23)]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+
+        if url.path == '/items':
+            offset, limit = int(query['offset']), int(query['limit'])
+            if offset == 5 and hits == 1:
+                self.send_json(503, {'error': 'busy'})
+            elif offset == 10 and hits == 1:
+                self.send_json(429, {'error': 'slow down'})
+            else:
+                self.send_json(200, RECORDS[offset:offset + limit])
+        elif url.path == '/cursor':
+            position = int(query.get('after', 0))
+            next_position = position + 10
+            self.send_json(200, {
+                'data': RECORDS[position:next_position],
+                'next': str(next_position) if next_position < len(RECORDS) else None
+            })
+        else:
+            self.send_json(500, {'error': 'always broken'})
+
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.lock = threading.Lock()
+    server.connections = set()
+    server.hits = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_offset_pagination_with_retries(api_server):
+    server, base_url = api_server
+
+    df = load_api_paginated(base_url + '/items', params={'limit': 5, 'offset': 0},
+                            max_concurrency=2, backoff=0.01)
+
+    assert df['id'].tolist() == list(range(23))
+    assert df['user.name'].iloc[22] == 'user22'
+    assert len(server.connections) <= 2
+
+
+def test_cursor_pagination(api_server):
+    server, base_url = api_server
+
+    df = load_api_paginated(base_url + '/cursor', records_key='data',
+                            cursor_param='after', cursor_key='next')
+
+    assert df['id'].tolist() == list(range(23))
+
+
+def test_retries_exhausted_returns_none(api_server):
+    server, base_url = api_server
+
+    df = load_api_paginated(base_url + '/broken', params={'limit': 5},
+                            max_retries=2, backoff=0.01, max_concurrency=1)
+
+    assert df is None
+    assert sum(server.hits.values()) == 3
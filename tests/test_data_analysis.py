@@ -1,9 +1,12 @@
 
 # tests/test_data_analysis.py
+import os
 import pytest
 import pandas as pd
 import numpy as np
 from data_loader import detect_outliers_iqr, detect_outliers_zscore
+from outliers import combine_reports
+from data_analysis import visualize_data
 from loguru import logger
 
 def calculate_statistics(df):
@@ -98,5 +101,37 @@ def test_calculate_statistics_multiple_columns():
     assert stats['values2']['mean'] == 30
 
 
+def test_outlier_report_is_index_based():
+    df = pd.DataFrame({
+        'a': [1, 2, 3, 4, 100, 2, 3],
+        'b': [10, 11, 10, -50, 12, 11, 10],
+        'label': list('abcdefg')
+    })
+
+    iqr = detect_outliers_iqr(df)
+    zscore = detect_outliers_zscore(df, threshold=2)
+
+    assert iqr.counts().to_dict() == {'a': 1, 'b': 1}
+    assert iqr.positions['a'].tolist() == [4]
+    assert iqr.mask('b').tolist() == [False, False, False, True, False, False, False]
+    assert iqr['a']['label'].tolist() == ['e']
+    assert 'z_score' not in df.columns
+    assert zscore['b']['z_score'].iloc[0] < -2
+
+    combined = combine_reports(iqr, zscore)
+    assert combined.any_mask().sum() == 2
+    assert combined.flagged_rows()['label'].tolist() == ['d', 'e']
+
+
+def test_visualize_data(tmp_path):
+    df = pd.DataFrame({
+        'salary': np.random.default_rng(0).normal(50000, 10000, 200),
+        'department_IT': [True, False] * 100
+    })
+
+    assert visualize_data(df, str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ['manifest.json', 'salary_distribution.png']
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,7 +1,23 @@
 import os
 import pandas as pd
 import pytest
-from data_loader import load_excel, load_api, validate_data, clean_data
+import sqlalchemy
+from data_loader import (
+    load_excel,
+    load_api,
+    load_csv,
+    validate_data,
+    clean_data,
+    validate_data_chunked,
+    clean_data_chunked,
+    load_sql,
+    create_database_connection,
+    dispose_engines,
+    iter_excel_chunks,
+    load_excel_sheets
+)
+from config import IMPUTATION_CONFIG, ENCODING_CONFIG
+from encoding import sparse_columns
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -49,3 +65,133 @@ def test_load_api():
 def test_load_excel_invalid_path():
     with pytest.raises(FileNotFoundError):
         load_excel('non_existent_file.xlsx')
+
+
+def make_streaming_csv(tmp_path):
+    df = pd.DataFrame({
+        'id': [1, 2, 3, 4, 5, 6, 2, 8, 9, 10, 11, 3],
+        'age': [25, 30, None, 41, 38, 29, 30, 95, 33, 27, 36, None],
+        'salary': [500, 520, 480, 510, 9000, 505, 520, 495, 515, 490, 530, 480],
+        'department': ['HR', 'IT', 'IT', None, 'HR', 'Sales', 'IT', 'IT', 'HR', 'Sales', 'IT', 'IT']
+    })
+    path = tmp_path / 'stream.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_load_csv_chunked(tmp_path):
+    path = make_streaming_csv(tmp_path)
+
+    chunks = list(load_csv(str(path), chunksize=5))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), load_csv(str(path)))
+
+
+def test_validate_data_chunked_matches_full(tmp_path):
+    path = make_streaming_csv(tmp_path)
+
+    df = load_csv(str(path))
+    _, expected = validate_data(df.copy())
+    report = validate_data_chunked(str(path), chunksize=4, max_values=2)
+
+    assert report['rows'] == 12
+    assert report['missing_values'] == expected['missing_values']
+    assert report['duplicates'] == df.duplicated().sum() == 2
+    assert report['outliers'] == expected['outliers']
+    assert report['missing_by_column'] == {'age': 2, 'department': 1}
+
+
+def test_clean_data_chunked_matches_full(tmp_path, monkeypatch):
+    path = make_streaming_csv(tmp_path)
+    # Потоковая очистка заполняет числовые пропуски медианой за один проход
+    monkeypatch.setitem(IMPUTATION_CONFIG, 'numeric', 'median')
+
+    expected = clean_data(load_csv(str(path)))
+    chunks = clean_data_chunked(str(path), chunksize=5, max_values=3)
+    result = pd.concat(list(chunks), ignore_index=True)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_clean_data_chunked_uses_sparse_encoding(tmp_path, monkeypatch):
+    path = make_streaming_csv(tmp_path)
+    monkeypatch.setitem(IMPUTATION_CONFIG, 'numeric', 'median')
+    # department (3 значения) кодируется разреженно
+    monkeypatch.setitem(ENCODING_CONFIG, 'dense_max_categories', 2)
+
+    expected = clean_data(load_csv(str(path)))
+    result = pd.concat(list(clean_data_chunked(str(path), chunksize=5)), ignore_index=True)
+
+    assert sparse_columns(result) == ['department_IT', 'department_Sales']
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'employees.db'}"
+    engine = sqlalchemy.create_engine(url)
+    pd.DataFrame({
+        'id': range(1, 26),
+        'salary': [1000.0 * i for i in range(1, 26)]
+    }).to_sql('employees', engine, index=False)
+    engine.dispose()
+    yield url
+    dispose_engines()
+
+
+def test_database_engine_is_reused(sqlite_url):
+    engine = create_database_connection(sqlite_url)
+    assert create_database_connection(sqlite_url) is engine
+    assert engine.pool.size() == 5
+
+
+def test_load_sql_streaming(sqlite_url):
+    chunks = load_sql(
+        "SELECT * FROM employees WHERE salary > :min_salary ORDER BY id",
+        chunksize=10,
+        db_url=sqlite_url,
+        params={'min_salary': 2000}
+    )
+    chunks = list(chunks)
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 3]
+    assert pd.concat(chunks)['id'].tolist() == list(range(3, 26))
+
+
+def test_load_sql_full(sqlite_url):
+    df = load_sql("SELECT * FROM employees", db_url=sqlite_url)
+    assert len(df) == 25
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    path = tmp_path / 'book.xlsx'
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'id': range(25), 'name': [f'n{i}' for i in range(25)]}).to_excel(
+            writer, sheet_name='employees', index=False)
+        pd.DataFrame({'id': [1, 2], 'salary': [10.5, 20.5]}).to_excel(
+            writer, sheet_name='salaries', index=False)
+        pd.DataFrame({'code': ['a']}).to_excel(writer, sheet_name='codes', index=False)
+    return str(path)
+
+
+def test_iter_excel_chunks(workbook_path):
+    chunks = list(iter_excel_chunks(workbook_path, 'employees', chunksize=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True),
+        pd.read_excel(workbook_path, sheet_name='employees')
+    )
+
+
+def test_load_excel_sheets(workbook_path):
+    sheets = load_excel_sheets(workbook_path, max_workers=2, chunksize=7)
+
+    assert list(sheets) == ['employees', 'salaries', 'codes']
+    for name, df in sheets.items():
+        pd.testing.assert_frame_equal(df, pd.read_excel(workbook_path, sheet_name=name))
+
+    subset = load_excel_sheets(workbook_path, ['codes'], max_workers=1)
+    assert list(subset) == ['codes']
+    assert load_excel(workbook_path, sheet_name='salaries')['salary'].tolist() == [10.5, 20.5]
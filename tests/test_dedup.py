@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+from dedup import Deduplicator, FingerprintSet, row_fingerprints
+from data_loader import validate_data, validate_data_chunked
+
+
+def make_batch(ids, salary=1000.0):
+    return pd.DataFrame({
+        'id': ids,
+        'salary': [salary] * len(ids),
+        'department': ['IT'] * len(ids)
+    })
+
+
+def test_fingerprints_ignore_numeric_dtype():
+    ints = pd.DataFrame({'id': [1, 2], 'name': ['a', 'b']})
+    floats = pd.DataFrame({'id': [1.0, 2.0], 'name': pd.Categorical(['a', 'b'])})
+
+    assert (row_fingerprints(ints) == row_fingerprints(floats)).all()
+
+
+def test_fingerprint_set_marks_batch_and_seen_duplicates():
+    seen = FingerprintSet()
+
+    assert seen.mark_duplicates(np.array([5, 3, 5], dtype=np.uint64)).tolist() == [False, False, True]
+    assert seen.mark_duplicates(np.array([3, 7], dtype=np.uint64)).tolist() == [True, False]
+    assert seen.hashes.tolist() == [3, 5, 7]
+
+
+def test_deduplicator_persists_between_runs(tmp_path):
+    first = Deduplicator('rows', directory=str(tmp_path))
+    assert len(first.filter(make_batch([1, 2, 3]))) == 3
+    first.save()
+
+    second = Deduplicator('rows', directory=str(tmp_path))
+    result = second.filter(make_batch([3, 4]))
+
+    assert result['id'].tolist() == [4]
+    assert len(second) == 4
+
+
+def test_deduplicator_key_columns():
+    deduplicator = Deduplicator(key_columns=['id'])
+    deduplicator.filter(make_batch([1, 2]))
+
+    chunks = [make_batch([2, 3], salary=2000.0), make_batch([3, 4])]
+    result = pd.concat(deduplicator.filter_chunks(chunks))
+
+    assert result['id'].tolist() == [3, 4]
+
+
+def test_validate_data_reports_rows_seen_before(tmp_path):
+    deduplicator = Deduplicator('rows', directory=str(tmp_path))
+    validate_data(make_batch([1, 2]), deduplicator)
+
+    df, report = validate_data(make_batch([2, 3]), deduplicator)
+
+    assert report['seen_before'] == 1
+    assert df['id'].tolist() == [3]
+
+
+def test_validate_data_chunked_across_runs(tmp_path):
+    path = tmp_path / 'batch.csv'
+    make_batch([1, 2, 2, 3]).to_csv(path, index=False)
+    deduplicator = Deduplicator()
+    deduplicator.filter(make_batch([1]))
+
+    report = validate_data_chunked(str(path), chunksize=2, deduplicator=deduplicator)
+
+    assert report['duplicates'] == 2
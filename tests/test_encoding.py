@@ -0,0 +1,63 @@
+import pandas as pd
+import scipy.sparse
+from config import ENCODING_CONFIG
+from data_loader import clean_data
+from encoding import choose_encodings, encode_features, hash_column, sparse_columns
+from ml_models import train_regression_model
+from pipeline import CleaningPipeline
+
+COLUMNS = ['salary', 'age', 'department', 'city', 'comment']
+
+
+def test_encoding_chosen_by_cardinality(make_employees):
+    df = make_employees(3000)
+
+    encodings = choose_encodings(df, ['department', 'city', 'comment'], {'department': 'codes'})
+
+    assert encodings == {'department': 'codes', 'city': 'sparse', 'comment': 'hash'}
+
+
+def test_hashing_has_fixed_width():
+    first = hash_column(pd.Series(['a', 'b', None], name='comment'))
+    second = hash_column(pd.Series(['zzz'], name='comment'))
+
+    assert list(first.columns) == list(second.columns)
+    assert len(first.columns) == ENCODING_CONFIG['hash_width']
+    assert first.sum(axis=1).tolist() == [1.0, 1.0, 0.0]
+
+
+def test_encode_features_codes_use_fitted_categories():
+    df = pd.DataFrame({'department': ['HR', 'Sales', None]})
+    categories = {'department': pd.Index(['HR', 'IT'])}
+
+    encoded = encode_features(df, {'department': 'codes'}, categories)
+
+    assert encoded['department'].tolist() == [0, -1, -1]
+
+
+def test_clean_data_keeps_high_cardinality_sparse(make_employees):
+    df = make_employees(3000)[COLUMNS]
+
+    cleaned = clean_data(df.copy())
+    sparse = sparse_columns(cleaned)
+
+    assert 'department_IT' in cleaned.columns
+    assert len([col for col in sparse if col.startswith('comment_hash_')]) == ENCODING_CONFIG['hash_width']
+    assert all(col in sparse for col in cleaned.columns if col.startswith('city_'))
+    assert cleaned[sparse].max().max() <= 1.0
+
+    # Весь результат clean_data: плотные bool-dummies вместе с разреженными
+    model, metrics = train_regression_model(cleaned, 'salary')
+    features = model.named_steps['preprocessor'].transform(cleaned.drop(columns=['salary']))
+    assert scipy.sparse.issparse(features)
+
+
+def test_pipeline_matches_clean_data_with_sparse_columns(make_employees):
+    df = make_employees(500)[COLUMNS]
+
+    expected = clean_data(df.copy())
+    pipeline = CleaningPipeline()
+    result = pipeline.fit_transform(df.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(pipeline.transform(df.head(10)).columns) == list(expected.columns)
@@ -0,0 +1,106 @@
+# tests/test_excel_cache.py
+import os
+import shutil
+import pandas as pd
+import pytest
+import data_loader
+from excel_cache import ExcelCache
+from data_loader import load_excel
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SAMPLE_XLSX = os.path.join(PROJECT_ROOT, 'data', 'input', 'sample_data.xlsx')
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / 'sample_data.xlsx'
+    shutil.copy(SAMPLE_XLSX, path)
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ExcelCache(cache_dir=str(tmp_path / 'cache'))
+    monkeypatch.setattr(data_loader, 'get_excel_cache', lambda: cache)
+    return cache
+
+
+def forbid_read_excel(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Excel не должен перечитываться")
+    monkeypatch.setattr(pd, 'read_excel', fail)
+
+
+def test_second_load_served_from_cache(workbook, cache, monkeypatch):
+    expected = load_excel(workbook)
+    assert cache.size() > 0
+
+    forbid_read_excel(monkeypatch)
+    pd.testing.assert_frame_equal(load_excel(workbook), expected)
+
+
+def test_touched_file_with_same_content_stays_cached(workbook, cache, monkeypatch):
+    load_excel(workbook)
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    forbid_read_excel(monkeypatch)
+    assert load_excel(workbook) is not None
+
+
+def test_changed_file_is_reparsed(workbook, cache):
+    load_excel(workbook)
+    pd.DataFrame({'id': [1, 2], 'age': [30, 40]}).to_excel(workbook, index=False)
+
+    df = load_excel(workbook)
+    assert list(df.columns) == ['id', 'age']
+    assert len(df) == 2
+
+
+def test_invalidate_and_eviction(workbook, tmp_path):
+    cache = ExcelCache(cache_dir=str(tmp_path / 'cache'))
+    df = pd.read_excel(workbook)
+
+    assert cache.put(workbook, df)
+    assert cache.invalidate(workbook) == 1
+    assert cache.get(workbook) is None
+
+    small_cache = ExcelCache(cache_dir=str(tmp_path / 'small'), max_size_mb=1e-6)
+    small_cache.put(workbook, df)
+    assert small_cache.size() == 0
+    assert small_cache.get(workbook) is None
+
+
+def test_concurrent_writers_keep_each_others_entries(tmp_path):
+    paths = []
+    for i in range(2):
+        path = str(tmp_path / f'book{i}.xlsx')
+        pd.DataFrame({'id': [i]}).to_excel(path, index=False)
+        paths.append(path)
+
+    # Два процесса с одним каталогом кэша: индекс каждого прочитан до записи другого
+    first = ExcelCache(cache_dir=str(tmp_path / 'cache'))
+    second = ExcelCache(cache_dir=str(tmp_path / 'cache'))
+    first.put(paths[0], pd.read_excel(paths[0]))
+    second.put(paths[1], pd.read_excel(paths[1]))
+
+    reloaded = ExcelCache(cache_dir=str(tmp_path / 'cache'))
+    assert len(reloaded.index) == 2
+    assert reloaded.get(paths[0])['id'].tolist() == [0]
+
+
+def test_parallel_load_files_indexes_every_workbook(tmp_path):
+    from config import CACHE_CONFIG
+    from ingestion import load_files
+
+    # Каталог кэша по умолчанию указывает во временный (tests/conftest.py)
+    paths = []
+    for i in range(4):
+        path = str(tmp_path / f'book{i}.xlsx')
+        pd.DataFrame({'id': [i]}).to_excel(path, index=False)
+        paths.append(path)
+
+    df, _ = load_files(paths, max_workers=4)
+
+    assert sorted(df['id'].tolist()) == [0, 1, 2, 3]
+    assert len(ExcelCache(cache_dir=CACHE_CONFIG['excel_dir']).index) == 4
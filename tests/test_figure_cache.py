@@ -0,0 +1,76 @@
+import os
+import numpy as np
+import plots
+from config import APP_SETTINGS, VISUALIZATION_CONFIG
+from figure_cache import FigureCache, histogram_fingerprint
+from plots import render_histograms, histogram_data
+
+
+COLUMNS = ['age', 'salary', 'projects']
+
+
+def counting_renderer(monkeypatch):
+    rendered = []
+    original = plots.render_histogram
+
+    def render(col, data, path):
+        rendered.append(col)
+        return original(col, data, path)
+
+    monkeypatch.setitem(APP_SETTINGS, 'max_workers', 1)
+    monkeypatch.setattr(plots, 'render_histogram', render)
+    return rendered
+
+
+def test_fingerprint_depends_on_histogram_and_params():
+    values = np.arange(1000, dtype='float64') % 37
+    data = histogram_data(values)
+
+    # Порядок строк и значения внутри бинов картинку не меняют
+    assert histogram_fingerprint(histogram_data(values[::-1]), {'bins': 10}) == histogram_fingerprint(data, {'bins': 10})
+    assert histogram_fingerprint(data, {'bins': 10}) != histogram_fingerprint(data, {'bins': 20})
+    assert histogram_fingerprint(data, {'bins': 10}) != histogram_fingerprint(histogram_data(values + 1), {'bins': 10})
+
+
+def test_unchanged_columns_are_not_rerendered(tmp_path, monkeypatch, make_employees):
+    rendered = counting_renderer(monkeypatch)
+    df = make_employees(300)[COLUMNS]
+
+    render_histograms(df, str(tmp_path))
+    assert sorted(rendered) == ['age', 'projects', 'salary']
+
+    # Те же распределения в другом порядке строк берутся из кэша
+    rendered.clear()
+    df = df.iloc[::-1].reset_index(drop=True)
+    render_histograms(df, str(tmp_path))
+    assert rendered == []
+
+    df.loc[0, 'salary'] = 1_000_000
+    paths = render_histograms(df, str(tmp_path))
+
+    assert rendered == ['salary']
+    assert len(paths) == 3
+
+
+def test_params_change_and_missing_file_trigger_render(tmp_path, monkeypatch, make_employees):
+    rendered = counting_renderer(monkeypatch)
+    df = make_employees(300)[COLUMNS]
+    render_histograms(df, str(tmp_path))
+
+    rendered.clear()
+    os.remove(tmp_path / 'age_distribution.png')
+    monkeypatch.setitem(VISUALIZATION_CONFIG, 'kde_points', 50)
+    render_histograms(df, str(tmp_path))
+
+    assert sorted(rendered) == ['age', 'projects', 'salary']
+
+
+def test_stale_images_are_evicted(tmp_path, monkeypatch, make_employees):
+    counting_renderer(monkeypatch)
+    df = make_employees(300)[COLUMNS]
+    render_histograms(df, str(tmp_path))
+
+    render_histograms(df.drop(columns=['projects']), str(tmp_path))
+
+    assert not (tmp_path / 'projects_distribution.png').exists()
+    assert sorted(FigureCache(str(tmp_path)).manifest) == ['age_distribution.png', 'salary_distribution.png']
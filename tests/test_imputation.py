@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import imputation
+from imputation import impute_missing, knn_impute, resolve_strategies
+
+
+def reference_knn(X, k):
+    # Прямой перебор: k ближайших полных строк по наблюдаемым колонкам
+    result = X.copy()
+    complete = X[~np.isnan(X).any(axis=1)]
+    for i, row in enumerate(X):
+        missing = np.isnan(row)
+        if not missing.any():
+            continue
+        distances = np.sqrt(((complete[:, ~missing] - row[~missing]) ** 2).sum(axis=1))
+        nearest = np.argsort(distances, kind='stable')[:k]
+        result[i, missing] = complete[nearest][:, missing].mean(axis=0)
+    return result
+
+
+def test_knn_impute_matches_brute_force():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, 4))
+    X[rng.random(X.shape) < 0.1] = np.nan
+    expected = reference_knn(X, 5)
+
+    result = knn_impute(X.copy(), n_neighbors=5, chunksize=37, n_jobs=1)
+
+    assert not np.isnan(result).any()
+    np.testing.assert_allclose(result, expected)
+
+
+def test_knn_skips_complete_frames(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("поиск соседей не нужен")
+
+    monkeypatch.setattr(imputation, 'NearestNeighbors', fail)
+    df = pd.DataFrame({'age': [25.0, 30.0], 'salary': [1000.0, 2000.0]})
+
+    assert impute_missing(df) is df
+
+
+def test_knn_falls_back_to_median_without_complete_rows():
+    X = np.array([[1.0, np.nan], [np.nan, 4.0], [3.0, np.nan]])
+
+    result = knn_impute(X, n_neighbors=5)
+
+    np.testing.assert_allclose(result, [[1.0, 4.0], [2.0, 4.0], [3.0, 4.0]])
+
+
+def test_per_column_strategies():
+    df = pd.DataFrame({
+        'age': [20.0, np.nan, 40.0, 50.0],
+        'salary': [1.0, 2.0, np.nan, 100.0],
+        'projects': [np.nan, 1.0, 2.0, 3.0],
+        'department': ['IT', None, 'IT', 'HR']
+    })
+    strategies = {'age': 'mean', 'salary': 'median', 'projects': ('constant', 0)}
+
+    assert resolve_strategies(df, strategies)['department'] == 'mode'
+    result = impute_missing(df, strategies)
+
+    assert result.loc[1, 'age'] == df['age'].mean()
+    assert result.loc[2, 'salary'] == 2.0
+    assert result.loc[0, 'projects'] == 0
+    assert result.loc[1, 'department'] == 'IT'
@@ -0,0 +1,123 @@
+# tests/test_incremental.py
+import os
+import pandas as pd
+import pytest
+import sqlalchemy
+from data_loader import dispose_engines
+from dedup import Deduplicator
+from incremental import ingest_incremental, WatermarkStore, SOURCE_COLUMN
+
+# Слияние с накопленным набором не должно писать в срез снимка
+pytestmark = pytest.mark.filterwarnings('error::pandas.errors.SettingWithCopyWarning')
+
+
+def write_csv(path, ids):
+    pd.DataFrame({'id': ids, 'value': [i * 10 for i in ids]}).to_csv(path, index=False)
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    directory = tmp_path / 'input'
+    directory.mkdir()
+    write_csv(directory / 'a.csv', [1, 2])
+    write_csv(directory / 'b.csv', [3])
+    return directory
+
+
+def test_directory_source_reloads_only_changed_files(input_dir, tmp_path):
+    sources = [{'name': 'files', 'type': 'directory', 'path': str(input_dir), 'patterns': ['*.csv']}]
+    output = str(tmp_path / 'output')
+
+    merged, increment, _ = ingest_incremental(sources, directory=output)
+    assert sorted(merged['id']) == [1, 2, 3]
+
+    merged, increment, _ = ingest_incremental(sources, directory=output)
+    assert increment.empty
+    assert sorted(merged['id']) == [1, 2, 3]
+
+    write_csv(input_dir / 'b.csv', [3, 4])
+    os.remove(input_dir / 'a.csv')
+    merged, increment, _ = ingest_incremental(sources, directory=output)
+    assert sorted(increment['id']) == [3, 4]
+    assert sorted(merged['id']) == [3, 4]
+
+    merged, increment, _ = ingest_incremental(sources, full_refresh=True, directory=output)
+    assert sorted(increment['id']) == [3, 4]
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'events.db'}"
+    yield url
+    dispose_engines()
+
+
+def test_sql_source_upserts_rows_after_watermark(sqlite_url, tmp_path):
+    engine = sqlalchemy.create_engine(sqlite_url)
+    pd.DataFrame({
+        'id': [1, 2],
+        'status': ['new', 'new'],
+        'updated_at': ['2024-01-01 10:00:00', '2024-01-01 11:00:00']
+    }).to_sql('events', engine, index=False)
+
+    sources = [{
+        'name': 'events', 'type': 'sql', 'db_url': sqlite_url, 'query': 'SELECT * FROM events',
+        'watermark_column': 'updated_at', 'key': 'id'
+    }]
+    output = str(tmp_path / 'output')
+
+    ingest_incremental(sources, directory=output)
+    assert WatermarkStore(output).load() == {'events': '2024-01-01 11:00:00'}
+
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text(
+            "UPDATE events SET status = 'done', updated_at = '2024-01-02 09:00:00' WHERE id = 1"
+        ))
+        connection.execute(sqlalchemy.text(
+            "INSERT INTO events VALUES (3, 'new', '2024-01-02 10:00:00')"
+        ))
+    engine.dispose()
+
+    merged, increment, _ = ingest_incremental(sources, directory=output)
+
+    assert sorted(increment['id']) == [1, 3]
+    merged = merged.sort_values('id')
+    assert merged['id'].tolist() == [1, 2, 3]
+    assert merged['status'].tolist() == ['done', 'new', 'new']
+    assert (merged[SOURCE_COLUMN] == 'events').all()
+
+
+def test_failed_source_keeps_rows_and_watermark(input_dir, tmp_path):
+    output = str(tmp_path / 'output')
+    good = {'name': 'files', 'type': 'directory', 'path': str(input_dir), 'patterns': ['*.csv']}
+    ingest_incremental([good], directory=output)
+    watermarks = WatermarkStore(output).load()
+
+    broken = {'name': 'files', 'type': 'sql', 'query': 'SELECT 1', 'db_url': 'sqlite:///' + str(tmp_path)}
+    merged, _, report = ingest_incremental([broken], directory=output)
+
+    assert report[0]['status'] == 'error'
+    assert sorted(merged['id']) == [1, 2, 3]
+    assert WatermarkStore(output).load() == watermarks
+
+
+def test_rows_ingested_before_are_dropped(input_dir, tmp_path):
+    sources = [{'name': 'files', 'type': 'directory', 'path': str(input_dir), 'patterns': ['*.csv']}]
+    output = str(tmp_path / 'output')
+    deduplicator = Deduplicator('ingested', directory=output)
+    ingest_incremental(sources, directory=output, deduplicator=deduplicator)
+
+    # Новый файл повторяет уже загруженные строки
+    write_csv(input_dir / 'c.csv', [1, 5])
+    deduplicator = Deduplicator('ingested', directory=output)
+    merged, increment, _ = ingest_incremental(sources, directory=output, deduplicator=deduplicator)
+    assert increment['id'].tolist() == [5]
+    assert sorted(merged['id']) == [1, 2, 3, 5]
+
+    # Перезаписанный файл с тем же содержимым заменяет свои строки, а не теряет их
+    write_csv(input_dir / 'a.csv', [1, 2])
+    os.utime(input_dir / 'a.csv', ns=(0, 0))
+    deduplicator = Deduplicator('ingested', directory=output)
+    merged, increment, _ = ingest_incremental(sources, directory=output, deduplicator=deduplicator)
+    assert sorted(increment['id']) == [1, 2]
+    assert sorted(merged['id']) == [1, 2, 3, 5]
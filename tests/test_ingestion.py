@@ -0,0 +1,102 @@
+# tests/test_ingestion.py
+import os
+import time
+import pandas as pd
+import ingestion
+from ingestion import ingest_sources, discover_files, load_files, align_frames
+from config import SCHEMAS
+
+
+def make_csv(tmp_path, name, rows):
+    path = tmp_path / f'{name}.csv'
+    pd.DataFrame({'id': range(rows), 'source': name}).to_csv(path, index=False)
+    return {'name': name, 'type': 'csv', 'path': str(path)}
+
+
+def test_ingest_sources_concatenates_in_order(tmp_path):
+    sources = [make_csv(tmp_path, 'first', 3), make_csv(tmp_path, 'second', 2)]
+
+    df, report = ingest_sources(sources, max_workers=2)
+
+    assert df['source'].tolist() == ['first'] * 3 + ['second'] * 2
+    assert df.index.tolist() == list(range(5))
+    assert [entry['rows'] for entry in report] == [3, 2]
+    assert all(entry['status'] == 'ok' for entry in report)
+
+
+def test_failed_source_does_not_stop_others(tmp_path):
+    sources = [
+        {'name': 'missing', 'type': 'excel', 'path': str(tmp_path / 'missing.xlsx')},
+        {'name': 'unknown', 'type': 'ftp'},
+        make_csv(tmp_path, 'good', 4)
+    ]
+
+    df, report = ingest_sources(sources)
+
+    assert len(df) == 4
+    assert [entry['status'] for entry in report] == ['error', 'error', 'ok']
+    assert 'не найден' in report[0]['error']
+
+
+def test_sources_run_concurrently(monkeypatch):
+    def slow_source(source):
+        time.sleep(0.2)
+        return pd.DataFrame({'id': [source['name']]})
+
+    monkeypatch.setattr(ingestion, 'load_source', slow_source)
+    sources = [{'name': str(i), 'type': 'csv'} for i in range(4)]
+
+    start_time = time.perf_counter()
+    df, report = ingest_sources(sources, max_workers=4)
+
+    assert time.perf_counter() - start_time < 0.6
+    assert df['id'].tolist() == ['0', '1', '2', '3']
+    assert all(entry['seconds'] >= 0.2 for entry in report)
+
+
+def test_no_sources():
+    df, report = ingest_sources([])
+    assert df.empty
+    assert report == []
+
+
+def make_input_dir(tmp_path):
+    input_dir = tmp_path / 'input'
+    input_dir.mkdir()
+    pd.DataFrame({'id': [1, 2], 'department': ['HR', 'IT']}).to_csv(input_dir / 'a.csv', index=False)
+    pd.DataFrame({'id': [3], 'department': ['Sales'], 'age': [40]}).to_excel(input_dir / 'b.xlsx', index=False)
+    (input_dir / 'notes.txt').write_text('не данные')
+    (input_dir / 'broken.csv').write_bytes(b'')
+    return input_dir
+
+
+def test_discover_files(tmp_path):
+    input_dir = make_input_dir(tmp_path)
+
+    paths = discover_files(str(input_dir), ['*.csv', '*.xlsx'])
+
+    assert [os.path.basename(path) for path in paths] == ['a.csv', 'b.xlsx', 'broken.csv']
+
+
+def test_load_files_parallel_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setitem(SCHEMAS, 'bulk', {'columns': {'department': 'category'}, 'auto': False})
+    paths = discover_files(str(make_input_dir(tmp_path)), ['*.csv', '*.xlsx'])
+
+    parallel_df, report = load_files(paths, schema='bulk', max_workers=3)
+    sequential_df, _ = load_files(paths, schema='bulk', max_workers=1)
+
+    pd.testing.assert_frame_equal(parallel_df, sequential_df)
+    assert parallel_df['id'].tolist() == [1, 2, 3]
+    assert list(parallel_df.columns) == ['id', 'department', 'age']
+    assert isinstance(parallel_df['department'].dtype, pd.CategoricalDtype)
+    assert [entry['status'] for entry in report] == ['ok', 'ok', 'error']
+
+
+def test_align_frames_unions_categories():
+    first = pd.DataFrame({'kind': pd.Categorical(['a', 'b'])})
+    second = pd.DataFrame({'kind': pd.Categorical(['c']), 'value': [1.5]})
+
+    df = pd.concat(align_frames([first, second]), ignore_index=True)
+
+    assert list(df['kind'].cat.categories) == ['a', 'b', 'c']
+    assert df['value'].isnull().sum() == 2
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from data_loader import clean_data, clean_data_low_memory
+from memory import MemoryTracker
+
+
+NUMERIC = ['age', 'salary', 'experience', 'projects']
+
+
+def test_low_memory_matches_clean_data(make_employees):
+    df = make_employees(2000, missing=0.02)[NUMERIC + ['department', 'remote']]
+
+    expected = clean_data(df.copy())
+    result, report = clean_data_low_memory(df)
+
+    assert list(result.columns) == list(expected.columns)
+    assert result['age'].dtype == np.float32
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, atol=1e-5)
+    assert report['step'].tolist() == ['float32', 'impute', 'encode', 'normalize', 'assemble']
+
+
+def test_low_memory_stays_close_to_input_size():
+    # Широкая таблица: временные буферы одной колонки малы относительно блока
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(100_000, 10))).add_prefix('col')
+    df = df.mask(rng.random(df.shape) < 0.02)
+    strategies = {col: 'median' for col in df.columns}
+
+    result, report = clean_data_low_memory(df, strategies)
+
+    assert not result.isnull().any().any()
+    # 1.5 - сам float32-блок; сверх него на шаге impute живут только маска
+    # и наблюдаемые значения одной колонки (1/20 входа при 10 колонках)
+    assert report['peak_ratio'].max() < 1.58
+
+
+def test_memory_tracker_records_allocations():
+    with MemoryTracker(1000) as tracker:
+        with tracker.step('allocate'):
+            data = np.ones(100_000)
+
+    record = tracker.report().iloc[0]
+    assert record['allocated'] >= data.nbytes
+    assert record['peak_ratio'] > 1
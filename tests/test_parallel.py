@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+from config import APP_SETTINGS
+from data_loader import normalize_data, detect_outliers_iqr, detect_outliers_zscore
+from imputation import impute_missing
+
+
+NUMERIC = ['age', 'salary', 'experience', 'projects']
+
+
+def serial_and_parallel(monkeypatch, func, df):
+    monkeypatch.setitem(APP_SETTINGS, 'max_workers', 1)
+    expected = func(df.copy())
+    monkeypatch.setitem(APP_SETTINGS, 'max_workers', 2)
+    monkeypatch.setitem(APP_SETTINGS, 'parallel_min_cells', 0)
+    return expected, func(df.copy())
+
+
+def test_parallel_normalize_matches_serial(monkeypatch, make_employees):
+    df = make_employees(2000, missing=0.05)[NUMERIC]
+    expected, result = serial_and_parallel(monkeypatch, normalize_data, df)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parallel_fill_matches_serial(monkeypatch, make_employees):
+    # projects - целые значения с повторами, для них mode отличается от mean
+    strategies = {'age': 'median', 'salary': 'mean', 'experience': ('constant', -1.0), 'projects': 'mode'}
+    df = make_employees(2000, missing=0.05)[NUMERIC]
+
+    expected, result = serial_and_parallel(monkeypatch, lambda frame: impute_missing(frame, strategies), df)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parallel_outliers_match_serial(monkeypatch, make_employees):
+    df = make_employees(2000, missing=0.05)[NUMERIC]
+
+    def detect(frame):
+        return detect_outliers_iqr(frame, method='exact'), detect_outliers_zscore(frame, threshold=3)
+
+    (iqr, zscore), (parallel_iqr, parallel_zscore) = serial_and_parallel(monkeypatch, detect, df)
+
+    for col in df.columns:
+        np.testing.assert_array_equal(parallel_iqr.positions[col], iqr.positions[col])
+        np.testing.assert_array_equal(parallel_zscore.positions[col], zscore.positions[col])
+        np.testing.assert_allclose(parallel_zscore.rows(col)['z_score'], zscore.rows(col)['z_score'])
+
+
+def test_parallel_keeps_float32_and_int_columns(monkeypatch, make_employees):
+    # float32 остается float32; целые колонки без пропусков не заполняются,
+    # а после масштабирования становятся float64, как и в последовательной ветке
+    df = make_employees(2000, missing=0.05)[NUMERIC].astype({'age': 'float32', 'salary': 'float32'})
+    df['projects'] = df['projects'].fillna(0).astype('int64')
+    strategies = {'age': 'median', 'salary': 'mean', 'experience': 'mean', 'projects': 'mode'}
+
+    for func in [lambda frame: impute_missing(frame, strategies), normalize_data]:
+        expected, result = serial_and_parallel(monkeypatch, func, df)
+        pd.testing.assert_frame_equal(result, expected)
+
+    filled = impute_missing(df.copy(), strategies)
+    assert filled.dtypes.to_dict() == df.dtypes.to_dict()
+    normalized = normalize_data(df.copy())
+    assert normalized['salary'].dtype == 'float32'
+    assert normalized['projects'].dtype == 'float64'
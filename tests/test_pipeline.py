@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_loader import clean_data
+from pipeline import CleaningPipeline
+
+
+COLUMNS = ['age', 'salary', 'department']
+
+
+def test_fit_transform_matches_clean_data(make_employees):
+    df = make_employees(200, missing=0.1)[COLUMNS]
+
+    expected = clean_data(df.copy())
+    result = CleaningPipeline().fit_transform(df.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_transform_keeps_layout_and_scale(tmp_path, make_employees):
+    pipeline = CleaningPipeline().fit(make_employees(200, missing=0.1)[COLUMNS])
+    path = tmp_path / 'cleaning_pipeline.joblib'
+    pipeline.save(path)
+    loaded = CleaningPipeline.load(path)
+
+    batch = pd.DataFrame({
+        'department': ['Sales', 'IT'],
+        'age': [np.nan, 30.0],
+        'extra': [1, 2]
+    })
+    result = clean_data(batch, loaded)
+
+    assert list(result.columns) == pipeline.columns_
+    assert not result.isnull().any().any()
+    assert not result.loc[0, ['department_IT', 'department_Ops']].any()
+    assert result.loc[1, 'age'] == pytest.approx((30.0 - pipeline.min_[0]) / pipeline.range_[0])
+
+
+def test_transform_requires_fit():
+    with pytest.raises(ValueError):
+        CleaningPipeline().transform(pd.DataFrame({'age': [30.0], 'department': ['IT']}))
@@ -0,0 +1,42 @@
+import os
+import numpy as np
+import pandas as pd
+from config import APP_SETTINGS
+from plots import histogram_data, is_dummy, plot_columns, render_histograms
+
+
+def test_dummy_columns_are_skipped():
+    df = pd.DataFrame({
+        'age': [25, 30, 41, 38],
+        'salary': [500.0, 520.0, 480.0, 9000.0],
+        'department_IT': [True, False, True, True],
+        'flag': [0.0, 1.0, 1.0, 0.0],
+        'name': ['x'] * 4
+    })
+
+    assert is_dummy(df['department_IT'])
+    assert is_dummy(df['flag'])
+    assert plot_columns(df) == ['age', 'salary']
+
+
+def test_histogram_data_matches_numpy():
+    values = np.random.default_rng(1).normal(size=5_000)
+
+    data = histogram_data(np.append(values, np.nan))
+
+    expected, edges = np.histogram(values, bins='auto')
+    np.testing.assert_array_equal(data['counts'], expected)
+    np.testing.assert_allclose(data['edges'], edges)
+    # KDE в масштабе счетчиков: площадь под кривой примерно равна числу значений
+    area = np.trapezoid(data['density'], data['grid']) / (edges[1] - edges[0])
+    assert abs(area - len(values)) / len(values) < 0.02
+
+
+def test_render_histograms_in_pool(tmp_path, monkeypatch, make_employees):
+    monkeypatch.setitem(APP_SETTINGS, 'max_workers', 2)
+    df = make_employees(500)[['age', 'salary', 'remote', 'department']]
+
+    paths = render_histograms(df, str(tmp_path))
+
+    assert sorted(os.path.basename(path) for path in paths) == ['age_distribution.png', 'salary_distribution.png']
+    assert all(os.path.getsize(path) > 0 for path in paths)
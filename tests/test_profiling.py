@@ -0,0 +1,68 @@
+# tests/test_profiling.py
+import numpy as np
+import pandas as pd
+import pytest
+from profiling import profile_numeric
+from data_loader import validate_data
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(rng.standard_t(3, size=(1000, 3)), columns=['a', 'b', 'c'])
+    df.loc[rng.random(1000) < 0.1, 'b'] = np.nan
+    df['constant'] = 5
+    df['empty'] = np.nan
+    df['label'] = 'x'
+    return df
+
+
+def test_profile_matches_pandas(frame):
+    profile = profile_numeric(frame)
+
+    assert list(profile.index) == ['a', 'b', 'c', 'constant', 'empty']
+    for col in profile.index:
+        series = frame[col]
+        q1, q3 = series.quantile(0.25), series.quantile(0.75)
+        iqr = q3 - q1
+
+        assert profile.loc[col, 'nulls'] == series.isnull().sum()
+        assert np.isclose(profile.loc[col, 'mean'], series.mean(), equal_nan=True)
+        assert np.isclose(profile.loc[col, 'std'], series.std(), equal_nan=True)
+        assert np.isclose(profile.loc[col, 'q1'], q1, equal_nan=True)
+        assert np.isclose(profile.loc[col, 'q3'], q3, equal_nan=True)
+        assert profile.loc[col, 'iqr_outliers'] == ((series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)).sum()
+
+    assert profile.loc['constant', 'zscore_outliers'] == 0
+    assert profile.loc['a', 'zscore_outliers'] == (abs(frame['a'] - frame['a'].mean()) > 3 * frame['a'].std()).sum()
+
+
+def test_profile_does_not_modify_input(frame):
+    before = frame.copy()
+    profile_numeric(frame)
+    pd.testing.assert_frame_equal(frame, before)
+
+
+def test_validate_data_report_uses_profile(frame):
+    _, report = validate_data(frame)
+
+    assert report['outliers'] == report['profile']['iqr_outliers'].sum()
+    assert report['outliers'] > 0
+
+
+def test_profile_without_numeric_columns():
+    profile = profile_numeric(pd.DataFrame({'label': ['a', 'b']}))
+    assert profile.empty
+
+
+def test_profile_and_validate_empty_frame(frame):
+    empty = frame.iloc[0:0]
+    profile = profile_numeric(empty)
+
+    assert (profile['count'] == 0).all()
+    assert (profile['iqr_outliers'] == 0).all()
+    assert profile['mean'].isnull().all()
+
+    df, report = validate_data(empty)
+    assert df is not None
+    assert report['outliers'] == 0
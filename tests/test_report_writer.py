@@ -0,0 +1,72 @@
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+from data_analysis import generate_report
+from report_writer import data_sheet_names, write_report
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4, 5, 6, 7],
+        'salary': [np.nan, 1000.5, 2001.0, np.nan, 4002.0, 5002.5, np.nan],
+        'department': pd.Categorical(['IT', 'HR', 'IT', 'HR', 'IT', 'HR', 'IT']),
+        'hired': pd.date_range('2024-01-01', periods=7, freq='D')
+    })
+
+
+def test_write_report_round_trip(tmp_path, frame):
+    df = frame
+    path = str(tmp_path / 'report.xlsx')
+
+    stats = write_report(df, {'Статистика': df.describe()}, path=path)
+
+    result = pd.read_excel(path, sheet_name='Данные')
+    pd.testing.assert_frame_equal(result, df, check_dtype=False, check_categorical=False)
+    assert stats['sheets'] == ['Данные', 'Статистика']
+    assert stats['rows_per_sec'] > 0
+
+
+def test_large_data_split_across_sheets(tmp_path, frame):
+    df = frame
+    path = str(tmp_path / 'report.xlsx')
+
+    stats = write_report(df, path=path, rows_per_sheet=3)
+
+    assert stats['sheets'] == ['Данные', 'Данные_2', 'Данные_3']
+    parts = pd.read_excel(path, sheet_name=stats['sheets'])
+    result = pd.concat([parts[name] for name in stats['sheets']], ignore_index=True)
+    pd.testing.assert_frame_equal(result, df, check_dtype=False, check_categorical=False)
+
+
+def test_sheet_names_for_excel_limit():
+    assert data_sheet_names('Данные', 2_500_000, 1_048_575) == ['Данные', 'Данные_2', 'Данные_3']
+    assert data_sheet_names('Данные', 0, 1_048_575) == ['Данные']
+
+
+def test_sidecar_is_linked_from_workbook(tmp_path, frame):
+    df = frame
+    path = str(tmp_path / 'report.xlsx')
+
+    stats = write_report(df, path=path, sidecar='parquet')
+
+    assert stats['sidecar'] == str(tmp_path / 'report_data.parquet')
+    pd.testing.assert_frame_equal(pd.read_parquet(stats['sidecar']), df, check_categorical=False)
+    cell = openpyxl.load_workbook(path)['Данные']['A1']
+    assert cell.hyperlink.target == 'report_data.parquet'
+
+
+def test_generate_report_writes_analysis_sheets(tmp_path, frame):
+    df = frame[['id', 'salary']]
+    analysis = {
+        'basic_stats': df.describe(),
+        'correlations': df.corr(),
+        'salary_stats': {'mean_salary': df['salary'].mean()}
+    }
+    path = str(tmp_path / 'final_report.xlsx')
+
+    assert generate_report(df, analysis, path=path)
+    assert openpyxl.load_workbook(path, read_only=True).sheetnames == ['Данные', 'Статистика', 'Корреляции', 'Зарплаты']
+    stats = pd.read_excel(path, sheet_name='Статистика', index_col=0)
+    assert stats.loc['count', 'id'] == len(df)
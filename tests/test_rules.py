@@ -0,0 +1,86 @@
+import os
+import pandas as pd
+import pytest
+from data_loader import load_csv, validate_data, validate_data_chunked
+from rules import RuleSet, validate_rules
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SAMPLE_CSV = os.path.join(PROJECT_ROOT, 'data', 'input', 'sample_data.csv')
+
+RULES = [
+    {'type': 'not_null', 'column': 'id'},
+    {'type': 'unique', 'column': 'id'},
+    {'type': 'range', 'column': 'age', 'min': 18, 'max': 75},
+    {'type': 'allowed', 'column': 'gender', 'values': ['Male', 'Female']},
+    {'type': 'regex', 'column': 'email', 'pattern': r"[\w.]+@[\w.]+"},
+    {'name': 'experience_vs_age', 'type': 'expression', 'expr': 'experience <= age - 14'}
+]
+
+
+def make_frame():
+    return pd.DataFrame({
+        'id': [1, 2, 2, None, 5],
+        'age': [30, 16, 40, None, 50],
+        'experience': [5, 1, 30, 3, 10],
+        'gender': ['Male', 'Female', 'Other', None, 'Female'],
+        'email': ['a@b.ru', 'bad', 'c@d.ru', None, 'e@f.ru']
+    })
+
+
+def test_violation_matrix_and_summary():
+    report = RuleSet(RULES).check(make_frame())
+
+    assert report.summary['violations'].tolist() == [1, 1, 1, 1, 1, 1]
+    assert report.violations.index.tolist() == [1, 2, 3]
+    assert report.violations.loc[1].tolist() == [False, False, True, False, True, False]
+    assert report.violations.loc[2, 'experience_vs_age']
+    assert report.violations.loc[2, 'id:unique']
+    assert report.violations.loc[3, 'id:not_null']
+
+
+def test_chunks_give_same_result_as_whole_frame():
+    df = make_frame()
+
+    whole = RuleSet(RULES).check(df)
+    chunked = RuleSet(RULES).check(df.iloc[i:i + 2] for i in range(0, len(df), 2))
+
+    pd.testing.assert_frame_equal(chunked.summary, whole.summary)
+    pd.testing.assert_frame_equal(chunked.violations, whole.violations)
+
+
+def test_rules_for_missing_columns_are_skipped():
+    df = make_frame().drop(columns=['email'])
+
+    report = validate_rules(df, RULES)
+
+    assert 'email:regex' not in report.summary.index
+    assert report.rows == len(df)
+
+
+def test_expression_rules_for_missing_columns_are_skipped():
+    # Инкремент из API без experience и age
+    df = make_frame().drop(columns=['experience', 'age'])
+
+    _, report = validate_data(df, rules=RULES)
+
+    assert report is not None
+    assert 'experience_vs_age' not in report['rules'].summary.index
+    assert 'id:unique' in report['rules'].summary.index
+
+
+def test_unknown_rule_type():
+    with pytest.raises(ValueError):
+        RuleSet([{'type': 'between', 'column': 'age'}])
+
+
+def test_validate_data_with_config_rules(tmp_path):
+    df = load_csv(SAMPLE_CSV)
+    df.loc[0, 'experience'] = 60
+    path = tmp_path / 'employees.csv'
+    df.to_csv(path, index=False)
+
+    _, report = validate_data(df, rules='employees')
+    chunked = validate_data_chunked(str(path), chunksize=30, rules='employees')
+
+    assert report['rules'].summary.loc['experience_vs_age', 'violations'] >= 1
+    pd.testing.assert_frame_equal(chunked['rules'].summary, report['rules'].summary)
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from running_stats import RunningStats, update_running_stats
+from data_analysis import analyze_data
+
+
+NUMERIC = ['age', 'salary', 'experience', 'projects']
+
+
+@pytest.fixture
+def frame(make_employees):
+    return make_employees(2000, missing=0.1)[NUMERIC + ['remote', 'department']]
+
+
+def test_running_stats_match_pandas(frame):
+    df = frame
+    stats = RunningStats.from_frame(df, chunksize=300)
+
+    expected = df.corr(numeric_only=True)
+    pd.testing.assert_frame_equal(stats.corr(), expected, atol=1e-10)
+
+    described = stats.describe(NUMERIC)
+    reference = df[NUMERIC].describe()
+    for row in ['count', 'mean', 'std', 'min', 'max']:
+        np.testing.assert_allclose(described.loc[row], reference.loc[row], rtol=1e-10)
+    # Квартили приближенные (KLL-скетч): проверяется ошибка по рангу
+    for q in [0.25, 0.5, 0.75]:
+        row = described.loc[f'{int(q * 100)}%']
+        low = df[NUMERIC].quantile(q - 0.02, interpolation='lower')
+        high = df[NUMERIC].quantile(q + 0.02, interpolation='higher')
+        assert ((row >= low) & (row <= high)).all()
+
+    assert stats.missing().to_dict() == df[stats.columns].isnull().sum().to_dict()
+
+
+def test_merge_of_halves_equals_full(frame):
+    df = frame
+    full = RunningStats.from_frame(df)
+    first = RunningStats.from_frame(df.iloc[:700])
+    first.merge(RunningStats.from_frame(df.iloc[700:]))
+
+    assert first.rows == full.rows
+    pd.testing.assert_frame_equal(first.corr(), full.corr(), atol=1e-12)
+    np.testing.assert_allclose(first.std(), full.std(), rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        first.merge(RunningStats(['age']))
+
+
+def test_update_running_stats_incremental_and_rebuild(tmp_path, frame):
+    path = tmp_path / 'running_stats.joblib'
+    df = frame
+    old, new = df.iloc[:1500], df.iloc[1500:]
+
+    update_running_stats(old, old, path=path)
+    stats = update_running_stats(df, new, path=path)
+    assert stats.rows == len(df)
+    pd.testing.assert_frame_equal(stats.corr(), df.corr(numeric_only=True), atol=1e-10)
+
+    # Замена строк: число строк не сходится, статистики пересчитываются
+    replaced = pd.concat([df.iloc[:1000], new])
+    stats = update_running_stats(replaced, new, path=path)
+    assert stats.rows == len(replaced)
+    pd.testing.assert_frame_equal(stats.corr(), replaced.corr(numeric_only=True), atol=1e-10)
+
+
+def test_analyze_data_uses_running_stats(frame):
+    df = frame
+    stats = RunningStats.from_frame(df)
+    analysis = analyze_data(df, stats)
+
+    assert analysis['salary_stats']['mean_salary'] == pytest.approx(df['salary'].mean())
+    assert analysis['salary_stats']['max_salary'] == df['salary'].max()
+    assert analysis['missing_values'].to_dict() == df.isnull().sum().to_dict()
+    assert list(analysis['basic_stats'].columns) == ['age', 'salary', 'experience', 'projects']
+
+
+def test_sparse_columns_keep_only_column_moments(frame):
+    # Разреженные колонки (one-hot, хеши) не входят в матрицы по парам колонок
+    df = frame.assign(
+        dept_IT=pd.arrays.SparseArray((frame['department'] == 'IT').astype('float32'), fill_value=0),
+        dept_HR=pd.arrays.SparseArray((frame['department'] == 'HR').astype('float32'), fill_value=0)
+    )
+    stats = RunningStats.from_frame(df, chunksize=300)
+
+    assert stats.sparse == ['dept_IT', 'dept_HR']
+    assert stats.pairwise['n'].shape == (5, 5)
+    assert list(stats.corr().columns) == NUMERIC + ['remote']
+
+    dense = df[['dept_IT', 'dept_HR']].sparse.to_dense()
+    reference = dense.describe()
+    described = stats.describe(['dept_IT', 'dept_HR'])
+    for row in ['count', 'mean', 'std', 'min', 'max']:
+        np.testing.assert_allclose(described.loc[row], reference.loc[row], rtol=1e-6)
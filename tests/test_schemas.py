@@ -0,0 +1,82 @@
+# tests/test_schemas.py
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from data_loader import load_excel, load_csv, clean_data
+from schemas import apply_schema, log_memory_savings, csv_options
+from config import SCHEMAS
+from ml_models import train_regression_model
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SAMPLE_XLSX = os.path.join(PROJECT_ROOT, 'data', 'input', 'sample_data.xlsx')
+SAMPLE_CSV = os.path.join(PROJECT_ROOT, 'data', 'input', 'sample_data.csv')
+EVENTS = {
+    'columns': {'count': 'int32', 'created': 'datetime', 'kind': 'category'},
+    'auto': False
+}
+
+
+def test_load_excel_applies_schema():
+    df = load_excel(SAMPLE_XLSX, use_cache=False, schema='employees')
+
+    assert df['id'].dtype == 'int32'
+    assert df['salary'].dtype == 'float32'
+    assert isinstance(df['department'].dtype, pd.CategoricalDtype)
+    assert log_memory_savings(df, 'sample_data.xlsx') > 0
+
+
+def test_load_csv_schema_matches_default_values():
+    default_df = load_csv(SAMPLE_CSV)
+    df = load_csv(SAMPLE_CSV, schema='employees')
+
+    assert df['age'].dtype == 'int32'
+    assert df.memory_usage(deep=True).sum() < default_df.memory_usage(deep=True).sum()
+    pd.testing.assert_frame_equal(df.astype(default_df.dtypes.to_dict()), default_df)
+
+
+def test_schema_conversions(monkeypatch):
+    monkeypatch.setitem(SCHEMAS, 'events', EVENTS)
+    source = pd.DataFrame({
+        'count': [1, None, 3],
+        'created': ['2024-01-01', '2024-01-02', 'не дата'],
+        'kind': ['a', 'b', 'a'],
+        'comment': ['x', 'x', 'x']
+    })
+
+    df = apply_schema(source, 'events')
+
+    # Исходная таблица не меняется
+    assert source['count'].dtype == 'float64'
+    assert source['kind'].dtype == 'object'
+    assert df['count'].dtype == 'float32'
+    assert pd.api.types.is_datetime64_any_dtype(df['created'])
+    assert df['created'].isnull().sum() == 1
+    assert df['comment'].dtype == 'object'
+
+    with pytest.raises(KeyError):
+        apply_schema(df, 'unknown')
+
+
+def test_load_csv_parses_schema_dates(tmp_path, monkeypatch):
+    monkeypatch.setitem(SCHEMAS, 'events', EVENTS)
+    path = tmp_path / 'events.csv'
+    path.write_text("count,created\n1,2024-01-01\n2,2024-01-02\n", encoding='utf-8')
+
+    # Колонки kind в файле нет: даты разбираются только для колонок из заголовка
+    assert csv_options('events', header=['count', 'created'])['parse_dates'] == ['created']
+    df = load_csv(str(path), schema='events')
+
+    assert pd.api.types.is_datetime64_any_dtype(df['created'])
+    assert df['count'].dtype == 'int32'
+
+
+def test_compact_frame_goes_through_pipeline():
+    df = load_excel(SAMPLE_XLSX, use_cache=False, schema='employees')
+    cleaned = clean_data(df.drop(columns=['name']))
+
+    assert cleaned.isnull().sum().sum() == 0
+    assert cleaned['age'].between(0, 1).all()
+
+    model, metrics = train_regression_model(df[['age', 'experience', 'projects', 'salary']], 'salary')
+    assert np.isfinite(metrics['mse'])
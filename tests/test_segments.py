@@ -0,0 +1,67 @@
+import os
+import pandas as pd
+import openpyxl
+from segments import analyze_segments, add_bands
+from config import SEGMENT_CONFIG
+from data_analysis import generate_report
+
+METRICS = ['age', 'salary', 'experience', 'projects']
+
+
+def segment_frame(make_employees, rows=5000, seed=0):
+    # department - category (коды категорий), region - строки с пропусками
+    df = make_employees(rows, seed=seed, missing=0.1)[METRICS + ['department', 'region']]
+    return df.astype({'department': 'category'})
+
+
+def expected_table(df, columns):
+    banded = add_bands(df, SEGMENT_CONFIG['bands']).astype({col: 'float64' for col in METRICS})
+    expected = banded.groupby(columns, observed=True)[METRICS].agg(['count', 'mean', 'std', 'min', 'max'])
+    expected.columns = [f'{metric}_{stat}' for metric, stat in expected.columns]
+    return expected
+
+
+def test_segments_match_groupby_across_partitions(tmp_path, make_employees):
+    df = segment_frame(make_employees)
+    result = analyze_segments(df, partition_rows=700, directory=str(tmp_path))
+
+    for name, columns in [('department', ['department']), ('region', ['region']),
+                          ('department_tenure', ['department', 'tenure_band'])]:
+        pd.testing.assert_frame_equal(
+            result[name].drop(columns='rows'), expected_table(df, columns),
+            check_dtype=False, check_index_type=False, rtol=1e-9
+        )
+
+    # Интервалы стажа идут в порядке границ, а не по алфавиту
+    assert result['tenure_band'].index.tolist() == ['0-2', '2-5', '5-10', '10-20', '20+']
+    assert result['region']['rows'].sum() == df['region'].notna().sum()
+    # education нет в данных - сегмент пропускается
+    assert 'education' not in result
+
+
+def test_segment_cache_reuses_unchanged_partitions(tmp_path, make_employees):
+    df = segment_frame(make_employees)
+    directory = str(tmp_path)
+    first = analyze_segments(df, partition_rows=1000, directory=directory)
+    assert len(os.listdir(directory)) == 5
+
+    # Дописанные строки пересчитывают только новую часть; устаревшие части удаляются
+    grown = pd.concat([df, segment_frame(make_employees, 500, seed=1)], ignore_index=True)
+    second = analyze_segments(grown, partition_rows=1000, directory=directory)
+    assert len(os.listdir(directory)) == 6
+    assert second['department']['rows'].sum() == grown['department'].notna().sum()
+
+    again = analyze_segments(df, partition_rows=1000, directory=directory)
+    pd.testing.assert_frame_equal(again['department_tenure'], first['department_tenure'])
+    assert len(os.listdir(directory)) == 5
+
+
+def test_generate_report_adds_segment_sheets(tmp_path, make_employees):
+    df = segment_frame(make_employees, 300)
+    path = str(tmp_path / 'report.xlsx')
+    segments = analyze_segments(df, directory=str(tmp_path / 'segments'))
+
+    assert generate_report(df, {'segments': segments}, path=path)
+    sheet_names = openpyxl.load_workbook(path, read_only=True).sheetnames
+    assert 'Сегмент department_tenure' in sheet_names
+    assert 'Сегмент region' in sheet_names
@@ -0,0 +1,64 @@
+# tests/test_sketches.py
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from sketches import KLLSketch, build_sketches, merge_sketches, compare_outlier_methods
+from data_loader import detect_outliers_iqr, validate_data_chunked
+
+
+def rank_error(sorted_values, estimate, q):
+    return abs(np.searchsorted(sorted_values, estimate) - q * len(sorted_values)) / len(sorted_values)
+
+
+@pytest.mark.parametrize('epsilon', [0.05, 0.01])
+def test_merged_sketch_respects_error_bound(epsilon):
+    values = np.random.default_rng(3).lognormal(size=100_000)
+    sketches = [KLLSketch(epsilon, seed=i).update(part) for i, part in enumerate(np.array_split(values, 8))]
+
+    # скетчи процессов передаются через pickle и объединяются
+    merged = pickle.loads(pickle.dumps(sketches[0]))
+    for sketch in sketches[1:]:
+        merged.merge(pickle.loads(pickle.dumps(sketch)))
+
+    sorted_values = np.sort(values)
+    assert merged.count == len(values)
+    assert sum(len(level) for level in merged.levels) < 5 * merged.k
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert rank_error(sorted_values, merged.quantile(q), q) <= epsilon
+    assert merged.quantile(0) == values.min()
+    assert merged.quantile(1) == values.max()
+
+
+def test_merge_requires_same_precision():
+    with pytest.raises(ValueError):
+        KLLSketch(0.01).merge(KLLSketch(0.05))
+
+
+def test_merge_sketches_by_column():
+    df = pd.DataFrame({'a': np.arange(1000.0), 'b': np.arange(1000.0)[::-1]})
+    merged = merge_sketches([build_sketches(df.iloc[:500]), build_sketches(df.iloc[500:])])
+
+    assert merged['a'].count == merged['b'].count == 1000
+    assert abs(merged['a'].quantile(0.5) - 499.5) <= 0.005 * 1000
+
+
+def test_compare_outlier_methods():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({'normal': rng.normal(size=50_000), 'skewed': rng.exponential(size=50_000)})
+
+    comparison = compare_outlier_methods(df, epsilon=0.005, chunksize=5000)
+
+    assert list(comparison.index) == ['normal', 'skewed']
+    assert (comparison['relative_difference'] < 0.005).all()
+    assert (comparison['exact_outliers'] > 0).all()
+
+
+def test_sketch_methods_in_detectors(tmp_path):
+    df = pd.DataFrame({'values': [1, 2, 3, 4, 100] * 20})
+    assert len(detect_outliers_iqr(df, method='sketch')['values']) == 20
+
+    path = tmp_path / 'values.csv'
+    df.to_csv(path, index=False)
+    report = validate_data_chunked(str(path), chunksize=7, quantile_method='sketch')
+    assert report['outliers'] == 1
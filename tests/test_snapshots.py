@@ -0,0 +1,56 @@
+# tests/test_snapshots.py
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from snapshots import save_snapshot, open_snapshot, load_snapshot, read_manifest
+from data_loader import clean_data
+from encoding import sparse_columns
+
+
+def make_cleaned():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'age': rng.random(10_000),
+        'salary': rng.random(10_000),
+        'department_IT': rng.random(10_000) > 0.5
+    })
+
+
+def test_snapshot_roundtrip(tmp_path):
+    df = make_cleaned()
+
+    manifest = save_snapshot(df, 'cleaned', directory=str(tmp_path))
+
+    assert manifest['rows'] == 10_000
+    assert manifest['columns'] == {'age': 'double', 'salary': 'double', 'department_IT': 'bool'}
+    assert read_manifest('cleaned', directory=str(tmp_path)) == manifest
+    pd.testing.assert_frame_equal(load_snapshot('cleaned', directory=str(tmp_path)), df)
+
+
+def test_open_snapshot_reads_selected_columns_without_copy(tmp_path):
+    df = make_cleaned()
+    save_snapshot(df, 'cleaned', directory=str(tmp_path))
+
+    allocated_before = pa.total_allocated_bytes()
+    table = open_snapshot('cleaned', columns=['salary'], directory=str(tmp_path))
+
+    assert table.column_names == ['salary']
+    assert pa.total_allocated_bytes() - allocated_before < df['salary'].nbytes
+    assert np.array_equal(table.column('salary').to_numpy(), df['salary'].to_numpy())
+
+
+def test_missing_snapshot(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_snapshot('absent', directory=str(tmp_path))
+
+
+def test_snapshot_roundtrip_keeps_sparse_columns(tmp_path, make_employees):
+    df = clean_data(make_employees(500))
+    sparse = sparse_columns(df)
+    assert sparse
+
+    manifest = save_snapshot(df, 'cleaned', directory=str(tmp_path))
+
+    assert manifest['rows'] == 500
+    pd.testing.assert_frame_equal(load_snapshot('cleaned', directory=str(tmp_path)), df)